@@ -0,0 +1,43 @@
+"""
+Compara a classificação linha a linha (df.apply) com a versão vetorizada de carga_b3.
+
+Uso: python benchmarks/benchmark_classificacao.py [n_linhas]
+"""
+import sys
+import time
+
+from sintetico import gerar_extrato
+
+from preprocessamento.carga_b3 import (
+    classificar_ativo_b3,
+    classificar_ativos_b3,
+    identificar_tipo,
+    identificar_tipos,
+)
+
+
+def cronometrar(funcao, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def main(n_linhas: int = 200_000):
+    df = gerar_extrato(n_linhas, n_tickers=300)
+    df[['Ticker', 'Descrição']] = df['Produto'].str.split(' - ', n=1, expand=True)
+
+    ativo_apply, t_ativo_apply = cronometrar(df.apply, classificar_ativo_b3, axis=1)
+    ativo_vet, t_ativo_vet = cronometrar(classificar_ativos_b3, df)
+    tipo_apply, t_tipo_apply = cronometrar(df.apply, identificar_tipo, axis=1)
+    tipo_vet, t_tipo_vet = cronometrar(identificar_tipos, df)
+
+    assert ativo_apply.astype(str).equals(ativo_vet.astype(str)), 'Tipo de Ativo divergente'
+    assert tipo_apply.astype(str).equals(tipo_vet.astype(str)), 'Tipo de Investimento divergente'
+
+    print(f'{n_linhas:,} linhas')
+    print(f'Tipo de Ativo        apply: {t_ativo_apply:8.3f}s  vetorizado: {t_ativo_vet:8.3f}s  ({t_ativo_apply / t_ativo_vet:,.0f}x)')
+    print(f'Tipo de Investimento apply: {t_tipo_apply:8.3f}s  vetorizado: {t_tipo_vet:8.3f}s  ({t_tipo_apply / t_tipo_vet:,.0f}x)')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,134 @@
+"""
+Exercita o ClienteStatusInvest contra um servidor HTTP local que imita o StatusInvest (páginas de
+FII sintéticas e a API de segmentos), sem rede:
+
+- compara requests.get avulso (uma conexão nova por página) com o cliente em sequência e em lote
+  (obter_paginas_fii), contando as conexões abertas no servidor;
+- confere as novas tentativas (o servidor responde 429/503 na primeira vez a parte dos tickers) e o
+  timeout de leitura (uma rota que nunca responde a tempo).
+
+Uso: python benchmarks/benchmark_cliente_status_invest.py [n_fiis] [latencia_ms]
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+import sintetico  # noqa: F401 (coloca a pasta src no path)
+
+from mercado import ProvedorLocal
+from mercado.cliente_status_invest import HEADERS, ClienteStatusInvest
+
+
+class ServidorStatusInvest(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latencia: float, falhas: dict[str, int]):
+        super().__init__(('127.0.0.1', 0), ManipuladorStatusInvest)
+        self.latencia = latencia
+        self.falhas = dict(falhas)  # caminho → status a devolver na primeira requisição
+        self.provedor = ProvedorLocal(semente=42)
+        self.conexoes = 0
+        self.requisicoes = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+
+class ManipuladorStatusInvest(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # mantém a conexão aberta entre requisições
+    disable_nagle_algorithm = True  # senão cabeçalho e corpo em escritas separadas esperam o ACK atrasado (~40 ms)
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.conexoes += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _responder(self, status: int, corpo: bytes, tipo: str = 'text/html; charset=utf-8'):
+        self.send_response(status)
+        self.send_header('Content-Type', tipo)
+        self.send_header('Content-Length', str(len(corpo)))
+        if status == 429:
+            self.send_header('Retry-After', '0')
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def do_GET(self):
+        caminho = self.path.split('?')[0]
+        with self.server.lock:
+            self.server.requisicoes += 1
+            falha = self.server.falhas.pop(caminho, None)
+
+        if caminho == '/lento':
+            time.sleep(1.0)
+        time.sleep(self.server.latencia)
+
+        if falha is not None:
+            self._responder(falha, b'tente novamente')
+        elif caminho.startswith('/fundos-imobiliarios/'):
+            ticker = caminho.rsplit('/', 1)[-1].upper()
+            self._responder(200, self.server.provedor.obter_pagina_fii(ticker).encode('utf-8'))
+        elif caminho == '/sector/getcompanies':
+            dados = self.server.provedor.listar_fiis_segmento(1).to_dict(orient='records')
+            self._responder(200, json.dumps({'success': True, 'data': dados}).encode('utf-8'), 'application/json')
+        else:
+            self._responder(200, b'ok')
+
+
+def medir(servidor: ServidorStatusInvest, funcao) -> tuple[float, int, object]:
+    conexoes = servidor.conexoes
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, servidor.conexoes - conexoes, resultado
+
+
+def main(n_fiis: int = 30, latencia_ms: int = 20):
+    tickers = [f'FII{i:03d}11' for i in range(n_fiis)]
+    falhas = {f'/fundos-imobiliarios/{ticker.lower()}': status for ticker, status in zip(tickers[::5], [429, 503] * n_fiis)}
+    servidor = ServidorStatusInvest(latencia_ms / 1000, falhas)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+
+    try:
+        # As primeiras requisições respondem com as falhas: as novas tentativas do cliente as superam
+        cliente = ClienteStatusInvest(servidor.url, espera_base=0.01)
+        duracao, conexoes, paginas = medir(servidor, lambda: cliente.obter_paginas_fii(tickers))
+        assert all(paginas[ticker] for ticker in tickers), 'página faltando'
+        assert not servidor.falhas, servidor.falhas
+        resultados = [('cliente em lote (com 429/503)', duracao, conexoes)]
+
+        resultados.append(('requests.get avulso',) + medir(servidor, lambda: [
+            requests.get(f'{servidor.url}/fundos-imobiliarios/{ticker.lower()}', headers=HEADERS).text for ticker in tickers
+        ])[:2])
+        resultados.append(('cliente em sequência',) + medir(servidor, lambda: [cliente.obter_pagina_fii(ticker) for ticker in tickers])[:2])
+        resultados.append(('cliente em lote',) + medir(servidor, lambda: cliente.obter_paginas_fii(tickers))[:2])
+
+        segmento = cliente.listar_fiis_segmento(1)
+        assert not segmento.empty and 'ticker' in segmento.columns
+
+        # Timeout de leitura: a rota lenta nunca responde dentro do prazo, mesmo repetindo
+        cliente_impaciente = ClienteStatusInvest(servidor.url, timeout=(1.0, 0.2), tentativas=2, espera_base=0.01)
+        inicio = time.perf_counter()
+        try:
+            cliente_impaciente.get('/lento')
+            raise AssertionError('a rota lenta deveria estourar o timeout')
+        except requests.Timeout:
+            duracao_timeout = time.perf_counter() - inicio
+    finally:
+        servidor.shutdown()
+
+    print(f'{n_fiis} páginas de FII, {latencia_ms} ms de latência no servidor local')
+    for nome, duracao, conexoes in resultados:
+        print(f'{nome:>32}: {duracao:7.3f}s  {conexoes:3d} conexões')
+    print(f'{"timeout (2 tentativas de 0,2s)":>32}: {duracao_timeout:7.3f}s')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,67 @@
+"""
+Compara a coleta dos FIIs em sequência (um coletor) e em paralelo (pool com limite por servidor),
+sem rede: o provedor local de mercado com uma latência fixa em cada chamada, simulando o Yahoo e o
+StatusInvest. Confere que os resultados são os mesmos e voltam na ordem dos tickers.
+
+Uso: python benchmarks/benchmark_coleta_fii.py [n_fiis] [latencia_ms]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import sintetico  # noqa: F401 (coloca a pasta src no path)
+
+from mercado import ProvedorLocal, definir_provedor, obter_dados_fiis
+from mercado.coleta import HOST_STATUS_INVEST, HOST_YAHOO, limitar_host
+
+
+class ProvedorComLatencia(ProvedorLocal):
+    """Provedor local que espera `latencia` segundos em cada chamada, ocupando a vaga do servidor que simula."""
+
+    def __init__(self, latencia: float, **parametros):
+        super().__init__(**parametros)
+        self.latencia = latencia
+
+    def _esperar(self, host: str):
+        with limitar_host(host):
+            time.sleep(self.latencia)
+
+    def baixar_series(self, tickers, campos, inicio=None, fim=None, periodo=None):
+        self._esperar(HOST_YAHOO)
+        return super().baixar_series(tickers, campos, inicio=inicio, fim=fim, periodo=periodo)
+
+    def obter_info(self, ticker):
+        self._esperar(HOST_YAHOO)
+        return super().obter_info(ticker)
+
+    def obter_pagina_fii(self, ticker):
+        self._esperar(HOST_STATUS_INVEST)
+        return super().obter_pagina_fii(ticker)
+
+
+def main(n_fiis: int = 30, latencia_ms: int = 200):
+    definir_provedor(ProvedorComLatencia(latencia_ms / 1000, semente=42))
+    tickers = [f'FII{i:03d}11' for i in range(n_fiis)]
+
+    resultados = {}
+    for nome, max_coletores in [('sequencial', 1), ('paralelo', 8)]:
+        # Histórico em disco vazio nas duas rodadas, para cada uma baixar tudo
+        with tempfile.TemporaryDirectory() as dir_cache:
+            os.environ['DIR_CACHE'] = dir_cache
+            inicio = time.perf_counter()
+            dados = obter_dados_fiis(tickers, max_coletores=max_coletores)
+            resultados[nome] = (time.perf_counter() - inicio, dados)
+
+    sequencial, paralelo = resultados['sequencial'], resultados['paralelo']
+    for ticker, a, b in zip(tickers, sequencial[1], paralelo[1]):
+        assert a['fundamentos'] == b['fundamentos'] and b['fundamentos']['ticker'] == ticker, ticker
+
+    print(f'{n_fiis} FIIs, {latencia_ms} ms por chamada ao provedor')
+    for nome, (duracao, _) in resultados.items():
+        print(f'{nome:>10}: {duracao:8.3f}s')
+    print(f'ganho: {sequencial[0] / paralelo[0]:.1f}x')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,45 @@
+"""
+Confere utils.formatar_moeda_br contra a formatação célula a célula (apply com f-string e três
+replaces), inclusive valores fora do intervalo de int64, e compara os tempos.
+
+Uso: python benchmarks/benchmark_formatacao.py [n_linhas]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import sintetico  # noqa: F401 (coloca src no path)
+
+from utils import formatar_moeda_br
+
+
+def formatar_legado(x: float) -> str:
+    return f"R$ {x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+def main(n_linhas: int = 1_000_000):
+    rng = np.random.default_rng(42)
+    valores = pd.Series(np.round(rng.lognormal(8, 3, n_linhas) * rng.choice([-1, 1], n_linhas), 2))
+
+    inicio = time.perf_counter()
+    legado = valores.apply(formatar_legado)
+    t_apply = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    vetorizado = formatar_moeda_br(valores)
+    t_vetorizado = time.perf_counter() - inicio
+
+    # Única diferença intencional: valores que arredondam para zero não recebem sinal ('R$ -0,00')
+    legado = legado.replace('R$ -0,00', 'R$ 0,00')
+    assert (legado.to_numpy() == vetorizado.to_numpy()).all(), 'Formatação divergente'
+
+    assert formatar_moeda_br(pd.Series([1e17, -1e20])).tolist() == ['R$ 100.000.000.000.000.000,00', 'R$ -100.000.000.000.000.000.000,00']
+
+    print(f'{n_linhas:,} valores')
+    print(f'apply por célula: {t_apply:8.3f}s  formatar_moeda_br: {t_vetorizado:8.3f}s  ({t_apply / t_vetorizado:,.1f}x)')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,44 @@
+"""
+Compara o lucro realizado por venda calculado operação a operação (LivroPosicoes) com a passada
+vetorizada de carteira.calcular_vendas_realizadas, e mede a apuração mensal do IR.
+
+Uso: python benchmarks/benchmark_impostos.py [n_linhas] [n_tickers]
+"""
+import sys
+import time
+
+import numpy as np
+
+from sintetico import gerar_extrato
+
+from carteira import LivroPosicoes, calcular_vendas_realizadas, calcular_apuracao_ir
+from preprocessamento.carga_b3 import processar_movimentacoes
+
+
+def main(n_linhas: int = 200_000, n_tickers: int = 100):
+    df = processar_movimentacoes(gerar_extrato(n_linhas, n_tickers=n_tickers))
+
+    inicio = time.perf_counter()
+    livro = LivroPosicoes()
+    livro.atualizar(df)
+    t_livro = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    vendas = calcular_vendas_realizadas(df)
+    t_vendas = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    apuracao = calcular_apuracao_ir(vendas)
+    t_apuracao = time.perf_counter() - inicio
+
+    esperado = livro.posicoes_df()['lucro_realizado']
+    obtido = vendas.groupby('Ticker')['Lucro/Prejuízo'].sum().reindex(esperado.index, fill_value=0.0)
+    assert np.allclose(obtido, esperado, rtol=1e-9, atol=1e-6)
+
+    print(f'{n_linhas:,} movimentações, {len(vendas):,} vendas, {len(apuracao):,} meses apurados')
+    print(f'operação a operação: {t_livro:8.3f}s  vetorizado: {t_vendas:8.3f}s  ({t_livro / t_vendas:,.1f}x)')
+    print(f'apuração mensal do IR: {t_apuracao:8.3f}s')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
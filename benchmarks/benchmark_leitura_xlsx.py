@@ -0,0 +1,71 @@
+"""
+Mede linhas/s e pico de memória (RSS) da leitura do extrato nos modos disponíveis de carregar_movimentacoes.
+Cada modo roda em um processo separado, para que o pico de memória de um não contamine o outro.
+
+Uso: python benchmarks/benchmark_leitura_xlsx.py [n_linhas]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from sintetico import gerar_extrato
+
+
+def gerar_planilha(path: str, n_linhas: int):
+    from openpyxl import Workbook
+
+    df = gerar_extrato(n_linhas)
+    workbook = Workbook(write_only=True)
+    aba = workbook.create_sheet()
+    aba.append(list(df.columns))
+    for linha in df.itertuples(index=False):
+        aba.append(list(linha))
+    workbook.save(path)
+
+
+def medir(path: str, modo: str):
+    from preprocessamento.carga_b3 import carregar_movimentacoes, processar_movimentacoes
+
+    # Os imports (pandas, streamlit...) já ocupam boa parte do RSS, então reporta também o acréscimo da leitura
+    base_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    inicio = time.perf_counter()
+    if modo == 'streaming':
+        df = carregar_movimentacoes(path, streaming=True)
+    elif modo == 'calamine':
+        import pandas as pd
+        df = processar_movimentacoes(pd.read_excel(path, dtype=str, engine='calamine'))
+    else:
+        df = carregar_movimentacoes(path)
+    duracao = time.perf_counter() - inicio
+
+    pico_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f'{modo:<10} {len(df):>10,} linhas  {len(df) / duracao:>10,.0f} linhas/s  '
+          f'pico RSS: {pico_mb:,.0f} MB (+{pico_mb - base_mb:,.0f} MB na leitura)')
+
+
+def main(n_linhas: int = 200_000):
+    with tempfile.TemporaryDirectory() as dir_tmp:
+        path = os.path.join(dir_tmp, 'extrato.xlsx')
+        gerar_planilha(path, n_linhas)
+        print(f'Planilha sintética: {os.path.getsize(path) / 1024 / 1024:,.1f} MB')
+
+        modos = ['completo', 'streaming']
+        try:
+            import python_calamine  # noqa: F401
+            modos.append('calamine')
+        except ImportError:
+            print('python-calamine não instalado, modo calamine ignorado')
+
+        for modo in modos:
+            subprocess.run([sys.executable, __file__, '--medir', path, modo], check=True)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--medir':
+        medir(sys.argv[2], sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
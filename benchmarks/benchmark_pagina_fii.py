@@ -0,0 +1,98 @@
+"""
+Compara a leitura da página do FII: a forma anterior (BeautifulSoup com html.parser e uma busca
+pelo documento inteiro por indicador) e indexar_pagina_fii (uma única passada, com lxml ou com o
+HTMLParser da biblioteca padrão). As páginas são as sintéticas do provedor local, envoltas em
+conteúdo de preenchimento para chegar ao tamanho de uma página real (centenas de KB). Confere que
+os três caminhos extraem os mesmos valores, também em rótulos aninhados (o .string do BeautifulSoup
+desce por um único elemento filho).
+
+Uso: python benchmarks/benchmark_pagina_fii.py [n_paginas] [kb_preenchimento]
+"""
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+import sintetico  # noqa: F401 (coloca a pasta src no path)
+
+from mercado import ProvedorLocal, extrair_fundamentos_fii, indexar_pagina_fii, obter_tempos_parser
+from mercado.pagina_fii import CAMPOS_PAGINA_FII, CONVERSORES_PAGINA_FII, _lxml_disponivel
+
+BLOCO_PREENCHIMENTO = (
+    '<div class="card"><h3 class="title">Rendimento {i}</h3>'
+    '<span class="sub-title">Data com {i}</span><strong class="value">{i},00</strong>'
+    '<a href="/fundos-imobiliarios/x{i}"><span>Ver mais</span></a>'
+    '<script>var x{i} = "{i}";</script></div>\n'
+)
+
+# Rótulos aninhados: (página, patrimonio_total esperado)
+CASOS_ROTULO = [
+    ('<span><b>Patrimônio</b></span><strong class="value">R$ 1.000,00</strong>', 1000.0),
+    ('<span><b><i>Patrimônio</i></b></span><br><strong class="value">R$ 2.000,00</strong>', 2000.0),
+    ('<span> <b>Patrimônio</b></span><strong class="value">R$ 3.000,00</strong>'
+     '<span>Patrimônio</span><strong class="value">R$ 4,00</strong>', 4.0),
+    ('<span><b>Patri</b><i>mônio</i></span><strong class="value">R$ 5,00</strong>', None),
+]
+
+
+def montar_pagina(modelo: str, kb: int) -> str:
+    """Página sintética com preenchimento antes e depois dos indicadores, como o menu e as tabelas da real."""
+    n = kb * 1024 // (2 * len(BLOCO_PREENCHIMENTO.format(i=0)))
+    preenchimento = ''.join(BLOCO_PREENCHIMENTO.format(i=i) for i in range(n))
+    corpo = modelo.split('<main>', 1)[1].rsplit('</main>', 1)[0]
+    return f'<html><head><title>FII</title></head><body><nav>{preenchimento}</nav><main>{corpo}</main><footer>{preenchimento}</footer></body></html>'
+
+
+def extrair_bs4(html: str) -> dict:
+    """Forma anterior: árvore completa do html.parser e uma busca pelo documento a cada indicador."""
+    soup = BeautifulSoup(html, 'html.parser')
+    fundamentos = {}
+    for campo, (tag, texto, exato, classe_valor) in CAMPOS_PAGINA_FII.items():
+        try:
+            if tag == 'div':
+                div = soup.find('div', title=lambda t: t and texto in t)
+                valor = div.find('strong', class_='value').text.strip() if div else None
+            else:
+                rotulo = soup.find(tag, string=texto if exato else (lambda s: s and texto in s))
+                valor = rotulo.find_next(classe_valor, class_='value').text.strip()
+            fundamentos[campo] = CONVERSORES_PAGINA_FII[campo](valor) if valor is not None else None
+        except Exception:
+            fundamentos[campo] = None
+    return fundamentos
+
+
+def medir(funcao, paginas: list[str]) -> tuple[float, list[dict]]:
+    inicio = time.perf_counter()
+    resultados = [funcao(pagina) for pagina in paginas]
+    return time.perf_counter() - inicio, resultados
+
+
+def main(n_paginas: int = 20, kb_preenchimento: int = 400):
+    provedor = ProvedorLocal(semente=42)
+    paginas = [montar_pagina(provedor.obter_pagina_fii(f'FII{i:03d}11'), kb_preenchimento) for i in range(n_paginas)]
+
+    caminhos = [('BeautifulSoup (anterior)', extrair_bs4)]
+    if _lxml_disponivel():
+        caminhos.append(('uma passada, lxml', lambda html: extrair_fundamentos_fii(indexar_pagina_fii(html, 'lxml'))))
+    caminhos.append(('uma passada, html.parser', lambda html: extrair_fundamentos_fii(indexar_pagina_fii(html, 'html.parser'))))
+
+    resultados = [(nome,) + medir(funcao, paginas) for nome, funcao in caminhos]
+    referencia = resultados[0][2]
+    for nome, _, extraidos in resultados[1:]:
+        assert extraidos == referencia, nome
+    assert all(valor is not None for fundamentos in referencia for valor in fundamentos.values())
+
+    for pagina, esperado in CASOS_ROTULO:
+        for nome, funcao in caminhos:
+            assert funcao(pagina)['patrimonio_total'] == esperado, (nome, pagina)
+
+    print(f'{n_paginas} páginas de {len(paginas[0]) / 1024:,.0f} KB, {len(CAMPOS_PAGINA_FII)} indicadores cada')
+    base = resultados[0][1]
+    for nome, duracao, _ in resultados:
+        print(f'{nome:>26}: {1000 * duracao / n_paginas:8.2f} ms/página  ({base / duracao:5.1f}x)')
+    tempos = obter_tempos_parser()
+    print(f'obter_tempos_parser: {tempos["paginas"]} páginas, média {tempos["media_ms"]:.2f} ms')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,63 @@
+"""
+Mede carteira.calcular_patrimonio_diario em ~10 anos de extrato com 100 tickers e confere o
+resultado, em algumas datas sorteadas, contra o cálculo direto da posição naquele dia.
+Os fechamentos são um passeio aleatório sintético (sem rede).
+
+Uso: python benchmarks/benchmark_patrimonio.py [n_linhas] [n_tickers]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from sintetico import gerar_extrato
+
+from carteira import calcular_patrimonio_diario
+from preprocessamento.carga_b3 import processar_movimentacoes
+
+
+def gerar_fechamentos(tickers: list[str], inicio, fim, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    datas = pd.date_range(inicio, fim, freq='B', name='Data')
+    retornos = rng.normal(0, 0.015, (len(datas), len(tickers)))
+    return pd.DataFrame(50 * np.exp(np.cumsum(retornos, axis=0)), index=datas, columns=tickers)
+
+
+def patrimonio_no_dia(df: pd.DataFrame, precos: pd.DataFrame, dia: pd.Timestamp) -> float:
+    """
+    Cálculo direto, só para conferência: posição de cada ticker até `dia` × último fechamento. A
+    posição percorre o saldo de cada dia em ordem, e uma venda acima da posição só a zera (como no livro).
+    """
+    ate_dia = df[df['Compra/Venda'] & (df['Data'] <= dia)]
+    sinal = np.where(ate_dia['Entrada/Saída'] == 'Debito', -1.0, 1.0)
+    por_dia = (ate_dia['Quantidade'] * sinal).groupby([ate_dia['Ticker'].astype(str), ate_dia['Data'].dt.normalize()]).sum()
+
+    quantidades = {}
+    for (ticker, _), movimento in por_dia.items():
+        quantidades[ticker] = max(quantidades.get(ticker, 0.0) + movimento, 0.0)
+    quantidades = pd.Series(quantidades, dtype='float64')
+    ultimo_preco = precos.loc[:dia].ffill().iloc[-1]
+    return float((quantidades * ultimo_preco.reindex(quantidades.index)).sum())
+
+
+def main(n_linhas: int = 50_000, n_tickers: int = 100):
+    df = processar_movimentacoes(gerar_extrato(n_linhas, n_tickers=n_tickers))
+    tickers = sorted(df['Ticker'].astype(str).unique())
+    precos = gerar_fechamentos(tickers, df['Data'].min() - pd.Timedelta(days=5), '2025-12-31')
+
+    inicio = time.perf_counter()
+    patrimonio = calcular_patrimonio_diario(df, precos, fim='2025-12-31')
+    t_vetorizado = time.perf_counter() - inicio
+
+    rng = np.random.default_rng(0)
+    for dia in rng.choice(patrimonio.index, 20, replace=False):
+        esperado = patrimonio_no_dia(df, precos, pd.Timestamp(dia))
+        assert np.isclose(patrimonio.loc[dia, 'Patrimônio'], esperado), (dia, esperado)
+
+    print(f'{n_linhas:,} movimentações, {len(tickers)} tickers, {len(patrimonio):,} dias')
+    print(f'patrimônio diário (vetorizado): {t_vetorizado:8.3f}s')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,48 @@
+"""
+Executa a coleta de dados dos FIIs do pipeline (histórico, proventos, página de indicadores,
+pontuação) sem rede, com o provedor local de mercado, e mede a vazão com o histórico em disco
+vazio (frio) e já preenchido (quente). Os dados são sintéticos e iguais em toda execução.
+
+Uso: python benchmarks/benchmark_pipeline_fii.py [n_segmentos]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import sintetico  # noqa: F401 (coloca a pasta src no path)
+
+from avaliacao import PESOS_PADRAO
+from mercado import ProvedorLocal, definir_provedor, obter_fiis_por_categoria_segmento
+from pynvest.pipeline import coletar_dados_fiis
+
+
+def main(n_segmentos: int = 3):
+    definir_provedor(ProvedorLocal(semente=42))
+    tickers = sorted({
+        ticker
+        for segmento_id in range(1, n_segmentos + 1)
+        for ticker in obter_fiis_por_categoria_segmento(segmento_id)['ticker']
+    })
+
+    with tempfile.TemporaryDirectory() as dir_cache:
+        os.environ['DIR_CACHE'] = dir_cache
+
+        resultados = []
+        for rodada in ['frio', 'quente']:
+            inicio = time.perf_counter()
+            fundamentos, precos, pontuacao = coletar_dados_fiis(tickers, PESOS_PADRAO)
+            duracao = time.perf_counter() - inicio
+            resultados.append((rodada, duracao))
+
+            assert len(fundamentos) == len(tickers), (len(fundamentos), len(tickers))
+            assert not precos.empty and not pontuacao.empty
+
+    print(f'{len(tickers)} FIIs, {len(precos):,} pregões no histórico')
+    for rodada, duracao in resultados:
+        print(f'{rodada:>6}: {duracao:8.3f}s  ({len(tickers) / duracao:,.1f} FIIs/s)')
+    print(pontuacao.head(5).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
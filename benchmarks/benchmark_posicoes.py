@@ -0,0 +1,125 @@
+"""
+Compara o cálculo de posições por ticker em loop (implementação anterior, O(tickers × linhas))
+com o groupby de carteira.calcular_resumo_investimentos (sem livro), e mede o livro de posições
+montado do zero contra a atualização só com as movimentações novas. As cotações são substituídas
+por um preço fixo por ticker, para medir apenas o cálculo das posições, sem rede.
+
+Uso: python benchmarks/benchmark_posicoes.py [n_linhas] [n_tickers]
+"""
+import os
+import sys
+import tempfile
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from sintetico import gerar_extrato
+
+import carteira
+import carteira.posicoes
+from preprocessamento.carga_b3 import processar_movimentacoes
+
+
+def preco_ficticio(ticker: str) -> float:
+    return 10 + zlib.crc32(ticker.encode()) % 9000 / 100
+
+
+def calcular_resumo_legado(df: pd.DataFrame, obter_preco):
+    """Implementação anterior, um filtro booleano sobre a base inteira por ticker."""
+    total_investido_geral = 0
+    total_valor_mercado = 0
+    resumo = []
+
+    for ticker in df["Ticker"].unique():
+        df_ticker = df[df["Ticker"] == ticker]
+
+        compras = df_ticker[df_ticker["Entrada/Saída"] == "Credito"]
+        vendas = df_ticker[df_ticker["Entrada/Saída"] == "Debito"]
+
+        qtd_comprada = compras["Quantidade"].sum()
+        qtd_vendida = vendas["Quantidade"].sum()
+        qtd_liquida = qtd_comprada - qtd_vendida
+
+        if qtd_liquida <= 0:
+            continue
+
+        total_investido = compras["Valor da Operação"].sum() - vendas["Valor da Operação"].sum()
+        preco_medio = (
+            (compras["Quantidade"] * compras["Preço unitário"]).sum() / qtd_comprada
+            if qtd_comprada > 0 else 0
+        )
+
+        preco_atual = obter_preco(ticker)
+        valor_mercado = preco_atual * qtd_liquida
+        lucro_prejuizo = valor_mercado - total_investido
+
+        total_investido_geral += total_investido
+        total_valor_mercado += valor_mercado
+
+        resumo.append({
+            "Ticker": ticker,
+            "Quantidade Atual": qtd_liquida,
+            "Preço Médio": round(preco_medio, 2),
+            "Preço Atual": round(preco_atual, 2),
+            "Total Investido": round(total_investido, 2),
+            "Valor de Mercado": round(valor_mercado, 2),
+            "Lucro/Prejuízo": round(lucro_prejuizo, 2),
+        })
+
+    df_consolidacao = pd.DataFrame(resumo).sort_values(by=['Ticker'], ascending=True)
+    return df_consolidacao, total_investido_geral, total_valor_mercado
+
+
+def main(n_linhas: int = 200_000, n_tickers: int = 500):
+    df = processar_movimentacoes(gerar_extrato(n_linhas, n_tickers=n_tickers))
+
+    carteira.posicoes.obter_ultimos_precos = lambda tickers: pd.Series(
+        {ticker: preco_ficticio(ticker) for ticker in tickers}, dtype='float64'
+    )
+
+    inicio = time.perf_counter()
+    legado, investido_legado, mercado_legado = calcular_resumo_legado(df, preco_ficticio)
+    t_legado = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    resumo = carteira.calcular_resumo_investimentos(df)
+    t_groupby = time.perf_counter() - inicio
+
+    novo = resumo['consolidacao']
+    assert list(novo['Ticker']) == list(legado['Ticker']), 'Tickers divergentes'
+    for col in novo.columns.drop('Ticker'):
+        np.testing.assert_allclose(novo[col].to_numpy(), legado[col].to_numpy(), rtol=1e-9, atol=0.011, err_msg=col)
+    assert np.isclose(resumo['total_investido_geral'], investido_legado)
+    assert np.isclose(resumo['total_valor_mercado'], mercado_legado)
+
+    print(f'{n_linhas:,} movimentações, {df["Ticker"].nunique()} tickers, {len(novo)} posições em aberto')
+    print(f'loop por ticker: {t_legado:8.3f}s  groupby: {t_groupby:8.3f}s  ({t_legado / t_groupby:,.0f}x)')
+
+    # Livro de posições: montagem do zero x atualização com ~5% de movimentações novas, persistido em disco
+    operacoes = df[df['Compra/Venda']]
+    anteriores = operacoes[operacoes['Data'] <= operacoes['Data'].quantile(0.95)]
+
+    with tempfile.TemporaryDirectory() as dir_cache:
+        os.environ['DIR_CACHE'] = dir_cache
+
+        inicio = time.perf_counter()
+        carteira.atualizar_livro_posicoes(operacoes, 'benchmark_completo')
+        t_completo = time.perf_counter() - inicio
+
+        carteira.atualizar_livro_posicoes(anteriores, 'benchmark')
+        inicio = time.perf_counter()
+        livro = carteira.atualizar_livro_posicoes(operacoes, 'benchmark')
+        t_delta = time.perf_counter() - inicio
+
+    completo = carteira.LivroPosicoes()
+    completo.atualizar(operacoes)
+    pd.testing.assert_frame_equal(livro.posicoes_df().sort_index(), completo.posicoes_df().sort_index())
+
+    print(f'livro de posições: do zero {t_completo:8.3f}s  '
+          f'delta de {len(operacoes) - len(anteriores):,} operações: {t_delta:8.3f}s')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
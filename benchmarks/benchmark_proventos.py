@@ -0,0 +1,69 @@
+"""
+Compara o cruzamento de proventos com a posição na data ex feito evento a evento (filtro da base
+inteira por ticker e data) com o merge_asof de carteira.calcular_proventos_recebidos.
+Os proventos são sintéticos: um por mês para cada ticker (sem rede).
+
+Uso: python benchmarks/benchmark_proventos.py [n_linhas] [n_tickers]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from sintetico import gerar_extrato
+
+from carteira import calcular_proventos_recebidos
+from preprocessamento.carga_b3 import processar_movimentacoes
+
+
+def gerar_dividendos(tickers: list[str], inicio, fim, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    datas = pd.date_range(inicio, fim, freq='MS') + pd.Timedelta(days=14)
+    grade = pd.MultiIndex.from_product([tickers, datas], names=['Ticker', 'Data']).to_frame(index=False)
+    grade['Valor'] = np.round(rng.uniform(0.05, 1.5, len(grade)), 2)
+    return grade
+
+
+def proventos_legado(df: pd.DataFrame, dividendos: pd.DataFrame) -> float:
+    """Um filtro sobre a base inteira para cada provento, somando as operações uma a uma como o LivroPosicoes."""
+    operacoes = df[df['Compra/Venda']]
+    venda = (operacoes['Entrada/Saída'] == 'Debito').to_numpy()
+    operacoes = operacoes.assign(venda=venda, quantidade=np.where(venda, -1.0, 1.0) * operacoes['Quantidade'])
+    operacoes = operacoes.sort_values(['Data', 'venda'], kind='stable')
+    tickers = operacoes['Ticker'].astype(str)
+
+    total = 0.0
+    for evento in dividendos.itertuples(index=False):
+        filtro = (tickers == evento.Ticker) & (operacoes['Data'] < evento.Data)
+        quantidade = 0.0
+        for movimento in operacoes.loc[filtro, 'quantidade']:
+            quantidade = max(quantidade + movimento, 0.0)  # venda acima da posição só a zera
+        total += quantidade * evento.Valor
+    return total
+
+
+def main(n_linhas: int = 50_000, n_tickers: int = 100):
+    df = processar_movimentacoes(gerar_extrato(n_linhas, n_tickers=n_tickers))
+    tickers = sorted(df['Ticker'].astype(str).unique())
+    dividendos = gerar_dividendos(tickers, df['Data'].min(), '2025-12-31')
+
+    inicio = time.perf_counter()
+    recebidos = calcular_proventos_recebidos(df, dividendos)
+    t_asof = time.perf_counter() - inicio
+
+    amostra = dividendos.sample(500, random_state=0)
+    inicio = time.perf_counter()
+    total_legado = proventos_legado(df, amostra)
+    t_legado = (time.perf_counter() - inicio) * len(dividendos) / len(amostra)
+
+    chaves = ['Ticker', 'Data']
+    total_amostra = recebidos.merge(amostra[chaves], on=chaves)['Valor Recebido'].sum()
+    assert np.isclose(total_amostra, total_legado), (total_amostra, total_legado)
+
+    print(f'{n_linhas:,} movimentações, {len(tickers)} tickers, {len(dividendos):,} proventos')
+    print(f'evento a evento (estimado): {t_legado:8.3f}s  merge_asof: {t_asof:8.3f}s  ({t_legado / t_asof:,.0f}x)')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,71 @@
+"""
+Compara a XIRR resolvida ativo a ativo (uma chamada do solver por ticker) com a resolução
+simultânea de carteira.calcular_xirr, e mede carteira.calcular_rentabilidade (XIRR + TWR de todos
+os ativos e da carteira). Os fechamentos são um passeio aleatório sintético (sem rede).
+
+Uso: python benchmarks/benchmark_rentabilidade.py [n_linhas] [n_tickers]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from sintetico import gerar_extrato
+from benchmark_patrimonio import gerar_fechamentos
+
+from carteira import calcular_rentabilidade
+from carteira.livro import acumular_posicao
+from carteira.patrimonio import _operacoes_com_sinal
+from carteira.rentabilidade import DIAS_ANO, calcular_twr, calcular_xirr
+from preprocessamento.carga_b3 import processar_movimentacoes
+
+
+def main(n_linhas: int = 50_000, n_tickers: int = 300):
+    df = processar_movimentacoes(gerar_extrato(n_linhas, n_tickers=n_tickers))
+    tickers = sorted(df['Ticker'].astype(str).unique())
+    precos = gerar_fechamentos(tickers, df['Data'].min() - pd.Timedelta(days=5), '2025-12-31')
+
+    # Fluxos de cada ticker: operações com o sinal do investidor e o valor final da posição
+    operacoes = _operacoes_com_sinal(df)
+    em_ordem = operacoes.sort_values(['Data', 'Quantidade'], ascending=[True, False], kind='stable')  # compras antes das vendas no dia
+    posicao_final = acumular_posicao(em_ordem['Quantidade'], em_ordem['Ticker']).groupby(em_ordem['Ticker']).last()
+    final = (posicao_final * precos.iloc[-1]).dropna()
+    fluxos = pd.concat([
+        operacoes.assign(Valor=-operacoes['Valor'])[['Ticker', 'Data', 'Valor']],
+        pd.DataFrame({'Ticker': final.index, 'Data': precos.index[-1], 'Valor': final.to_numpy()}),
+    ], ignore_index=True)
+    fluxos['Grupo'] = pd.Index(tickers).get_indexer(fluxos['Ticker'])
+    anos = ((fluxos['Data'] - fluxos.groupby('Grupo')['Data'].transform('min')).dt.days / DIAS_ANO).to_numpy()
+
+    inicio = time.perf_counter()
+    por_ativo = []
+    for grupo in range(len(tickers)):
+        filtro = (fluxos['Grupo'] == grupo).to_numpy()
+        por_ativo.append(calcular_xirr(np.zeros(filtro.sum(), dtype='int64'), anos[filtro], fluxos['Valor'].to_numpy()[filtro])[0])
+    t_laco = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    simultanea = calcular_xirr(fluxos['Grupo'].to_numpy(), anos, fluxos['Valor'].to_numpy(), len(tickers))
+    t_vetorizado = time.perf_counter() - inicio
+
+    assert np.allclose(simultanea, por_ativo, equal_nan=True, rtol=1e-6)
+
+    inicio = time.perf_counter()
+    rentabilidade = calcular_rentabilidade(df, precos, fim='2025-12-31')
+    t_completo = time.perf_counter() - inicio
+    assert rentabilidade['twr'] > -1 and (rentabilidade['por_ativo']['TWR'] > -1).all(), rentabilidade['twr']
+
+    # Posição aberta que passa a valer zero é perda total (-100%); os dias antes da compra são neutros
+    valores = np.array([[100.0, 0.0], [50.0, 0.0], [0.0, 100.0], [0.0, 110.0]])
+    compras = np.array([[100.0, 0.0], [0.0, 0.0], [0.0, 100.0], [0.0, 0.0]])
+    assert np.allclose(calcular_twr(valores, compras, np.zeros_like(valores)), [-1.0, 0.1])
+
+    print(f'{n_linhas:,} movimentações, {len(tickers)} tickers, {len(fluxos):,} fluxos')
+    print(f'XIRR ativo a ativo: {t_laco:8.3f}s  simultânea: {t_vetorizado:8.3f}s  ({t_laco / t_vetorizado:,.1f}x)')
+    print(f'XIRR + TWR de todos os ativos e da carteira: {t_completo:8.3f}s '
+          f'(XIRR carteira {rentabilidade["xirr"]:.2%}, TWR carteira {rentabilidade["twr"]:.2%})')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,89 @@
+"""
+Geração de extratos sintéticos no formato da planilha de movimentações da B3,
+usados pelos scripts de benchmark desta pasta.
+"""
+import pathlib
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Os scripts de benchmark são executados a partir da raiz do projeto (python benchmarks/<script>.py),
+# então a pasta src precisa estar no path para importar os módulos da aplicação.
+DIR_SRC = pathlib.Path(__file__).resolve().parent.parent / 'src'
+if str(DIR_SRC) not in sys.path:
+    sys.path.insert(0, str(DIR_SRC))
+
+PRODUTOS = [
+    'MXRF11 - MAXI RENDA FDO INV IMOB - FII',
+    'VISC11 - VINCI SHOPPING CENTERS FDO INVEST IMOB - FII',
+    'BTHF11 - BTG PACTUAL REAL ESTATE HEDGE FUND FII - RESP LTDA',
+    'HGLG11 - CSHG LOGÍSTICA FUNDO DE INVESTIMENTO IMOBILIÁRIO',
+    'BOVA11 - ISHARES BOVA ETF ÍNDICE',
+    'TAEE11 - TAESA UNITS',
+    'ITSA4 - ITAUSA S.A.',
+    'PETR3 - PETROBRAS ON',
+    'BBAS3 - BANCO DO BRASIL S.A.',
+    'AAPL34 - APPLE DRN BDR',
+    'PETRA245 - PETR OPCAO',
+    'PETRX24 - PETR OPCAO',
+    'TESOURO SELIC 2029 - TESOURO DIRETO',
+    'CDB - CDB BANCO INTER',
+    'CRI - CRI XPTO',
+    'KLBN5 - KLABIN PNA',
+]
+
+MOVIMENTACOES = [
+    'Transferência - Liquidação',
+    'Compra',
+    'Venda',
+    'Rendimento',
+    'Dividendo',
+    'Juros Sobre Capital Próprio',
+]
+
+INSTITUICOES = [
+    'INTER DISTRIBUIDORA DE TITULOS E VALORES MOBILIARIOS LTDA',
+    'XP INVESTIMENTOS CCTVM S/A',
+]
+
+
+def gerar_produtos(n_tickers: int, seed: int = 42) -> list[str]:
+    """Gera n_tickers produtos distintos a partir dos modelos acima, variando o prefixo do ticker."""
+    rng = np.random.default_rng(seed)
+    letras = np.array(list('ABCDEFGHIJKLMNOPQRSTUVWXYZ'))
+    produtos = []
+    for i in range(n_tickers):
+        modelo = PRODUTOS[i % len(PRODUTOS)]
+        if i < len(PRODUTOS):
+            produtos.append(modelo)
+            continue
+        ticker, descricao = modelo.split(' - ', 1)
+        sufixo = ''.join(ch for ch in ticker[-2:] if ch.isdigit()) or '11'
+        prefixo = ''.join(rng.choice(letras, 4))
+        produtos.append(f'{prefixo}{sufixo} - {descricao}')
+    return produtos
+
+
+def gerar_extrato(n_linhas: int, n_tickers: int = len(PRODUTOS), seed: int = 42) -> pd.DataFrame:
+    """
+    Gera um extrato com colunas textuais, como lido por pd.read_excel(..., dtype=str).
+    """
+    rng = np.random.default_rng(seed)
+    produtos = np.array(gerar_produtos(n_tickers, seed))
+
+    datas = pd.Timestamp('2015-01-01') + pd.to_timedelta(rng.integers(0, 365 * 10, n_linhas), unit='D')
+    quantidade = rng.integers(1, 500, n_linhas)
+    preco = np.round(rng.uniform(5, 150, n_linhas), 2)
+
+    df = pd.DataFrame({
+        'Entrada/Saída': rng.choice(['Credito', 'Debito'], n_linhas, p=[0.7, 0.3]),
+        'Data': datas.strftime('%d/%m/%Y'),
+        'Movimentação': rng.choice(MOVIMENTACOES, n_linhas),
+        'Produto': rng.choice(produtos, n_linhas),
+        'Instituição': rng.choice(INSTITUICOES, n_linhas),
+        'Quantidade': quantidade.astype(str),
+        'Preço unitário': preco.astype(str),
+        'Valor da Operação': np.round(quantidade * preco, 2).astype(str),
+    })
+    return df
@@ -0,0 +1,6 @@
+from .fundamentalista_fii import (
+    PESOS_PADRAO,
+    analise_fundamentalista_avancada,
+    calcular_score_qualidade,
+    avaliar_fii
+)
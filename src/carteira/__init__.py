@@ -0,0 +1,6 @@
+from .posicoes import calcular_resumo_investimentos, calcular_posicoes
+from .livro import LivroPosicoes, atualizar_livro_posicoes
+from .patrimonio import calcular_matriz_posicoes, calcular_patrimonio_diario, calcular_valores_por_ativo
+from .proventos import calcular_proventos_recebidos, calcular_resumo_proventos
+from .rentabilidade import calcular_rentabilidade, calcular_xirr, calcular_twr
+from .impostos import calcular_vendas_realizadas, calcular_apuracao_ir
\ No newline at end of file
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+
+from .livro import acumular_posicao
+
+####################################################################################################################################
+# Lucro realizado nas vendas (custo médio) e apuração mensal do imposto de renda sobre ganhos de capital
+####################################################################################################################################
+
+# Classe de apuração de cada 'Tipo de Ativo' (prejuízos só compensam lucros da mesma classe)
+CLASSES_IR = {
+    'FII': 'FII',
+    'Ação ON': 'Ações',
+    'Ação PN': 'Ações',
+    'Unit': 'Ações',
+    'ETF': 'Ações',
+    'BDR': 'Ações',
+}
+
+ALIQUOTAS_IR = {'FII': 0.20, 'Ações': 0.15}
+
+# Vendas de ações e units até esse total no mês têm o lucro isento (ETFs e BDRs não entram na isenção)
+TIPOS_ISENTAVEIS = ['Ação ON', 'Ação PN', 'Unit']
+LIMITE_ISENCAO_ACOES = 20_000.0
+
+# Acima disso (em log), o produto dos fatores do preço médio perde precisão e o trecho é refeito em laço
+LIMITE_LOG_FATORES = 500.0
+
+COLUNAS_VENDAS = ['Data', 'Ticker', 'Tipo de Ativo', 'Classe', 'Quantidade', 'Valor da Venda', 'Custo', 'Lucro/Prejuízo']
+
+COLUNAS_APURACAO = [
+    'Classe', 'Mês', 'Vendas', 'Lucro Isento', 'Resultado', 'Prejuízo a Compensar',
+    'Base de Cálculo', 'Alíquota', 'Imposto', 'Prejuízo Acumulado',
+]
+
+
+def _preco_medio_sequencial(fatores: np.ndarray, parcelas: np.ndarray) -> np.ndarray:
+    """Recorrência A[t] = fatores[t] * A[t-1] + parcelas[t], em laço (só para trechos mal condicionados)."""
+    resultado = np.empty(len(fatores))
+    atual = 0.0
+    for i, (fator, parcela) in enumerate(zip(fatores.tolist(), parcelas.tolist())):
+        atual = fator * atual + parcela
+        resultado[i] = atual
+    return resultado
+
+
+def calcular_vendas_realizadas(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Uma linha por venda com o custo pelo preço médio do momento e o lucro/prejuízo realizado, com a
+    mesma regra do LivroPosicoes (datas em ordem, compras antes das vendas no mesmo dia, vendas acima
+    da posição baixam só o que existe), mas sem laço por operação:
+
+    - a posição de cada ticker é a soma acumulada limitada em zero (cumsum − cummin);
+    - o preço médio segue A[t] = A[t-1] · Q[t-1]/Q[t] + valor/Q[t] nas compras e não muda nas vendas.
+      Essa recorrência linear é resolvida por trecho (da abertura da posição até ela zerar) com
+      somas acumuladas de logaritmos dos fatores.
+
+    Day trades são tratados como operações comuns.
+    """
+    if 'Compra/Venda' in df.columns:
+        df = df[df['Compra/Venda'].astype(bool)]
+
+    entrada_saida = df['Entrada/Saída'].astype(str).to_numpy()
+    tipos = df['Tipo de Ativo'].astype(str).to_numpy() if 'Tipo de Ativo' in df.columns else np.full(len(df), 'Outro')
+    operacoes = pd.DataFrame({
+        'Data': df['Data'].to_numpy(),
+        'Ticker': df['Ticker'].astype(str).to_numpy(),
+        'Tipo de Ativo': tipos,
+        'venda': entrada_saida == 'Debito',
+        'Quantidade': df['Quantidade'].to_numpy(dtype='float64'),
+        'Valor': df['Valor da Operação'].to_numpy(dtype='float64'),
+    })
+    operacoes = operacoes[
+        np.isin(entrada_saida, ['Credito', 'Debito']) & (operacoes['Quantidade'] > 0).to_numpy() & operacoes['Data'].notna().to_numpy()
+    ]
+    if operacoes.empty:
+        return pd.DataFrame(columns=COLUNAS_VENDAS)
+
+    operacoes = operacoes.sort_values(['Ticker', 'Data', 'venda'], kind='stable').reset_index(drop=True)
+    por_ticker = operacoes.groupby('Ticker', sort=False)
+    venda = operacoes['venda'].to_numpy()
+    quantidade = operacoes['Quantidade'].to_numpy()
+    valor = operacoes['Valor'].to_numpy()
+
+    # Posição após cada operação, sem ficar negativa: soma acumulada menos o menor saldo negativo até ali
+    posicao = acumular_posicao(pd.Series(np.where(venda, -quantidade, quantidade)), operacoes['Ticker']).to_numpy()
+    primeira = (por_ticker.cumcount() == 0).to_numpy()
+    anterior = np.where(primeira, 0.0, np.roll(posicao, 1))
+
+    # Fatores da recorrência do preço médio; cada abertura de posição (compra a partir de zero) inicia um trecho
+    compra = ~venda
+    abertura = primeira | (compra & (anterior <= 0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fatores = np.where(compra, anterior / posicao, 1.0)
+        parcelas = np.where(compra, valor / posicao, 0.0)
+        log_fatores = np.where(abertura, 0.0, np.log(fatores))
+
+    trechos = np.cumsum(abertura)
+    log_acumulado = pd.Series(log_fatores).groupby(trechos).cumsum().to_numpy()
+    with np.errstate(over='ignore'):
+        preco_medio = np.exp(log_acumulado) * pd.Series(parcelas * np.exp(-log_acumulado)).groupby(trechos).cumsum().to_numpy()
+
+    mal_condicionados = np.unique(trechos[np.abs(log_acumulado) > LIMITE_LOG_FATORES])
+    for trecho in mal_condicionados:
+        linhas = trechos == trecho
+        preco_medio[linhas] = _preco_medio_sequencial(np.where(abertura[linhas], 0.0, fatores[linhas]), parcelas[linhas])
+
+    preco_medio_anterior = np.where(primeira, 0.0, np.roll(preco_medio, 1))
+    vendida = np.where(venda, anterior - posicao, 0.0)
+    valor_venda = vendida * valor / quantidade
+    custo = vendida * preco_medio_anterior
+
+    vendas = pd.DataFrame({
+        'Data': operacoes['Data'],
+        'Ticker': operacoes['Ticker'],
+        'Tipo de Ativo': operacoes['Tipo de Ativo'],
+        'Classe': operacoes['Tipo de Ativo'].map(CLASSES_IR),
+        'Quantidade': vendida,
+        'Valor da Venda': valor_venda,
+        'Custo': custo,
+        'Lucro/Prejuízo': valor_venda - custo,
+    })[venda & (vendida > 0)]
+
+    return vendas.sort_values(['Data', 'Ticker'], kind='stable').reset_index(drop=True)[COLUNAS_VENDAS]
+
+
+def calcular_apuracao_ir(vendas: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apuração mensal do IR sobre ganhos de capital, por classe (FII: 20%; ações, units, ETFs e BDRs:
+    15%), a partir de calcular_vendas_realizadas:
+
+    - lucros de ações e units em meses com até LIMITE_ISENCAO_ACOES em vendas delas são isentos
+      (prejuízos desses meses continuam compensáveis);
+    - o prejuízo acumulado é compensado nos meses seguintes da mesma classe. A recorrência
+      P[t] = min(0, P[t-1] + resultado[t]) é resolvida com soma e máximo acumulados (S − max(0, cummax S)).
+
+    Não considera day trade, IRRF (dedo-duro) nem o mínimo de R$ 10 do DARF.
+    """
+    vendas = vendas[vendas['Classe'].notna()]
+    if vendas.empty:
+        return pd.DataFrame(columns=COLUNAS_APURACAO)
+
+    mes = vendas['Data'].dt.to_period('M')
+    isentavel = vendas['Tipo de Ativo'].isin(TIPOS_ISENTAVEIS).to_numpy()
+    vendas_isentaveis_mes = pd.Series(np.where(isentavel, vendas['Valor da Venda'], 0.0), index=vendas.index).groupby(mes).transform('sum')
+    lucro = vendas['Lucro/Prejuízo'].to_numpy()
+    isento = isentavel & (vendas_isentaveis_mes <= LIMITE_ISENCAO_ACOES).to_numpy() & (lucro > 0)
+
+    por_mes = pd.DataFrame({
+        'Classe': vendas['Classe'].to_numpy(),
+        'Mês': mes.to_numpy(),
+        'Vendas': vendas['Valor da Venda'].to_numpy(),
+        'Lucro Isento': np.where(isento, lucro, 0.0),
+        'Resultado': np.where(isento, 0.0, lucro),
+    }).groupby(['Classe', 'Mês'], sort=True).sum().reset_index()
+
+    por_classe = por_mes.groupby('Classe', sort=False)['Resultado']
+    acumulado = por_classe.cumsum()
+    prejuizo = acumulado - np.maximum(acumulado.groupby(por_mes['Classe'], sort=False).cummax(), 0.0)
+    prejuizo_anterior = prejuizo.groupby(por_mes['Classe'], sort=False).shift(fill_value=0.0)
+
+    por_mes['Prejuízo a Compensar'] = prejuizo_anterior.abs()
+    por_mes['Base de Cálculo'] = np.maximum(prejuizo_anterior + por_mes['Resultado'] - prejuizo, 0.0)
+    por_mes['Alíquota'] = por_mes['Classe'].map(ALIQUOTAS_IR)
+    por_mes['Imposto'] = por_mes['Base de Cálculo'] * por_mes['Alíquota']
+    por_mes['Prejuízo Acumulado'] = prejuizo.abs()
+
+    return por_mes[COLUNAS_APURACAO]
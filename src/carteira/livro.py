@@ -0,0 +1,262 @@
+import base64
+import json
+import os
+import pathlib
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from preprocessamento.cache import obter_dir_cache
+from preprocessamento.carga_b3 import COLUNAS_IDENTIFICACAO_MOVIMENTACAO, calcular_hash_movimentacoes
+
+####################################################################################################################################
+# Livro de posições: aplica as operações em ordem de data, mantendo custo médio e lotes por ticker
+####################################################################################################################################
+
+# Incrementar sempre que o formato do arquivo salvo ou a regra de custo mudar, para forçar a reconstrução
+VERSAO_LIVRO = '2'
+
+# O Ticker entra na identificação: uma fusão ou troca de código cadastrada depois muda só o Ticker
+# das movimentações, e o livro precisa ser refeito com o código novo
+COLUNAS_IDENTIFICACAO_LIVRO = COLUNAS_IDENTIFICACAO_MOVIMENTACAO + ['Ticker']
+
+# Quantidades abaixo disso são consideradas posição zerada (resíduo de ponto flutuante em frações)
+TOLERANCIA_QUANTIDADE = 1e-9
+
+
+def acumular_posicao(quantidades, por=None):
+    """
+    Posição após cada movimento a partir das quantidades com sinal (linhas em ordem de data), com a
+    mesma regra do livro: uma venda acima da posição só a zera, e as compras seguintes partem de zero.
+    É a soma acumulada menos o menor saldo negativo até ali (S − min(0, cummin S)), por coluna de um
+    DataFrame ou por grupo `por` de uma Series.
+    """
+    if por is not None:
+        acumulada = quantidades.groupby(por, sort=False).cumsum()
+        minima = acumulada.groupby(por, sort=False).cummin()
+    else:
+        acumulada = quantidades.cumsum()
+        minima = acumulada.cummin()
+
+    posicao = acumulada - np.minimum(minima, 0.0)
+    return posicao.mask(posicao <= TOLERANCIA_QUANTIDADE, 0.0)
+
+
+def _nova_posicao() -> dict:
+    return {'quantidade': 0.0, 'custo': 0.0, 'lucro_realizado': 0.0, 'lotes': deque()}
+
+
+class LivroPosicoes:
+    """
+    Posições por ticker construídas operação a operação, em ordem de data. Cada venda baixa o custo
+    pelo preço médio do momento (e não pela média de todas as compras da história) e consome os lotes
+    em ordem FIFO. O livro lembra quais movimentações já aplicou (pelo hash de calcular_hash_movimentacoes,
+    incluindo o Ticker), então `atualizar` só processa as que chegaram depois e o custo é proporcional
+    ao delta.
+    """
+
+    def __init__(self):
+        self.posicoes: dict[str, dict] = {}
+        self.hashes_aplicados = np.empty(0, dtype='uint64')  # ordenado, um hash por movimentação já aplicada
+        self.ultima_data: pd.Timestamp | None = None
+
+    def __len__(self) -> int:
+        return len(self.hashes_aplicados)
+
+    def aplicar_operacao(self, ticker: str, data, entrada_saida: str, quantidade: float, valor: float) -> None:
+        """Aplica uma única compra (Credito) ou venda (Debito) em O(1) amortizado."""
+        posicao = self.posicoes.get(ticker)
+        if posicao is None:
+            posicao = self.posicoes[ticker] = _nova_posicao()
+
+        if quantidade <= 0:
+            return
+
+        data = None if pd.isna(data) else pd.Timestamp(data).isoformat()
+
+        if entrada_saida == 'Credito':
+            posicao['quantidade'] += quantidade
+            posicao['custo'] += valor
+            posicao['lotes'].append([data, quantidade, valor / quantidade])
+            return
+
+        if entrada_saida != 'Debito':
+            return
+
+        # Vendas acima da posição (histórico incompleto) baixam apenas o que existe
+        vendida = min(quantidade, posicao['quantidade'])
+        if vendida <= 0:
+            return
+
+        preco_medio = posicao['custo'] / posicao['quantidade']
+        posicao['lucro_realizado'] += vendida * (valor / quantidade - preco_medio)
+        posicao['custo'] -= vendida * preco_medio
+        posicao['quantidade'] -= vendida
+
+        restante = vendida
+        lotes = posicao['lotes']
+        while restante > TOLERANCIA_QUANTIDADE and lotes:
+            lote = lotes[0]
+            if lote[1] <= restante + TOLERANCIA_QUANTIDADE:
+                restante -= lote[1]
+                lotes.popleft()
+            else:
+                lote[1] -= restante
+                restante = 0.0
+
+        if posicao['quantidade'] <= TOLERANCIA_QUANTIDADE:
+            posicao['quantidade'] = 0.0
+            posicao['custo'] = 0.0
+            lotes.clear()
+
+    def _aplicar_movimentacoes(self, df: pd.DataFrame) -> None:
+        # Ordem de data crescente; no mesmo dia, compras antes das vendas (day trade não zera a posição antes da compra)
+        ordem = pd.DataFrame({
+            'Data': df['Data'].to_numpy(),
+            'venda': (df['Entrada/Saída'] == 'Debito').to_numpy(),
+        }).sort_values(['Data', 'venda'], kind='stable', na_position='first').index.to_numpy()
+
+        colunas = [
+            df['Ticker'].astype(str).to_numpy()[ordem].tolist(),
+            df['Data'].iloc[ordem].tolist(),
+            df['Entrada/Saída'].astype(str).to_numpy()[ordem].tolist(),
+            df['Quantidade'].to_numpy(dtype='float64')[ordem].tolist(),
+            df['Valor da Operação'].to_numpy(dtype='float64')[ordem].tolist(),
+        ]
+        for ticker, data, entrada_saida, quantidade, valor in zip(*colunas):
+            self.aplicar_operacao(ticker, data, entrada_saida, quantidade, valor)
+
+        datas = df['Data'].dropna()
+        if not datas.empty:
+            maior = pd.Timestamp(datas.max())
+            self.ultima_data = maior if self.ultima_data is None else max(self.ultima_data, maior)
+
+    def atualizar(self, df: pd.DataFrame) -> int:
+        """
+        Aplica as movimentações de `df` (histórico completo, como sai de preparar_movimentacoes) que
+        ainda não estão no livro e retorna quantas foram aplicadas. Se alguma movimentação nova for
+        anterior à última já aplicada, ou se alguma já aplicada sumiu do histórico, o livro é refeito.
+        """
+        if df is None or df.empty:
+            return 0
+
+        if 'Compra/Venda' in df.columns:
+            df = df[df['Compra/Venda'].astype(bool)]
+
+        hashes = calcular_hash_movimentacoes(df, COLUNAS_IDENTIFICACAO_LIVRO)
+        ocorrencia = hashes.groupby(hashes).cumcount().to_numpy()
+
+        # Quantas movimentações com o mesmo hash já foram aplicadas: as primeiras ocorrências são as antigas
+        valores = hashes.to_numpy(dtype='uint64')
+        contagem = (
+            np.searchsorted(self.hashes_aplicados, valores, side='right')
+            - np.searchsorted(self.hashes_aplicados, valores, side='left')
+        )
+        aplicadas = ocorrencia < contagem
+
+        novas = df[~aplicadas]
+        retroativas = (
+            self.ultima_data is not None
+            and not novas.empty
+            and (novas['Data'].dropna() < self.ultima_data).any()
+        )
+        if retroativas or aplicadas.sum() != len(self):
+            self.__init__()
+            novas = df
+
+        if novas.empty:
+            return 0
+
+        self._aplicar_movimentacoes(novas)
+        self.hashes_aplicados = np.sort(np.concatenate([self.hashes_aplicados, hashes.loc[novas.index].to_numpy(dtype='uint64')]))
+
+        return len(novas)
+
+    def posicoes_df(self) -> pd.DataFrame:
+        """
+        Uma linha por ticker: qtd_liquida, preco_medio, custo (custo médio da posição em aberto),
+        lucro_realizado e n_lotes.
+        """
+        linhas = {
+            ticker: {
+                'qtd_liquida': posicao['quantidade'],
+                'preco_medio': posicao['custo'] / posicao['quantidade'] if posicao['quantidade'] > 0 else 0.0,
+                'custo': posicao['custo'],
+                'lucro_realizado': posicao['lucro_realizado'],
+                'n_lotes': len(posicao['lotes']),
+            }
+            for ticker, posicao in self.posicoes.items()
+        }
+        colunas = ['qtd_liquida', 'preco_medio', 'custo', 'lucro_realizado', 'n_lotes']
+        return pd.DataFrame.from_dict(linhas, orient='index', columns=colunas).rename_axis('Ticker')
+
+    def lotes(self, ticker: str) -> pd.DataFrame:
+        """Lotes ainda em aberto do ticker, do mais antigo para o mais recente."""
+        posicao = self.posicoes.get(ticker, _nova_posicao())
+        df = pd.DataFrame(list(posicao['lotes']), columns=['Data', 'Quantidade', 'Preço unitário'])
+        df['Data'] = pd.to_datetime(df['Data'])
+        return df
+
+    def salvar(self, path: str | os.PathLike) -> None:
+        path = pathlib.Path(path)
+        estado = {
+            'versao': VERSAO_LIVRO,
+            'ultima_data': self.ultima_data.isoformat() if self.ultima_data is not None else None,
+            'hashes_aplicados': base64.b64encode(self.hashes_aplicados.astype('<u8').tobytes()).decode('ascii'),
+            'posicoes': {
+                ticker: {**posicao, 'lotes': list(posicao['lotes'])}
+                for ticker, posicao in self.posicoes.items()
+            },
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path_tmp = path.with_suffix(path.suffix + '.tmp')
+            with open(path_tmp, 'w', encoding='utf-8') as arquivo:
+                json.dump(estado, arquivo)
+            os.replace(path_tmp, path)
+        except Exception as e:
+            print(f"Não foi possível salvar o livro de posições {path}: {str(e)}")
+
+    @classmethod
+    def carregar(cls, path: str | os.PathLike) -> 'LivroPosicoes':
+        """Lê um livro salvo; se não existir, for de outra versão ou estiver corrompido, retorna um livro vazio."""
+        livro = cls()
+        path = pathlib.Path(path)
+        if not path.exists():
+            return livro
+
+        try:
+            with open(path, encoding='utf-8') as arquivo:
+                estado = json.load(arquivo)
+            if estado.get('versao') != VERSAO_LIVRO:
+                return livro
+
+            livro.ultima_data = pd.Timestamp(estado['ultima_data']) if estado['ultima_data'] else None
+            livro.hashes_aplicados = np.frombuffer(base64.b64decode(estado['hashes_aplicados']), dtype='<u8').astype('uint64')
+            livro.posicoes = {
+                ticker: {**posicao, 'lotes': deque(posicao['lotes'])}
+                for ticker, posicao in estado['posicoes'].items()
+            }
+        except Exception as e:
+            print(f"Livro de posições inválido em {path}, será recriado: {str(e)}")
+            return cls()
+
+        return livro
+
+
+def obter_path_livro(nome: str) -> pathlib.Path:
+    return obter_dir_cache() / f'livro_{nome}.json'
+
+
+def atualizar_livro_posicoes(df: pd.DataFrame, nome: str) -> LivroPosicoes:
+    """
+    Carrega o livro `nome` do disco (pasta do cache), aplica apenas as movimentações novas de `df`
+    e grava de volta se algo mudou.
+    """
+    path = obter_path_livro(nome)
+    livro = LivroPosicoes.carregar(path)
+    if livro.atualizar(df) > 0:
+        livro.salvar(path)
+    return livro
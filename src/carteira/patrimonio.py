@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+
+from .livro import acumular_posicao
+
+####################################################################################################################################
+# Evolução diária do patrimônio: matriz de posições (datas × tickers) × matriz de fechamentos
+####################################################################################################################################
+
+
+def _operacoes_com_sinal(df: pd.DataFrame) -> pd.DataFrame:
+    """Uma linha por operação com quantidade e valor positivos nas compras (Credito) e negativos nas vendas (Debito)."""
+    if 'Compra/Venda' in df.columns:
+        df = df[df['Compra/Venda'].astype(bool)]
+
+    entrada_saida = df['Entrada/Saída'].to_numpy()
+    sinal = np.select([entrada_saida == 'Credito', entrada_saida == 'Debito'], [1.0, -1.0], 0.0)
+
+    operacoes = pd.DataFrame({
+        'Data': df['Data'].dt.normalize().to_numpy(),
+        'Ticker': df['Ticker'].astype(str).to_numpy(),
+        'Quantidade': sinal * df['Quantidade'].to_numpy(dtype='float64'),
+        'Valor': sinal * df['Valor da Operação'].to_numpy(dtype='float64'),
+        'Preço': df['Preço unitário'].to_numpy(dtype='float64'),
+    })
+    return operacoes[operacoes['Data'].notna()]
+
+
+def _calendario(operacoes: pd.DataFrame, fim=None) -> pd.DatetimeIndex:
+    """Dias úteis entre a primeira operação e `fim` (hoje, se omitido), mais os dias em que houve operação."""
+    fim = pd.Timestamp(fim).normalize() if fim is not None else pd.Timestamp.today().normalize()
+    fim = max(fim, operacoes['Data'].max())
+    dias_uteis = pd.date_range(operacoes['Data'].min(), fim, freq='B')
+    return dias_uteis.union(pd.DatetimeIndex(operacoes['Data'].unique())).rename('Data')
+
+
+def calcular_matriz_posicoes(df: pd.DataFrame, fim=None) -> pd.DataFrame:
+    """
+    Quantidade em carteira de cada ticker ao fim de cada dia (índice Data × colunas Ticker), pela soma
+    acumulada das quantidades com sinal com piso em zero (acumular_posicao): uma venda sem a compra
+    correspondente no histórico só zera a posição, como no LivroPosicoes.
+    """
+    operacoes = _operacoes_com_sinal(df)
+    if operacoes.empty:
+        return pd.DataFrame(dtype='float64')
+
+    por_dia = operacoes.pivot_table(index='Data', columns='Ticker', values='Quantidade', aggfunc='sum', fill_value=0.0)
+    return acumular_posicao(por_dia.reindex(_calendario(operacoes, fim), fill_value=0.0))
+
+
+def _alinhar_precos(precos: pd.DataFrame, datas: pd.DatetimeIndex, tickers: pd.Index) -> pd.DataFrame:
+    """Reindexa uma matriz de preços para as datas/tickers pedidos, repetindo o último preço conhecido."""
+    if precos is None or precos.empty:
+        return pd.DataFrame(np.nan, index=datas, columns=tickers)
+
+    precos = precos.reindex(columns=tickers)
+    return precos.reindex(precos.index.union(datas)).ffill().reindex(datas)
+
+
+def calcular_valores_por_ativo(df: pd.DataFrame, precos: pd.DataFrame | None, fim=None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Matrizes diárias por ticker (índice Data × colunas Ticker), base da evolução do patrimônio e das
+    rentabilidades:
+
+    - valores: posição × fechamento do dia (ou o último fechamento anterior). Sem cotação de mercado
+      para o ticker/data, usa o preço da última operação com ele.
+    - fluxos: valor das operações do dia, positivo nas compras e negativo nas vendas.
+
+    `precos` é uma matriz de fechamentos (índice Data × colunas Ticker), como a de
+    mercado.obter_historico_fechamentos.
+    """
+    operacoes = _operacoes_com_sinal(df)
+    if operacoes.empty:
+        return pd.DataFrame(dtype='float64'), pd.DataFrame(dtype='float64')
+
+    posicoes = calcular_matriz_posicoes(df, fim)
+    datas, tickers = posicoes.index, posicoes.columns
+
+    # Preço da última operação de cada ticker em cada dia, usado onde não houver cotação de mercado
+    precos_operacoes = operacoes.pivot_table(index='Data', columns='Ticker', values='Preço', aggfunc='last')
+    precos_alinhados = _alinhar_precos(precos, datas, tickers).combine_first(
+        _alinhar_precos(precos_operacoes, datas, tickers)
+    )
+
+    valores = pd.DataFrame(
+        np.nan_to_num(posicoes.to_numpy() * precos_alinhados.to_numpy()),
+        index=datas,
+        columns=tickers
+    )
+    fluxos = operacoes.pivot_table(index='Data', columns='Ticker', values='Valor', aggfunc='sum', fill_value=0.0)
+    fluxos = fluxos.reindex(index=datas, columns=tickers, fill_value=0.0)
+    return valores, fluxos
+
+
+def calcular_patrimonio_diario(df: pd.DataFrame, precos: pd.DataFrame | None, fim=None) -> pd.DataFrame:
+    """
+    Séries diárias da carteira, calculadas só com operações matriciais (sem laço por dia):
+
+    - Patrimônio: soma dos valores por ativo de calcular_valores_por_ativo.
+    - Investido: capital aplicado acumulado (compras − vendas).
+    - Lucro/Prejuízo: Patrimônio − Investido.
+    """
+    valores, fluxos = calcular_valores_por_ativo(df, precos, fim)
+    if valores.empty:
+        return pd.DataFrame(columns=['Patrimônio', 'Investido', 'Lucro/Prejuízo'], dtype='float64')
+
+    resultado = pd.DataFrame({
+        'Patrimônio': valores.sum(axis=1).to_numpy(),
+        'Investido': fluxos.sum(axis=1).cumsum().to_numpy(),
+    }, index=valores.index)
+    resultado['Lucro/Prejuízo'] = resultado['Patrimônio'] - resultado['Investido']
+    return resultado
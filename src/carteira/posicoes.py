@@ -0,0 +1,87 @@
+import pandas as pd
+import numpy as np
+
+from mercado.cotacoes import obter_ultimos_precos
+from .livro import LivroPosicoes
+
+
+def calcular_posicoes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Agrega as movimentações por ticker em uma única passada (groupby), usando colunas já separadas
+    entre Credito (compras) e Debito (vendas). Retorna, por ticker, na ordem em que aparecem:
+    qtd_comprada, qtd_vendida, qtd_liquida, total_investido e preco_medio (ponderado pelas compras).
+    """
+    credito = (df["Entrada/Saída"] == "Credito").to_numpy()
+    debito = (df["Entrada/Saída"] == "Debito").to_numpy()
+
+    quantidade = df["Quantidade"].to_numpy(dtype='float64')
+    valor = df["Valor da Operação"].to_numpy(dtype='float64')
+    preco = df["Preço unitário"].to_numpy(dtype='float64')
+
+    colunas = pd.DataFrame({
+        "Ticker": df["Ticker"].astype(object).to_numpy(),
+        "qtd_comprada": np.where(credito, quantidade, 0.0),
+        "qtd_vendida": np.where(debito, quantidade, 0.0),
+        "total_comprado": np.where(credito, valor, 0.0),
+        "total_vendido": np.where(debito, valor, 0.0),
+        "custo_compras": np.where(credito, quantidade * preco, 0.0),
+    })
+
+    posicoes = colunas.groupby("Ticker", sort=False).sum(min_count=0)
+
+    posicoes["qtd_liquida"] = posicoes["qtd_comprada"] - posicoes["qtd_vendida"]
+    posicoes["total_investido"] = posicoes["total_comprado"] - posicoes["total_vendido"]
+    posicoes["preco_medio"] = np.where(
+        posicoes["qtd_comprada"] > 0,
+        posicoes["custo_compras"] / posicoes["qtd_comprada"].where(posicoes["qtd_comprada"] > 0),
+        0.0
+    )
+
+    return posicoes[["qtd_comprada", "qtd_vendida", "qtd_liquida", "total_investido", "preco_medio"]]
+
+
+def calcular_resumo_investimentos(df: pd.DataFrame, livro: LivroPosicoes | None = None):
+    """
+    Consolida as posições em aberto com a cotação atual. Com um livro de posições já atualizado,
+    quantidade, preço médio e total investido vêm dele (custo médio baixado a cada venda, na ordem
+    das datas); sem livro, vêm da agregação de `df` em uma única passada (calcular_posicoes).
+    """
+    if livro is None:
+        posicoes = calcular_posicoes(df)
+    else:
+        posicoes = livro.posicoes_df().rename(columns={"custo": "total_investido"})
+
+    # Apenas posições em aberto são contabilizadas
+    posicoes = posicoes[posicoes["qtd_liquida"] > 0]
+
+    # Cotações de todas as posições em aberto em uma única requisição
+    precos_atuais = obter_ultimos_precos(posicoes.index).reindex(posicoes.index, fill_value=0.0)
+
+    valor_mercado = precos_atuais * posicoes["qtd_liquida"]
+    lucro_prejuizo = valor_mercado - posicoes["total_investido"]
+
+    total_investido_geral = posicoes["total_investido"].sum()
+    total_valor_mercado = valor_mercado.sum()
+
+    df_consolidacao = pd.DataFrame({
+        "Ticker": posicoes.index,
+        "Quantidade Atual": posicoes["qtd_liquida"].to_numpy(),
+        "Preço Médio": posicoes["preco_medio"].round(2).to_numpy(),
+        "Preço Atual": precos_atuais.round(2).to_numpy(),
+        "Total Investido": posicoes["total_investido"].round(2).to_numpy(),
+        "Valor de Mercado": valor_mercado.round(2).to_numpy(),
+        "Lucro/Prejuízo": lucro_prejuizo.round(2).to_numpy(),
+    }) if not posicoes.empty else pd.DataFrame()
+
+    df_consolidacao = df_consolidacao.sort_values(by=['Ticker'], ascending=True) if not df_consolidacao.empty else df_consolidacao
+
+    lucro_total = total_valor_mercado - total_investido_geral
+    delta = lucro_total / total_investido_geral if total_investido_geral > 0 else 0
+
+    return {
+        "consolidacao": df_consolidacao,
+        "total_investido_geral": total_investido_geral,
+        "total_valor_mercado": total_valor_mercado,
+        "lucro_total": lucro_total,
+        "delta": delta
+    }
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+from .livro import LivroPosicoes, acumular_posicao
+from .patrimonio import _operacoes_com_sinal
+
+####################################################################################################################################
+# Proventos recebidos: cada data ex de dividendo/rendimento cruzada com a posição da carteira naquele dia
+####################################################################################################################################
+
+COLUNAS_RESUMO_PROVENTOS = ['Ticker', 'Proventos Recebidos', 'Proventos 12M', 'Custo da Posição', 'Yield on Cost 12M']
+
+
+def calcular_posicao_acumulada(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Posição de cada ticker após cada dia com operação: Ticker, Data e Quantidade (soma acumulada das
+    quantidades com sinal com piso em zero, ver acumular_posicao), ordenada por Data, pronta para merge_asof.
+    """
+    operacoes = _operacoes_com_sinal(df)
+    por_dia = operacoes.groupby(['Ticker', 'Data'], sort=True)['Quantidade'].sum().reset_index()
+    por_dia['Quantidade'] = acumular_posicao(por_dia['Quantidade'], por_dia['Ticker'])
+    return por_dia.sort_values('Data', kind='stable').reset_index(drop=True)
+
+
+def calcular_proventos_recebidos(df: pd.DataFrame, dividendos: pd.DataFrame) -> pd.DataFrame:
+    """
+    Um registro por provento com a quantidade em carteira na data ex e o valor recebido.
+
+    Tem direito ao provento quem terminou o pregão anterior à data ex com a cota, então a posição é
+    buscada por merge_asof (por Ticker) na última data de operação estritamente anterior à data ex.
+    `dividendos` tem as colunas Ticker, Data (data ex) e Valor (por cota), como em
+    mercado.obter_historico_mercado.
+    """
+    colunas = ['Ticker', 'Data', 'Valor', 'Quantidade', 'Valor Recebido']
+    if df.empty or dividendos is None or dividendos.empty:
+        return pd.DataFrame(columns=colunas)
+
+    posicoes = calcular_posicao_acumulada(df)
+
+    eventos = dividendos[['Ticker', 'Data', 'Valor']].copy()
+    eventos['Ticker'] = eventos['Ticker'].astype(str)
+    eventos['Data'] = pd.to_datetime(eventos['Data']).astype(posicoes['Data'].dtype)
+    eventos = eventos[eventos['Ticker'].isin(posicoes['Ticker'].unique())].sort_values('Data', kind='stable')
+
+    recebidos = pd.merge_asof(
+        eventos,
+        posicoes,
+        on='Data',
+        by='Ticker',
+        direction='backward',
+        allow_exact_matches=False
+    )
+    recebidos['Quantidade'] = recebidos['Quantidade'].fillna(0.0)
+    recebidos['Valor Recebido'] = recebidos['Valor'] * recebidos['Quantidade']
+
+    return recebidos[recebidos['Quantidade'] > 0][colunas].reset_index(drop=True)
+
+
+def calcular_resumo_proventos(df: pd.DataFrame, dividendos: pd.DataFrame, referencia=None, livro: LivroPosicoes | None = None) -> dict[str,any]:
+    """
+    Proventos por ticker e da carteira inteira: total recebido, recebido nos 12 meses até `referencia`
+    (hoje, se omitido) e yield on cost 12M (proventos 12M / custo médio da posição em aberto, do
+    livro de posições). Tudo calculado com groupby sobre a tabela de proventos recebidos.
+    """
+    referencia = pd.Timestamp(referencia).normalize() if referencia is not None else pd.Timestamp.today().normalize()
+    recebidos = calcular_proventos_recebidos(df, dividendos)
+
+    if livro is None:
+        livro = LivroPosicoes()
+        livro.atualizar(df)
+    custo = livro.posicoes_df()['custo']
+
+    ultimos_12m = recebidos['Data'] > referencia - pd.DateOffset(years=1)
+    por_ticker = pd.DataFrame({
+        'Proventos Recebidos': recebidos.groupby('Ticker')['Valor Recebido'].sum(),
+        'Proventos 12M': recebidos[ultimos_12m].groupby('Ticker')['Valor Recebido'].sum(),
+    }).fillna(0.0)
+    por_ticker['Custo da Posição'] = custo.reindex(por_ticker.index).fillna(0.0)
+    por_ticker['Yield on Cost 12M'] = np.where(
+        por_ticker['Custo da Posição'] > 0,
+        por_ticker['Proventos 12M'] / por_ticker['Custo da Posição'].where(por_ticker['Custo da Posição'] > 0),
+        0.0
+    )
+    por_ticker = por_ticker.rename_axis('Ticker').reset_index().sort_values('Ticker')[COLUNAS_RESUMO_PROVENTOS]
+
+    total_12m = por_ticker['Proventos 12M'].sum()
+    custo_total = custo[custo > 0].sum()
+
+    return {
+        'por_ativo': por_ticker.reset_index(drop=True),
+        'recebidos': recebidos,
+        'total_recebido': por_ticker['Proventos Recebidos'].sum(),
+        'total_12m': total_12m,
+        'yield_on_cost_12m': total_12m / custo_total if custo_total > 0 else 0.0,
+    }
@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+
+from .patrimonio import _operacoes_com_sinal, calcular_valores_por_ativo
+
+####################################################################################################################################
+# Rentabilidade ponderada pelo capital (XIRR) e ponderada pelo tempo (TWR), por ativo e da carteira
+####################################################################################################################################
+
+DIAS_ANO = 365.25
+
+COLUNAS_RENTABILIDADE = ['Ticker', 'XIRR a.a.', 'TWR', 'TWR a.a.']
+
+# Intervalo de busca da XIRR (taxas anuais): de -99,99% a 1.000.000% a.a.
+TAXA_MINIMA = -0.9999
+TAXA_MAXIMA = 1e4
+
+
+def _valor_presente(taxas: np.ndarray, grupos: np.ndarray, anos: np.ndarray, valores: np.ndarray, n_grupos: int) -> tuple[np.ndarray, np.ndarray]:
+    """Valor presente de cada grupo de fluxos e sua derivada em relação à taxa, com um bincount por termo."""
+    base = 1.0 + taxas[grupos]
+    descontados = valores * base ** -anos
+    vp = np.bincount(grupos, weights=descontados, minlength=n_grupos)
+    derivada = np.bincount(grupos, weights=-anos * descontados / base, minlength=n_grupos)
+    return vp, derivada
+
+
+def calcular_xirr(grupos, anos, valores, n_grupos: int | None = None, tolerancia: float = 1e-10, max_iteracoes: int = 200) -> np.ndarray:
+    """
+    XIRR de vários conjuntos de fluxos ao mesmo tempo. Os fluxos vêm em formato longo: `grupos` (índice
+    inteiro do conjunto), `anos` (tempo desde o primeiro fluxo do conjunto) e `valores`.
+
+    Cada iteração avalia todos os conjuntos com operações de array: um passo de Newton quando ele cai
+    dentro do intervalo que ainda contém a raiz, senão bissecção. Conjuntos sem troca de sinal no
+    valor presente entre TAXA_MINIMA e TAXA_MAXIMA (ex.: só compras) ficam como NaN.
+    """
+    grupos = np.asarray(grupos, dtype='int64')
+    anos = np.asarray(anos, dtype='float64')
+    valores = np.asarray(valores, dtype='float64')
+    n_grupos = int(grupos.max()) + 1 if n_grupos is None else n_grupos
+    if n_grupos == 0:
+        return np.empty(0)
+
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        minimas = np.full(n_grupos, TAXA_MINIMA)
+        maximas = np.full(n_grupos, TAXA_MAXIMA)
+        vp_minimas, _ = _valor_presente(minimas, grupos, anos, valores, n_grupos)
+        vp_maximas, _ = _valor_presente(maximas, grupos, anos, valores, n_grupos)
+        validos = np.sign(vp_minimas) * np.sign(vp_maximas) < 0
+
+        taxas = np.full(n_grupos, 0.1)
+        for _ in range(max_iteracoes):
+            vp, derivada = _valor_presente(taxas, grupos, anos, valores, n_grupos)
+
+            # Estreita o intervalo: a raiz fica do lado em que o sinal do valor presente muda
+            mesmo_sinal = np.sign(vp) == np.sign(vp_minimas)
+            minimas = np.where(mesmo_sinal, taxas, minimas)
+            maximas = np.where(mesmo_sinal, maximas, taxas)
+
+            newton = taxas - vp / derivada
+            dentro = np.isfinite(newton) & (newton > minimas) & (newton < maximas)
+            novas = np.where(dentro, newton, (minimas + maximas) / 2)
+
+            convergiu = (np.abs(novas - taxas) <= tolerancia * (1.0 + np.abs(taxas))) | (vp == 0)
+            taxas = np.where(vp == 0, taxas, novas)
+            if convergiu[validos].all():
+                break
+
+    return np.where(validos, taxas, np.nan)
+
+
+def calcular_twr(valores: np.ndarray, compras: np.ndarray, vendas: np.ndarray) -> np.ndarray:
+    """
+    Retorno ponderado pelo tempo acumulado de cada coluna de uma matriz diária (dias × ativos).
+
+    As compras do dia entram no início do dia e as vendas (e proventos) no fechamento: o fator do dia
+    é (valor do dia + vendas) / (valor do dia anterior + compras), que nunca é negativo e, no dia em que
+    a posição é aberta, é o resultado sobre o valor das compras. Só os dias sem posição nem compras (ou
+    sem valor conhecido) ficam neutros; uma posição que passa a valer zero dá fator zero (perda total).
+    O acumulado é o produto dos fatores.
+    """
+    anteriores = np.vstack([np.zeros((1, valores.shape[1])), valores[:-1]])
+    base = anteriores + compras
+    resultado = valores + vendas
+    validos = (base > 0) & np.isfinite(resultado)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fatores = np.where(validos, resultado / base, 1.0)
+    return np.prod(fatores, axis=0) - 1.0
+
+
+def _anualizar(retornos: np.ndarray, dias: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        return np.where(dias > 0, (1.0 + retornos) ** (DIAS_ANO / dias) - 1.0, np.nan)
+
+
+def calcular_rentabilidade(df: pd.DataFrame, precos: pd.DataFrame | None, proventos: pd.DataFrame | None = None, fim=None) -> dict[str,any]:
+    """
+    XIRR (ponderada pelo capital) e TWR (ponderada pelo tempo, acumulada e anualizada) de cada ativo e
+    da carteira, a partir das operações, dos proventos recebidos (opcional, como em
+    calcular_proventos_recebidos) e do valor de mercado no último dia de `precos`/`fim`.
+
+    A XIRR de todos os ativos e da carteira é resolvida em uma única chamada de calcular_xirr, e a TWR
+    sai da mesma matriz diária de valores usada na evolução do patrimônio.
+    """
+    valores, fluxos = calcular_valores_por_ativo(df, precos, fim)
+    if valores.empty:
+        return {'por_ativo': pd.DataFrame(columns=COLUNAS_RENTABILIDADE), 'xirr': np.nan, 'twr': np.nan, 'twr_anual': np.nan}
+
+    datas, tickers = valores.index, valores.columns
+    recebidos = pd.DataFrame(0.0, index=datas, columns=tickers)
+    if proventos is not None and not proventos.empty:
+        recebidos = proventos.pivot_table(index='Data', columns='Ticker', values='Valor Recebido', aggfunc='sum')
+        recebidos = recebidos.reindex(index=datas, columns=tickers, fill_value=0.0).fillna(0.0)
+
+    # Fluxos do investidor em formato longo: compras negativas, vendas e proventos positivos e, no último
+    # dia, o valor de mercado da posição. A carteira é o grupo extra de índice len(tickers).
+    operacoes = _operacoes_com_sinal(df)
+    codigos = pd.Index(tickers).get_indexer(operacoes['Ticker'])
+    eventos = recebidos.stack()
+    eventos = eventos[eventos != 0]
+    fluxos_longos = pd.DataFrame({
+        'Grupo': np.concatenate([codigos, tickers.get_indexer(eventos.index.get_level_values('Ticker')), np.arange(len(tickers))]),
+        'Data': np.concatenate([operacoes['Data'].to_numpy(), eventos.index.get_level_values('Data').to_numpy(), np.repeat(datas[-1].to_datetime64(), len(tickers))]),
+        'Valor': np.concatenate([-operacoes['Valor'].to_numpy(), eventos.to_numpy(), valores.iloc[-1].to_numpy()]),
+    })
+    fluxos_longos = pd.concat([fluxos_longos, fluxos_longos.assign(Grupo=len(tickers))], ignore_index=True)
+
+    inicio_grupo = fluxos_longos.groupby('Grupo')['Data'].transform('min')
+    anos = (fluxos_longos['Data'] - inicio_grupo).dt.days.to_numpy() / DIAS_ANO
+    xirr = calcular_xirr(fluxos_longos['Grupo'].to_numpy(), anos, fluxos_longos['Valor'].to_numpy(), len(tickers) + 1)
+
+    # TWR: ativos nas colunas e a carteira (soma dos ativos) como última coluna
+    matriz_valores = valores.to_numpy()
+    matriz_fluxos = fluxos.to_numpy()
+    matriz_compras = np.clip(matriz_fluxos, 0.0, None)
+    matriz_vendas = np.clip(-matriz_fluxos, 0.0, None) + recebidos.to_numpy()
+    twr = calcular_twr(
+        np.column_stack([matriz_valores, matriz_valores.sum(axis=1)]),
+        np.column_stack([matriz_compras, matriz_compras.sum(axis=1)]),
+        np.column_stack([matriz_vendas, matriz_vendas.sum(axis=1)])
+    )
+    primeira_data = fluxos_longos.groupby('Grupo')['Data'].min().reindex(range(len(tickers) + 1))
+    twr_anual = _anualizar(twr, (datas[-1] - primeira_data).dt.days.to_numpy())
+
+    por_ativo = pd.DataFrame({
+        'Ticker': tickers,
+        'XIRR a.a.': xirr[:-1],
+        'TWR': twr[:-1],
+        'TWR a.a.': twr_anual[:-1],
+    })[COLUNAS_RENTABILIDADE]
+
+    return {
+        'por_ativo': por_ativo.sort_values('Ticker').reset_index(drop=True),
+        'xirr': xirr[-1],
+        'twr': twr[-1],
+        'twr_anual': twr_anual[-1],
+    }
@@ -11,10 +11,10 @@ load_dotenv(".env.desenvolvimento")
 
 from preprocessamento import (
     carregar_movimentacoes, 
-    carregar_movimentacoes_streamlit,
     carregar_fusoes_desdobramentos,
     filtrar_fii,
-    filtrar_acoes
+    filtrar_acoes,
+    relatorio_memoria
 )
 
 import streamlit as st
@@ -28,7 +28,7 @@ import pandas as pd
 
 
 
-from paginas import pagina_acoes, pagina_fii
+from paginas import pagina_acoes, pagina_fii, carregar_movimentacoes_streamlit
 
 from paginas.commons import (
     obter_tema_streamlit,
@@ -60,7 +60,8 @@ df_movimentacoes = st.session_state['dados-movimentacoes']
 df_fusoes_desdobramentos = st.session_state['dados-fusoes']
 
 print(' ------------------------- df_movimentacoes -------------------------')
-df_movimentacoes.info()
+df_movimentacoes.info(memory_usage='deep')
+print(relatorio_memoria(df_movimentacoes))
 
 print(' ------------------------- df_fusoes_desdobramentos -------------------------')
 df_fusoes_desdobramentos.info()
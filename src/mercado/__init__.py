@@ -0,0 +1,36 @@
+from .status_invest import (
+    obter_dados_fii,
+    obter_dados_fiis,
+    preparar_historicos_fii,
+    obter_fiis_por_categoria_segmento
+)
+from .cotacoes import (
+    obter_ultimos_precos,
+    obter_historico_fechamentos,
+    obter_marca_cotacoes
+)
+from .historico import (
+    atualizar_historicos,
+    obter_historico_mercado,
+    obter_historico_ticker,
+    ler_historico_local
+)
+from .provedores import (
+    ProvedorMercado,
+    ProvedorOnline,
+    ProvedorLocal,
+    obter_provedor,
+    definir_provedor
+)
+from .coleta import (
+    coletar_em_paralelo,
+    limitar_host
+)
+from .cliente_status_invest import (
+    ClienteStatusInvest
+)
+from .pagina_fii import (
+    indexar_pagina_fii,
+    extrair_fundamentos_fii,
+    obter_tempos_parser
+)
\ No newline at end of file
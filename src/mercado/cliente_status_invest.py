@@ -0,0 +1,147 @@
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from .coleta import HOST_STATUS_INVEST, LIMITES_POR_HOST, MAX_COLETORES, coletar_em_paralelo, limitar_host
+
+####################################################################################################################################
+# Cliente HTTP do StatusInvest: conexões reaproveitadas (keep-alive), timeouts e novas tentativas com espera aleatória
+####################################################################################################################################
+
+URL_BASE_STATUS_INVEST = "https://statusinvest.com.br"
+CAMINHO_FII = "/fundos-imobiliarios/{ticker}"
+CAMINHO_SEGMENTOS = "/sector/getcompanies"
+
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+HEADERS_API_STATUS_INVEST = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/138.0.0.0 Safari/537.36"
+    ),
+    "Accept": "*/*",
+    "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Referer": "https://statusinvest.com.br/fundos-imobiliarios",
+    "Origin": "https://statusinvest.com.br",
+    "Sec-Fetch-Site": "same-origin",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Dest": "empty",
+}
+
+# Segundos para abrir a conexão e para esperar cada leitura da resposta
+TIMEOUT_CONEXAO = 5.0
+TIMEOUT_LEITURA = 20.0
+
+# Respostas que valem uma nova tentativa (excesso de requisições e falhas temporárias do servidor)
+STATUS_REPETIR = {429, 500, 502, 503, 504}
+TENTATIVAS = 4
+ESPERA_BASE = 0.5
+ESPERA_MAXIMA = 8.0
+
+
+class ClienteStatusInvest:
+    """
+    Acesso ao StatusInvest por uma única requests.Session, com um pool de conexões mantidas abertas
+    entre requisições (sem um novo handshake TCP+TLS a cada página). Cada requisição tem timeout de
+    conexão e de leitura, ocupa uma vaga do servidor (limitar_host) e é repetida em 429/5xx e em
+    falhas de conexão, com espera exponencial aleatória (ou o Retry-After do servidor).
+
+    `url_base` permite apontar o cliente para outro servidor (ex.: um servidor local de testes).
+    """
+
+    def __init__(
+            self,
+            url_base: str = URL_BASE_STATUS_INVEST,
+            timeout: tuple[float, float] = (TIMEOUT_CONEXAO, TIMEOUT_LEITURA),
+            tentativas: int = TENTATIVAS,
+            espera_base: float = ESPERA_BASE,
+            espera_maxima: float = ESPERA_MAXIMA):
+        self.url_base = url_base.rstrip('/')
+        self.timeout = timeout
+        self.tentativas = tentativas
+        self.espera_base = espera_base
+        self.espera_maxima = espera_maxima
+
+        # O limite de requisições simultâneas do StatusInvest vale para o servidor real; outro servidor tem o seu
+        self.host = HOST_STATUS_INVEST if self.url_base == URL_BASE_STATUS_INVEST else urlsplit(self.url_base).netloc
+
+        self._sessao: requests.Session | None = None
+        self._lock_sessao = threading.Lock()
+
+    def _obter_sessao(self) -> requests.Session:
+        with self._lock_sessao:
+            if self._sessao is None:
+                tamanho_pool = max(LIMITES_POR_HOST.get(self.host, 1), MAX_COLETORES)
+                sessao = requests.Session()
+                sessao.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=tamanho_pool))
+                sessao.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=tamanho_pool))
+                self._sessao = sessao
+            return self._sessao
+
+    def _espera(self, tentativa: int, resposta: requests.Response | None) -> float:
+        """Retry-After do servidor, se houver; senão uma espera aleatória entre 0 e base·2^tentativa (limitada)."""
+        if resposta is not None:
+            retry_after = resposta.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.espera_maxima)
+        return random.uniform(0, min(self.espera_maxima, self.espera_base * 2 ** tentativa))
+
+    def get(self, caminho: str, params: dict | None = None, headers: dict | None = None) -> requests.Response:
+        """GET em url_base + caminho com as novas tentativas; falhas definitivas levantam requests.RequestException."""
+        sessao = self._obter_sessao()
+        url = self.url_base + caminho
+
+        for tentativa in range(self.tentativas):
+            resposta = None
+            ultima = tentativa == self.tentativas - 1
+            try:
+                with limitar_host(self.host):
+                    resposta = sessao.get(url, params=params, headers=headers or HEADERS, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if ultima:
+                    raise
+            else:
+                if resposta.status_code not in STATUS_REPETIR or ultima:
+                    resposta.raise_for_status()
+                    return resposta
+
+            time.sleep(self._espera(tentativa, resposta))
+
+    def obter_pagina_fii(self, ticker: str) -> str:
+        return self.get(CAMINHO_FII.format(ticker=ticker.lower())).text
+
+    def obter_paginas_fii(self, tickers: list[str], max_coletores: int = MAX_COLETORES) -> dict[str, str | None]:
+        """Páginas de vários FIIs em paralelo, pelas mesmas conexões; ticker → HTML (None se a busca falhar)."""
+        tickers = list(tickers)
+        return dict(zip(tickers, coletar_em_paralelo(tickers, self.obter_pagina_fii, max_coletores=max_coletores)))
+
+    def listar_fiis_segmento(self, segmento_id: int, categoria_id: int = 2) -> pd.DataFrame:
+        params = {
+            "categoryType": categoria_id,
+            "segmentoId": segmento_id
+        }
+        try:
+            response = self.get(CAMINHO_SEGMENTOS, params=params, headers=HEADERS_API_STATUS_INVEST)
+        except requests.HTTPError as e:
+            raise ValueError(f"Erro na requisição: {e.response.status_code}\nResposta: {e.response.text}") from e
+
+        resposta_json = response.json()
+
+        # Verifica se a chave 'success' é True e 'data' existe
+        if not resposta_json.get("success", False) or "data" not in resposta_json:
+            raise ValueError("Resposta da API inválida ou vazia")
+
+        # Converte a lista de dicionários em DataFrame pandas
+        return pd.DataFrame(resposta_json["data"])
+
+    def fechar(self) -> None:
+        with self._lock_sessao:
+            if self._sessao is not None:
+                self._sessao.close()
+                self._sessao = None
@@ -0,0 +1,71 @@
+import contextlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable
+
+####################################################################################################################################
+# Coleta em paralelo: um pool limitado de threads e um limite de requisições simultâneas por servidor
+####################################################################################################################################
+
+# Tarefas simultâneas do pool (cada uma fica quase todo o tempo esperando a rede)
+MAX_COLETORES = 8
+
+# Requisições simultâneas por servidor, para não ser bloqueado por excesso de acessos
+HOST_YAHOO = 'finance.yahoo.com'
+HOST_STATUS_INVEST = 'statusinvest.com.br'
+LIMITES_POR_HOST = {
+    HOST_YAHOO: 4,
+    HOST_STATUS_INVEST: 3,
+}
+LIMITE_PADRAO_HOST = 2
+
+_semaforos_host: dict[str, threading.BoundedSemaphore] = {}
+_lock_semaforos = threading.Lock()
+
+
+@contextlib.contextmanager
+def limitar_host(host: str):
+    """Ocupa uma das vagas de `host` (LIMITES_POR_HOST) enquanto o bloco with roda, esperando se não houver vaga."""
+    with _lock_semaforos:
+        if host not in _semaforos_host:
+            _semaforos_host[host] = threading.BoundedSemaphore(LIMITES_POR_HOST.get(host, LIMITE_PADRAO_HOST))
+        semaforo = _semaforos_host[host]
+
+    with semaforo:
+        yield
+
+
+def coletar_em_paralelo(
+        itens: list,
+        funcao: Callable,
+        max_coletores: int = MAX_COLETORES,
+        ao_concluir: Callable | None = None,
+        inicializar_thread: Callable | None = None) -> list:
+    """
+    Aplica `funcao` a cada item em um pool de até `max_coletores` threads e devolve os resultados na
+    ordem de `itens` (None para os que falharem). O tempo total fica perto do da coleta mais lenta, em
+    vez da soma de todas.
+
+    `ao_concluir(concluidos, item, resultado, erro)` é chamado na thread de quem chamou (onde é seguro
+    atualizar a interface), na ordem em que as coletas terminam. `inicializar_thread` roda uma vez
+    em cada thread do pool, antes das coletas.
+    """
+    resultados = [None] * len(itens)
+    if not itens:
+        return resultados
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_coletores, len(itens))), initializer=inicializar_thread) as pool:
+        futuros = {pool.submit(funcao, item): i for i, item in enumerate(itens)}
+
+        for concluidos, futuro in enumerate(as_completed(futuros), 1):
+            i = futuros[futuro]
+            erro = futuro.exception()
+            if erro is None:
+                resultados[i] = futuro.result()
+            elif ao_concluir is None:
+                print(f"Erro ao coletar dados de {itens[i]}: {str(erro)}")
+
+            if ao_concluir is not None:
+                ao_concluir(concluidos, itens[i], resultados[i], erro)
+
+    return resultados
@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pandas as pd
+
+from .provedores import obter_provedor
+
+####################################################################################################################################
+# Cotações mais recentes, buscadas em lote no provedor de mercado (Yahoo Finance, por padrão)
+####################################################################################################################################
+
+# Por quanto tempo uma cotação já buscada é reaproveitada
+TTL_COTACOES_SEGUNDOS = 5 * 60
+
+_cache_cotacoes: dict[tuple[str, str], tuple[float, float]] = {}  # (provedor, ticker) → (instante da busca, último fechamento)
+_lock_cotacoes = threading.Lock()
+
+
+def _baixar_campos(tickers: list[str], campos: list[str], inicio=None, fim=None, periodo: str | None = None) -> dict[str, pd.DataFrame]:
+    """
+    Séries diárias (datas × tickers) de vários tickers da B3 em um único download do provedor atual,
+    uma matriz por campo pedido ('Close', 'Dividends'...), entre `inicio` e `fim` ou no `periodo` mais recente.
+    """
+    return obter_provedor().baixar_series(tickers, campos, inicio=inicio, fim=fim, periodo=periodo)
+
+
+def _baixar_fechamentos(tickers: list[str], **parametros) -> pd.DataFrame:
+    """Fechamentos diários (datas × tickers) de vários tickers da B3 em um único download."""
+    return _baixar_campos(tickers, ['Close'], **parametros)['Close']
+
+
+def _baixar_ultimos_fechamentos(tickers: list[str]) -> pd.Series:
+    """Último fechamento de cada ticker da B3, em um único download para todos os símbolos."""
+    fechamentos = _baixar_fechamentos(tickers, periodo='5d')
+    if fechamentos.empty:
+        return pd.Series(dtype='float64')
+
+    return fechamentos.ffill().iloc[-1].dropna()
+
+
+def obter_marca_cotacoes(ttl: float = TTL_COTACOES_SEGUNDOS) -> int:
+    """
+    Janela de validade atual das cotações (muda a cada `ttl` segundos). Usada junto da impressão
+    das movimentações como chave de cache dos cálculos que dependem do preço atual.
+    """
+    return int(time.time() // ttl)
+
+
+def obter_ultimos_precos(tickers, ttl: float = TTL_COTACOES_SEGUNDOS) -> pd.Series:
+    """
+    Retorna uma Series ticker → último fechamento. Os tickers sem cotação recente no cache são
+    buscados todos juntos em um único download; os que não tiverem cotação ficam com 0.
+    """
+    tickers = list(dict.fromkeys(str(ticker) for ticker in tickers))
+    provedor = obter_provedor().nome
+    agora = time.time()
+
+    with _lock_cotacoes:
+        faltando = [t for t in tickers if (provedor, t) not in _cache_cotacoes or agora - _cache_cotacoes[provedor, t][0] > ttl]
+
+    if faltando:
+        try:
+            baixados = _baixar_ultimos_fechamentos(faltando)
+        except Exception as e:
+            print(f"Erro ao buscar cotações de {faltando}: {str(e)}")
+            baixados = pd.Series(dtype='float64')
+
+        with _lock_cotacoes:
+            for ticker, preco in baixados.items():
+                _cache_cotacoes[provedor, ticker] = (agora, float(preco))
+
+    with _lock_cotacoes:
+        precos = {t: _cache_cotacoes[provedor, t][1] if (provedor, t) in _cache_cotacoes else 0.0 for t in tickers}
+
+    return pd.Series(precos, index=tickers, dtype='float64')
+
+
+def obter_historico_fechamentos(tickers, inicio, fim=None) -> pd.DataFrame:
+    """
+    Matriz de fechamentos diários (índice Data × colunas Ticker) entre `inicio` e `fim` (hoje, se omitido),
+    obtida em um único download. Tickers sem histórico ficam de fora; erros retornam uma matriz vazia.
+    """
+    tickers = list(dict.fromkeys(str(ticker) for ticker in tickers))
+    if not tickers:
+        return pd.DataFrame(dtype='float64')
+
+    inicio = pd.Timestamp(inicio).normalize()
+    fim = pd.Timestamp(fim).normalize() if fim is not None else pd.Timestamp.today().normalize()
+
+    try:
+        return _baixar_fechamentos(tickers, inicio=inicio, fim=fim).dropna(axis=1, how='all')
+    except Exception as e:
+        print(f"Erro ao buscar histórico de cotações de {tickers}: {str(e)}")
+        return pd.DataFrame(dtype='float64')
@@ -0,0 +1,249 @@
+import os
+import time
+
+import pandas as pd
+
+from preprocessamento.cache import obter_dir_cache
+
+from .cotacoes import _baixar_campos
+from .provedores import ProvedorOnline, obter_provedor
+
+####################################################################################################################################
+# Histórico diário (OHLCV + proventos) guardado em disco, um Parquet por ticker, completado só nas lacunas
+####################################################################################################################################
+
+CAMPOS_HISTORICO = ['Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Stock Splits']
+
+# Colunas que o Yahoo ajusta pelos proventos (o volume não muda)
+CAMPOS_PRECO = ['Open', 'High', 'Low', 'Close']
+
+# Por quanto tempo o último pregão já gravado é considerado atual (o pregão do dia pode estar em andamento)
+TTL_HISTORICO_SEGUNDOS = 60 * 60
+
+# Fuso das cotações da B3, usado para devolver o histórico no mesmo formato do yf.Ticker.history
+FUSO_B3 = 'America/Sao_Paulo'
+
+
+def obter_dir_historico():
+    """Uma pasta por provedor de mercado, para o histórico real nunca se misturar com o de fixtures."""
+    provedor = obter_provedor()
+    return obter_dir_cache() / ('historico' if provedor.nome == ProvedorOnline.nome else f'historico_{provedor.nome}')
+
+
+def _path_historico(ticker: str):
+    return obter_dir_historico() / f'{ticker.upper()}.parquet'
+
+
+def ler_historico_local(ticker: str) -> pd.DataFrame:
+    """
+    Histórico gravado do ticker (índice Data × CAMPOS_HISTORICO), ou vazio. Os attrs guardam o intervalo
+    já consultado no Yahoo (consultado_desde/consultado_ate) e o instante da última consulta (atualizado_em).
+    """
+    path = _path_historico(ticker)
+    if path.exists():
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            print(f"Histórico local inválido em {path}, será baixado novamente: {str(e)}")
+
+    return pd.DataFrame(columns=CAMPOS_HISTORICO, index=pd.DatetimeIndex([], name='Data'), dtype='float64')
+
+
+def _salvar_historico(ticker: str, df: pd.DataFrame) -> None:
+    path = _path_historico(ticker)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Grava em arquivo temporário e renomeia, para nunca deixar um Parquet pela metade
+        path_tmp = path.with_suffix('.parquet.tmp')
+        df.to_parquet(path_tmp)
+        os.replace(path_tmp, path)
+    except Exception as e:
+        print(f"Não foi possível salvar o histórico {path}: {str(e)}")
+
+
+def _calcular_lacunas(local: pd.DataFrame, inicio: pd.Timestamp, fim: pd.Timestamp, hoje: pd.Timestamp, agora: float, ttl: float) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+    """Intervalos de [inicio, fim] que ainda precisam ser baixados, dado o que já está gravado."""
+    if 'consultado_desde' not in local.attrs:
+        return [(inicio, fim)]
+
+    desde = pd.Timestamp(local.attrs['consultado_desde'])
+    ate = pd.Timestamp(local.attrs['consultado_ate'])
+    recente = agora - local.attrs.get('atualizado_em', 0.0) < ttl
+
+    lacunas = []
+    if inicio < desde:
+        lacunas.append((inicio, desde))
+
+    # O último pregão gravado é baixado de novo: pode ter sido gravado com o pregão em andamento
+    if fim > ate or (fim >= hoje and not recente):
+        lacunas.append((min(ate, local.index.max()) if not local.empty else ate, fim))
+
+    return lacunas
+
+
+def _baixar_historicos(tickers: list[str], inicio: pd.Timestamp, fim: pd.Timestamp) -> dict[str, pd.DataFrame]:
+    """Histórico de vários tickers no mesmo intervalo, em um único download; um DataFrame por ticker com dados."""
+    matrizes = _baixar_campos(tickers, CAMPOS_HISTORICO, inicio=inicio, fim=fim)
+
+    historicos = {}
+    for ticker in tickers:
+        df = pd.DataFrame({
+            campo: matrizes[campo][ticker] if ticker in matrizes[campo].columns else float('nan')
+            for campo in CAMPOS_HISTORICO
+        }, index=matrizes['Close'].index)
+        df = df.dropna(subset=['Close'])
+        if not df.empty:
+            historicos[ticker] = df[CAMPOS_HISTORICO].fillna({'Dividends': 0.0, 'Stock Splits': 0.0})
+    return historicos
+
+
+def _fator_proventos(local: pd.DataFrame, novo: pd.DataFrame) -> float:
+    """
+    Fator que leva os preços gravados ao ajuste atual do Yahoo, pelos proventos do trecho novo posteriores
+    ao último pregão gravado. O Yahoo multiplica os preços anteriores à data ex t por 1 − D / fechamento
+    do pregão anterior a t; quando esse pregão está no trecho novo, o fechamento dele já vem multiplicado
+    pelo fator de t e dos proventos seguintes (G), então o fator sai de f = 1 / (1 + D·G / fechamento).
+    """
+    ultimo = local.index.max()
+    proventos = novo.loc[(novo.index > ultimo) & (novo['Dividends'] > 0), 'Dividends']
+
+    fator = 1.0
+    for data, valor in proventos[::-1].items():
+        anteriores = novo.loc[novo.index < data, 'Close']
+        if not anteriores.empty and anteriores.index[-1] >= ultimo:
+            fator *= 1 / (1 + valor * fator / anteriores.iloc[-1])
+        else:
+            fator *= 1 - valor / local.loc[ultimo, 'Close']
+    return fator
+
+
+def atualizar_historicos(tickers, inicio, fim=None, ttl: float = TTL_HISTORICO_SEGUNDOS) -> dict[str, pd.DataFrame]:
+    """
+    Histórico diário de cada ticker entre `inicio` e `fim` (hoje, se omitido), a partir do que já está
+    gravado em disco. Só as lacunas são baixadas: os dias anteriores ao que já foi consultado e os
+    pregões depois do último gravado. Tickers com a mesma lacuna são baixados juntos, em um único
+    download.
+
+    Os preços do Yahoo são ajustados por proventos e desdobramentos. Um provento no trecho novo é
+    aplicado aos preços gravados aqui mesmo, com o fator do Yahoo (_fator_proventos), sem baixar nada
+    além da lacuna (só para provedores com ajusta_proventos); só um desdobramento faz o histórico do
+    ticker ser baixado inteiro de novo. Tickers sem histórico ficam de fora do resultado.
+    """
+    tickers = list(dict.fromkeys(str(ticker).upper() for ticker in tickers))
+    hoje = pd.Timestamp.today().normalize()
+    inicio = pd.Timestamp(inicio).normalize()
+    fim = min(pd.Timestamp(fim).normalize(), hoje) if fim is not None else hoje
+    agora = time.time()
+    ajusta_proventos = obter_provedor().ajusta_proventos
+
+    locais = {ticker: ler_historico_local(ticker) for ticker in tickers}
+
+    lacunas: dict[tuple[pd.Timestamp, pd.Timestamp], list[str]] = {}
+    for ticker, local in locais.items():
+        for lacuna in _calcular_lacunas(local, inicio, fim, hoje, agora, ttl):
+            lacunas.setdefault(lacuna, []).append(ticker)
+
+    alterados, refazer = set(), set()
+    for (de, ate), grupo in lacunas.items():
+        try:
+            baixados = _baixar_historicos(grupo, de, ate)
+        except Exception as e:
+            print(f"Erro ao baixar histórico de {grupo} entre {de.date()} e {ate.date()}: {str(e)}")
+            continue
+
+        for ticker in grupo:
+            local = locais[ticker]
+            novo = baixados.get(ticker)
+            if novo is not None and not local.empty:
+                posteriores = novo[novo.index > local.index.max()]
+                if (posteriores['Stock Splits'] > 0).any():
+                    refazer.add(ticker)
+                    continue
+
+                fator = _fator_proventos(local, novo) if ajusta_proventos else 1.0
+                if fator != 1.0:
+                    atributos = local.attrs
+                    local = local.copy()
+                    local[CAMPOS_PRECO] *= fator
+                    local.attrs = atributos
+
+            atributos = local.attrs
+            if novo is not None:
+                local = novo if local.empty else pd.concat([local, novo])
+                local = local[~local.index.duplicated(keep='last')].sort_index()
+
+            desde = pd.Timestamp(atributos.get('consultado_desde', de))
+            ate_anterior = pd.Timestamp(atributos.get('consultado_ate', ate))
+            local.attrs = {
+                'consultado_desde': min(desde, de).isoformat(),
+                'consultado_ate': max(ate_anterior, ate).isoformat(),
+                'atualizado_em': agora,
+            }
+            locais[ticker] = local
+            alterados.add(ticker)
+
+    # Histórico inteiro de novo para quem teve desdobramento no trecho novo
+    grupos_refazer: dict[pd.Timestamp, list[str]] = {}
+    for ticker in refazer:
+        desde = min(pd.Timestamp(locais[ticker].attrs.get('consultado_desde', inicio)), inicio)
+        grupos_refazer.setdefault(desde, []).append(ticker)
+
+    for desde, grupo in grupos_refazer.items():
+        try:
+            baixados = _baixar_historicos(grupo, desde, fim)
+        except Exception as e:
+            print(f"Erro ao baixar histórico de {grupo}: {str(e)}")
+            continue
+
+        for ticker, novo in baixados.items():
+            novo.attrs = {'consultado_desde': desde.isoformat(), 'consultado_ate': fim.isoformat(), 'atualizado_em': agora}
+            locais[ticker] = novo
+            alterados.add(ticker)
+
+    for ticker in alterados:
+        _salvar_historico(ticker, locais[ticker])
+
+    return {
+        ticker: local.loc[inicio:fim]
+        for ticker, local in locais.items()
+        if not local.loc[inicio:fim].empty
+    }
+
+
+def obter_historico_ticker(ticker: str, inicio, fim=None) -> pd.DataFrame:
+    """
+    Histórico de um ticker no formato do yf.Ticker.history (índice Date no fuso da B3, colunas
+    CAMPOS_HISTORICO), servido do histórico gravado em disco. Vazio se não houver dados.
+    """
+    historico = atualizar_historicos([ticker], inicio, fim).get(ticker.upper())
+    if historico is None:
+        return pd.DataFrame(columns=CAMPOS_HISTORICO, dtype='float64')
+
+    historico = historico.copy()
+    historico.index = historico.index.tz_localize(FUSO_B3).rename('Date')
+    return historico
+
+
+def obter_historico_mercado(tickers, inicio, fim=None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Fechamentos e proventos entre `inicio` e `fim` (hoje, se omitido), servidos do histórico em disco
+    (só as lacunas são baixadas, em lote):
+
+    - fechamentos: matriz índice Data × colunas Ticker, como em obter_historico_fechamentos;
+    - dividendos: uma linha por provento, com Ticker, Data (data ex) e Valor (por cota/ação).
+    """
+    colunas_dividendos = ['Ticker', 'Data', 'Valor']
+    historicos = atualizar_historicos(tickers, inicio, fim)
+    if not historicos:
+        return pd.DataFrame(dtype='float64'), pd.DataFrame(columns=colunas_dividendos)
+
+    fechamentos = pd.DataFrame({ticker: df['Close'] for ticker, df in historicos.items()}).rename_axis(index='Data', columns='Ticker')
+
+    dividendos = pd.concat([
+        df.loc[df['Dividends'] > 0, ['Dividends']].assign(Ticker=ticker)
+        for ticker, df in historicos.items()
+    ])
+    dividendos = dividendos.rename(columns={'Dividends': 'Valor'}).rename_axis('Data').reset_index()[colunas_dividendos]
+
+    return fechamentos, dividendos.reset_index(drop=True)
@@ -0,0 +1,290 @@
+import importlib.util
+import threading
+import time
+from html.parser import HTMLParser
+
+from utils import parse_percent
+
+####################################################################################################################################
+# Leitura da página do FII no StatusInvest em uma única passada: índice rótulo → valor e conversão de cada indicador
+####################################################################################################################################
+
+# Rótulo de cada indicador na página: (tag do rótulo, texto, se o texto é exato ou só contido, classe do valor).
+# O valor é o primeiro elemento <strong class="value"> (ou <span class="value">) depois do rótulo, e o
+# Dividend Yield vem do <div> com esse title.
+CAMPOS_PAGINA_FII = {
+    "valor_atual": ("h3", "Valor atual", True, "strong"),
+    "dividend_yield_12m": ("div", "Dividend Yield", False, "strong"),
+    "valor_patrimonial_p_cota": ("h3", "Val. patrimonial", False, "strong"),
+    "pvp": ("h3", "P/VP", True, "strong"),
+    "rendimento_mensal_medio_24m": ("h3", "MENSAL MÉDIO", False, "strong"),
+    "liquidez_media_diaria": ("span", "Liquidez média diária", False, "strong"),
+    "participacao_ifix": ("h3", "IFIX", False, "strong"),
+    "valor_em_caixa": ("span", "Valor em caixa", False, "strong"),
+    "patrimonio_total": ("span", "Patrimônio", False, "strong"),
+    "numero_cotistas": ("span", "Número de cotistas", False, "strong"),
+    "numero_cotas": ("span", "Número de cotas", False, "strong"),
+    "valorizacao_12m": ("span", "Valorização 12 meses", False, "strong"),
+    "valorizacao_mensal": ("span", "Valorização no mês", False, "strong"),
+    "dy_cagr_3y": ("span", "CAGR 3 anos", False, "span"),
+    "dy_cagr_5y": ("span", "CAGR 5 anos", False, "span"),
+    "segmento": ("span", "Segmento", False, "strong"),
+    "tipo_gestao": ("span", "Tipo da gestão", False, "strong"),
+    "publico_alvo": ("span", "Público-alvo", False, "strong"),
+}
+
+
+def _numero(valor: str) -> float:
+    return float(valor.replace(".", "").replace(",", "."))
+
+
+def _decimal(valor: str) -> float:
+    return float(valor.replace(",", "."))
+
+
+def _moeda(valor: str) -> float:
+    return _numero(valor.replace("R$", ""))
+
+
+def _inteiro(valor: str) -> int:
+    return int(valor.replace(".", ""))
+
+
+def _percentual(valor: str) -> float:
+    return _decimal(valor.replace("%", ""))
+
+
+CONVERSORES_PAGINA_FII = {
+    "valor_atual": _numero,
+    "dividend_yield_12m": parse_percent,
+    "valor_patrimonial_p_cota": _numero,
+    "pvp": _decimal,
+    "rendimento_mensal_medio_24m": _decimal,
+    "liquidez_media_diaria": _numero,
+    "participacao_ifix": _decimal,
+    "valor_em_caixa": _moeda,
+    "patrimonio_total": _moeda,
+    "numero_cotistas": _inteiro,
+    "numero_cotas": _inteiro,
+    "valorizacao_12m": _percentual,
+    "valorizacao_mensal": _percentual,
+    "dy_cagr_3y": _percentual,
+    "dy_cagr_5y": _percentual,
+    "segmento": str,
+    "tipo_gestao": str,
+    "publico_alvo": str,
+}
+
+TAGS_ROTULO = {"h3", "span"}
+TAGS_VALOR = {"strong", "span"}
+
+# Elementos sem conteúdo nem tag de fechamento no HTML
+TAGS_VAZIAS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+def _lxml_disponivel() -> bool:
+    return importlib.util.find_spec('lxml') is not None
+
+
+class _Elemento:
+    __slots__ = ('tag', 'valor', 'textos', 'inicio', 'filhos', 'texto_direto', 'string_filho')
+
+    def __init__(self, tag: str, valor: str | None, inicio: int):
+        self.tag = tag
+        self.valor = valor          # 'strong'/'span' se tiver a classe value
+        self.textos = []            # todo o texto dentro do elemento (só para valores)
+        self.inicio = inicio        # rótulos já vistos quando o elemento abriu
+        self.filhos = 0             # nós filhos: elementos e trechos de texto
+        self.texto_direto = None    # lista de partes do texto filho, se o último filho for texto
+        self.string_filho = None    # .string do último elemento filho
+
+    def string(self) -> str | None:
+        """Como o .string do BeautifulSoup: o texto do único filho, descendo por um único elemento filho."""
+        if self.filhos != 1:
+            return None
+        return "".join(self.texto_direto) if self.texto_direto is not None else self.string_filho
+
+
+class _IndexadorPagina:
+    """
+    Recebe os eventos do parser (abertura, texto e fechamento de cada tag), na ordem do documento, e
+    monta o índice de rótulos sem guardar a árvore. Serve de target do parser do lxml e, sem o lxml,
+    é alimentado pelo HTMLParser da biblioteca padrão.
+    """
+
+    def __init__(self):
+        self.rotulos: list[list] = []   # [tag, texto, próximo strong.value, próximo span.value]
+        self.titulos: list[list] = []   # [title do div, primeiro strong.value dentro dele]
+        self._abertos: list[_Elemento] = []
+        self._valores_abertos: list[_Elemento] = []
+        self._titulos_abertos: list[tuple[_Elemento, int]] = []
+        self._pendentes = {"strong": 0, "span": 0}  # primeiro rótulo ainda sem valor de cada classe
+
+    def start(self, tag: str, atributos) -> None:
+        if self._abertos:
+            pai = self._abertos[-1]
+            pai.filhos += 1
+            pai.texto_direto = None
+
+        classes = (atributos.get("class") or "").split()
+        elemento = _Elemento(tag, tag if tag in TAGS_VALOR and "value" in classes else None, len(self.rotulos))
+        self._abertos.append(elemento)
+        if elemento.valor is not None:
+            self._valores_abertos.append(elemento)
+        if tag == "div" and atributos.get("title"):
+            self._titulos_abertos.append((elemento, len(self.titulos)))
+            self.titulos.append([atributos["title"], None])
+
+        if tag in TAGS_VAZIAS:
+            self._fechar_ultimo()
+
+    def data(self, texto: str) -> None:
+        if self._abertos:
+            pai = self._abertos[-1]
+            if pai.texto_direto is None:
+                pai.filhos += 1
+                pai.texto_direto = []
+            pai.texto_direto.append(texto)
+        for elemento in self._valores_abertos:
+            elemento.textos.append(texto)
+
+    def end(self, tag: str) -> None:
+        if tag in TAGS_VAZIAS:
+            return
+
+        # Fecha até a tag correspondente (o HTMLParser da biblioteca padrão não corrige tags sem
+        # fechamento); um fechamento sem abertura correspondente é ignorado
+        for i in range(len(self._abertos) - 1, -1, -1):
+            if self._abertos[i].tag == tag:
+                while len(self._abertos) > i:
+                    self._fechar_ultimo()
+                return
+
+    def _fechar_ultimo(self) -> None:
+        elemento = self._abertos.pop()
+        string = elemento.string()
+        if self._abertos:
+            self._abertos[-1].string_filho = string
+
+        if elemento.valor is not None:
+            self._valores_abertos.pop()
+            valor = "".join(elemento.textos).strip()
+
+            # O valor é o próximo de cada rótulo fechado antes da abertura dele
+            coluna = 2 if elemento.valor == "strong" else 3
+            for i in range(self._pendentes[elemento.valor], elemento.inicio):
+                self.rotulos[i][coluna] = valor
+            self._pendentes[elemento.valor] = max(self._pendentes[elemento.valor], elemento.inicio)
+
+            if elemento.valor == "strong":
+                for _, indice in self._titulos_abertos:
+                    if self.titulos[indice][1] is None:
+                        self.titulos[indice][1] = valor
+
+        if self._titulos_abertos and self._titulos_abertos[-1][0] is elemento:
+            self._titulos_abertos.pop()
+
+        if elemento.tag in TAGS_ROTULO and string is not None and string.strip():
+            self.rotulos.append([elemento.tag, string, None, None])
+
+    def close(self) -> None:
+        while self._abertos:
+            self._fechar_ultimo()
+
+
+class _HTMLParserPadrao(HTMLParser):
+    """Adapta o HTMLParser da biblioteca padrão à interface de target do lxml."""
+
+    def __init__(self, indexador: _IndexadorPagina):
+        super().__init__(convert_charrefs=True)
+        self.indexador = indexador
+
+    def handle_starttag(self, tag, attrs):
+        self.indexador.start(tag, dict(attrs))
+
+    def handle_startendtag(self, tag, attrs):
+        self.indexador.start(tag, dict(attrs))
+        self.indexador.end(tag)
+
+    def handle_endtag(self, tag):
+        self.indexador.end(tag)
+
+    def handle_data(self, data):
+        self.indexador.data(data)
+
+
+class IndicePaginaFII:
+    """Rótulos da página (com o valor que vem depois de cada um) e quanto tempo a leitura levou."""
+
+    def __init__(self, rotulos: list[list], titulos: list[list], motor: str, duracao: float):
+        self.rotulos = rotulos
+        self.titulos = titulos
+        self.motor = motor
+        self.duracao = duracao
+
+    def valor(self, tag: str, texto: str, exato: bool = False, classe_valor: str = "strong") -> str | None:
+        """Valor do primeiro rótulo `tag` com o texto (igual ou contido); None se não houver."""
+        if tag == "div":
+            candidatos = ((titulo, valor) for titulo, valor in self.titulos)
+        else:
+            coluna = 2 if classe_valor == "strong" else 3
+            candidatos = ((rotulo[1], rotulo[coluna]) for rotulo in self.rotulos if rotulo[0] == tag)
+
+        for rotulo, valor in candidatos:
+            if (rotulo.strip() == texto) if exato else (texto in rotulo):
+                return valor
+        return None
+
+
+_lock_tempos = threading.Lock()
+_tempos_parser = {"paginas": 0, "segundos": 0.0}
+
+
+def indexar_pagina_fii(html: str, motor: str | None = None) -> IndicePaginaFII:
+    """
+    Percorre o HTML uma única vez e devolve o índice rótulo → valor. Usa o parser do lxml quando o
+    pacote estiver instalado (motor='lxml'), e o da biblioteca padrão caso contrário ('html.parser').
+    """
+    motor = motor or ('lxml' if _lxml_disponivel() else 'html.parser')
+    inicio = time.perf_counter()
+
+    indexador = _IndexadorPagina()
+    if motor == 'lxml':
+        from lxml import etree
+
+        parser = etree.HTMLParser(target=indexador)
+        parser.feed(html or "<html></html>")
+        parser.close()
+    else:
+        parser = _HTMLParserPadrao(indexador)
+        parser.feed(html or "")
+        parser.close()
+        indexador.close()
+
+    duracao = time.perf_counter() - inicio
+    with _lock_tempos:
+        _tempos_parser["paginas"] += 1
+        _tempos_parser["segundos"] += duracao
+
+    return IndicePaginaFII(indexador.rotulos, indexador.titulos, motor, duracao)
+
+
+def extrair_fundamentos_fii(pagina: str | IndicePaginaFII) -> dict[str, any]:
+    """Indicadores de CAMPOS_PAGINA_FII a partir do HTML (ou do índice já montado); None nos que faltarem ou não converterem."""
+    indice = pagina if isinstance(pagina, IndicePaginaFII) else indexar_pagina_fii(pagina)
+
+    fundamentos = {}
+    for campo, (tag, texto, exato, classe_valor) in CAMPOS_PAGINA_FII.items():
+        valor = indice.valor(tag, texto, exato, classe_valor)
+        try:
+            fundamentos[campo] = CONVERSORES_PAGINA_FII[campo](valor) if valor is not None else None
+        except Exception:
+            fundamentos[campo] = None
+    return fundamentos
+
+
+def obter_tempos_parser() -> dict[str, float]:
+    """Páginas lidas por indexar_pagina_fii neste processo, tempo total e médio (ms) por página."""
+    with _lock_tempos:
+        paginas, segundos = _tempos_parser["paginas"], _tempos_parser["segundos"]
+    return {"paginas": paginas, "segundos": segundos, "media_ms": 1000 * segundos / paginas if paginas else 0.0}
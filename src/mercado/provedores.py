@@ -0,0 +1,351 @@
+import json
+import os
+from abc import ABC, abstractmethod
+import pathlib
+import zlib
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .cliente_status_invest import URL_BASE_STATUS_INVEST, ClienteStatusInvest
+from .coleta import HOST_YAHOO, limitar_host
+
+####################################################################################################################################
+# Provedores de dados de mercado: a fonte real (Yahoo + StatusInvest) ou uma fonte local determinística (fixtures/sintética)
+####################################################################################################################################
+
+
+def _padronizar_matriz(matriz: pd.DataFrame) -> pd.DataFrame:
+    """Colunas Ticker (sem .SA) e índice Data sem fuso, normalizado para o dia."""
+    matriz = matriz.rename(columns=lambda simbolo: simbolo.removesuffix('.SA'))
+    matriz.columns.name = 'Ticker'
+
+    matriz.index = pd.DatetimeIndex(matriz.index)
+    if matriz.index.tz is not None:
+        matriz.index = matriz.index.tz_localize(None)
+    matriz.index = matriz.index.normalize().rename('Data')
+
+    return matriz.astype('float64')
+
+
+class ProvedorMercado(ABC):
+    """
+    Interface das fontes de dados de mercado usadas pelo pacote: séries diárias (preços e proventos),
+    informações do ativo, página de indicadores do FII e listagem de FIIs por segmento. Os módulos
+    de mercado obtêm o provedor atual com obter_provedor(), nunca chamando Yahoo/StatusInvest direto.
+    Um provedor que não implementar todos os métodos falha ao ser criado.
+    """
+
+    nome = 'base'
+
+    # Se os preços das séries vêm ajustados por proventos (o Yahoo reajusta os preços anteriores a cada data ex)
+    ajusta_proventos = False
+
+    @abstractmethod
+    def baixar_series(self, tickers: list[str], campos: list[str], inicio=None, fim=None, periodo: str | None = None) -> dict[str, pd.DataFrame]:
+        """
+        Séries diárias de vários tickers da B3, uma matriz (índice Data × colunas Ticker) por campo
+        ('Open', 'Close', 'Dividends'...), entre `inicio` e `fim` (inclusivo) ou no `periodo` mais recente ('5d', '6mo', '3y').
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def obter_info(self, ticker: str) -> dict[str, any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def obter_pagina_fii(self, ticker: str) -> str:
+        """HTML da página do FII no StatusInvest (ou equivalente), de onde saem os fundamentos."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def listar_fiis_segmento(self, segmento_id: int, categoria_id: int = 2) -> pd.DataFrame:
+        """FIIs de um segmento, com ao menos as colunas ticker e companyName."""
+        raise NotImplementedError
+
+
+class ProvedorOnline(ProvedorMercado):
+    """Yahoo Finance para séries e informações, StatusInvest para fundamentos e listagens."""
+
+    nome = 'online'
+    ajusta_proventos = True
+
+    def __init__(self, cliente_status_invest: ClienteStatusInvest | None = None):
+        self.cliente_status_invest = cliente_status_invest or ClienteStatusInvest(os.getenv('URL_STATUS_INVEST', URL_BASE_STATUS_INVEST))
+
+    def baixar_series(self, tickers, campos, inicio=None, fim=None, periodo=None):
+        simbolos = [f'{ticker}.SA' for ticker in tickers]
+
+        parametros = {'period': periodo} if periodo is not None else {
+            'start': inicio,
+            'end': pd.Timestamp(fim) + pd.Timedelta(days=1) if fim is not None else None,  # end do yfinance é exclusivo
+        }
+        with limitar_host(HOST_YAHOO):
+            dados = yf.download(
+                simbolos,
+                interval='1d',
+                group_by='ticker',
+                threads=True,
+                progress=False,
+                auto_adjust=True,
+                actions=any(campo in ['Dividends', 'Stock Splits'] for campo in campos),
+                **parametros
+            )
+        if dados is None or dados.empty:
+            return {campo: pd.DataFrame(dtype='float64') for campo in campos}
+
+        matrizes = {}
+        for campo in campos:
+            if isinstance(dados.columns, pd.MultiIndex):
+                matriz = dados.xs(campo, axis=1, level=1) if campo in dados.columns.get_level_values(1) else pd.DataFrame(index=dados.index)
+            else:
+                matriz = dados[[campo]].set_axis(simbolos[:1], axis=1) if campo in dados.columns else pd.DataFrame(index=dados.index)
+            matrizes[campo] = _padronizar_matriz(matriz)
+
+        return matrizes
+
+    def obter_info(self, ticker):
+        with limitar_host(HOST_YAHOO):
+            return yf.Ticker(f'{ticker}.SA').info
+
+    def obter_pagina_fii(self, ticker):
+        return self.cliente_status_invest.obter_pagina_fii(ticker)
+
+    def listar_fiis_segmento(self, segmento_id, categoria_id=2):
+        return self.cliente_status_invest.listar_fiis_segmento(segmento_id, categoria_id)
+
+
+####################################################################################################################################
+# Provedor local: arquivos gravados (fixtures) quando existirem, senão dados sintéticos determinísticos por ticker
+####################################################################################################################################
+
+# Primeiro dia das séries sintéticas; todas começam aqui, então qualquer recorte de datas é sempre o mesmo
+ORIGEM_SINTETICA = pd.Timestamp('2000-01-03')
+
+SEGMENTOS_SINTETICOS = ['Logística', 'Shoppings', 'Lajes Corporativas', 'Papéis', 'Híbrido', 'Renda Urbana']
+
+# Rótulos e valores da página do FII no mesmo formato do StatusInvest (rótulo seguido do valor)
+MODELO_PAGINA_FII = """<html><body><main>
+<div class="info"><h3 class="title">Valor atual</h3><strong class="value">{valor_atual}</strong></div>
+<div class="info" title="Dividend Yield com base nos últimos 12 meses"><h3 class="title">Dividend Yield</h3><strong class="value">{dy}</strong><span>%</span></div>
+<div class="info"><h3 class="title">Val. patrimonial p/cota</h3><strong class="value">{vp_cota}</strong></div>
+<div class="info"><h3 class="title">P/VP</h3><strong class="value">{pvp}</strong></div>
+<div class="info"><h3 class="title">RENDIMENTO MENSAL MÉDIO (24M)</h3><strong class="value">{rendimento}</strong></div>
+<div class="info"><span class="sub-value">Liquidez média diária</span><strong class="value">{liquidez}</strong></div>
+<div class="info"><h3 class="title">Participação no IFIX</h3><strong class="value">{ifix}</strong></div>
+<div class="info"><span class="sub-value">Valor em caixa</span><strong class="value">R$ {caixa}</strong></div>
+<div class="info"><span class="sub-value">Patrimônio</span><strong class="value">R$ {patrimonio}</strong></div>
+<div class="info"><span class="sub-value">Número de cotistas</span><strong class="value">{cotistas}</strong></div>
+<div class="info"><span class="sub-value">Número de cotas</span><strong class="value">{cotas}</strong></div>
+<div class="info"><span class="sub-value">Valorização 12 meses</span><strong class="value">{valorizacao_12m}%</strong></div>
+<div class="info"><span class="sub-value">Valorização no mês</span><strong class="value">{valorizacao_mes}%</strong></div>
+<div class="info"><span class="sub-value">CAGR 3 anos</span><span class="value">{cagr_3y}%</span></div>
+<div class="info"><span class="sub-value">CAGR 5 anos</span><span class="value">{cagr_5y}%</span></div>
+<div class="info"><span class="sub-value">Segmento</span><strong class="value">{segmento}</strong></div>
+<div class="info"><span class="sub-value">Tipo da gestão</span><strong class="value">{gestao}</strong></div>
+<div class="info"><span class="sub-value">Público-alvo</span><strong class="value">{publico}</strong></div>
+</main></body></html>
+"""
+
+
+def _numero_br(valor: float, casas: int = 2) -> str:
+    return f'{valor:,.{casas}f}'.replace(',', '_').replace('.', ',').replace('_', '.')
+
+
+def _fatia_periodo(datas: pd.DatetimeIndex, periodo: str) -> pd.Timestamp:
+    """Primeira data de um período no formato do yfinance ('5d', '6mo', '3y') contado do fim de `datas`."""
+    quantidade = int(''.join(c for c in periodo if c.isdigit()))
+    unidade = periodo.lstrip('0123456789')
+    deslocamento = {'d': pd.DateOffset(days=quantidade), 'mo': pd.DateOffset(months=quantidade), 'y': pd.DateOffset(years=quantidade)}[unidade]
+    return datas.max() - deslocamento
+
+
+class ProvedorLocal(ProvedorMercado):
+    """
+    Fonte sem rede e reprodutível, para benchmarks e testes do pipeline. Para cada dado, usa o arquivo
+    gravado em `dir_fixtures`, se houver:
+
+        historico/<TICKER>.parquet (ou .csv)   índice Data × Open/High/Low/Close/Volume/Dividends/Stock Splits
+        info/<TICKER>.json                     dicionário como o yf.Ticker.info
+        status_invest/<ticker>.html            página do FII
+        segmentos/<segmento>_<categoria>.json  lista de FIIs como a resposta de sector/getcompanies
+
+    Sem o arquivo, gera dados sintéticos a partir de uma semente fixa por ticker (passeio aleatório
+    de preços desde ORIGEM_SINTETICA, rendimentos mensais para tickers terminados em 11 e indicadores
+    plausíveis), sempre iguais entre execuções.
+    """
+
+    nome = 'local'
+
+    def __init__(self, dir_fixtures: str | os.PathLike | None = None, semente: int = 0):
+        self.dir_fixtures = pathlib.Path(dir_fixtures) if dir_fixtures else None
+        self.semente = semente
+        self._historicos: dict[str, pd.DataFrame] = {}
+        self._datas: pd.DatetimeIndex | None = None
+
+    def _gerador(self, *chaves: str) -> np.random.Generator:
+        return np.random.default_rng([self.semente] + [zlib.crc32(chave.encode()) for chave in chaves])
+
+    def _fixture(self, *partes: str) -> pathlib.Path | None:
+        if self.dir_fixtures is None:
+            return None
+        path = self.dir_fixtures.joinpath(*partes)
+        return path if path.exists() else None
+
+    def _calendario(self) -> pd.DatetimeIndex:
+        """Dias úteis de ORIGEM_SINTETICA até hoje, montado uma vez por provedor (np.is_busday, sem laço por dia)."""
+        if self._datas is None:
+            dias = np.arange(ORIGEM_SINTETICA.to_datetime64(), pd.Timestamp.today().normalize().to_datetime64() + 1, dtype='datetime64[D]')
+            self._datas = pd.DatetimeIndex(dias[np.is_busday(dias)], name='Data')
+        return self._datas
+
+    def _historico_sintetico(self, ticker: str) -> pd.DataFrame:
+        rng = self._gerador('historico', ticker)
+        datas = self._calendario()
+
+        fechamentos = rng.uniform(8, 150) * np.exp(np.cumsum(rng.normal(0.0002, 0.012, len(datas))))
+        amplitude = np.abs(rng.normal(0, 0.008, len(datas))) * fechamentos
+        aberturas = np.concatenate([[fechamentos[0]], fechamentos[:-1]])
+
+        dividendos = np.zeros(len(datas))
+        if ticker.endswith('11'):
+            # Um rendimento por mês, no primeiro pregão, de 0,6% a 1,0% da cota
+            primeiros = np.flatnonzero(np.diff(datas.month, prepend=0) != 0)
+            dividendos[primeiros] = np.round(fechamentos[primeiros] * rng.uniform(0.006, 0.010, len(primeiros)), 2)
+
+        return pd.DataFrame({
+            'Open': aberturas,
+            'High': np.maximum(aberturas, fechamentos) + amplitude,
+            'Low': np.minimum(aberturas, fechamentos) - amplitude,
+            'Close': fechamentos,
+            'Volume': rng.integers(1_000, 500_000, len(datas)).astype('float64'),
+            'Dividends': dividendos,
+            'Stock Splits': 0.0,
+        }, index=datas)
+
+    def _historico(self, ticker: str) -> pd.DataFrame:
+        if ticker not in self._historicos:
+            parquet, csv = self._fixture('historico', f'{ticker}.parquet'), self._fixture('historico', f'{ticker}.csv')
+            if parquet is not None:
+                historico = pd.read_parquet(parquet)
+            elif csv is not None:
+                historico = pd.read_csv(csv, index_col=0, parse_dates=True)
+            else:
+                historico = self._historico_sintetico(ticker)
+            self._historicos[ticker] = historico.rename_axis('Data').sort_index()
+        return self._historicos[ticker]
+
+    def baixar_series(self, tickers, campos, inicio=None, fim=None, periodo=None):
+        historicos = {ticker: self._historico(ticker) for ticker in tickers}
+        matrizes = {}
+        for campo in campos:
+            matriz = pd.DataFrame({ticker: df[campo] for ticker, df in historicos.items() if campo in df.columns})
+            if matriz.empty:
+                matrizes[campo] = pd.DataFrame(dtype='float64')
+                continue
+
+            if periodo is not None:
+                matriz = matriz[matriz.index >= _fatia_periodo(matriz.index, periodo)]
+            else:
+                matriz = matriz.loc[pd.Timestamp(inicio) if inicio is not None else None:pd.Timestamp(fim) if fim is not None else None]
+            matrizes[campo] = _padronizar_matriz(matriz)
+
+        return matrizes
+
+    def obter_info(self, ticker):
+        path = self._fixture('info', f'{ticker.upper()}.json')
+        if path is not None:
+            return json.loads(path.read_text(encoding='utf-8'))
+
+        ultimo = float(self._historico(ticker.upper())['Close'].iloc[-1])
+        return {
+            'symbol': f'{ticker.upper()}.SA',
+            'shortName': f'{ticker.upper()} SINTETICO',
+            'longName': f'Fundo Sintético {ticker.upper()}',
+            'currency': 'BRL',
+            'regularMarketPrice': ultimo,
+        }
+
+    def obter_pagina_fii(self, ticker):
+        path = self._fixture('status_invest', f'{ticker.lower()}.html')
+        if path is not None:
+            return path.read_text(encoding='utf-8')
+
+        rng = self._gerador('status_invest', ticker.upper())
+        historico = self._historico(ticker.upper())
+        preco = float(historico['Close'].iloc[-1])
+        dividendos_12m = float(historico['Dividends'].iloc[-252:].sum())
+        pvp = rng.uniform(0.7, 1.3)
+        cotas = int(rng.integers(1_000_000, 100_000_000))
+
+        return MODELO_PAGINA_FII.format(
+            valor_atual=_numero_br(preco),
+            dy=_numero_br(100 * dividendos_12m / preco),
+            vp_cota=_numero_br(preco / pvp),
+            pvp=_numero_br(pvp),
+            rendimento=_numero_br(dividendos_12m / 12, 4),
+            liquidez=_numero_br(rng.uniform(50_000, 20_000_000)),
+            ifix=_numero_br(rng.uniform(0, 3), 3),
+            caixa=_numero_br(rng.uniform(1e6, 1e8)),
+            patrimonio=_numero_br(cotas * preco / pvp),
+            cotistas=_numero_br(int(rng.integers(500, 500_000)), 0),
+            cotas=_numero_br(cotas, 0),
+            valorizacao_12m=_numero_br(rng.normal(0, 12)),
+            valorizacao_mes=_numero_br(rng.normal(0, 3)),
+            cagr_3y=_numero_br(rng.normal(3, 8)),
+            cagr_5y=_numero_br(rng.normal(3, 6)),
+            segmento=SEGMENTOS_SINTETICOS[int(rng.integers(len(SEGMENTOS_SINTETICOS)))],
+            gestao=['Ativa', 'Passiva'][int(rng.integers(2))],
+            publico=['Geral', 'Investidor Qualificado'][int(rng.integers(2))],
+        )
+
+    def listar_fiis_segmento(self, segmento_id, categoria_id=2):
+        path = self._fixture('segmentos', f'{segmento_id}_{categoria_id}.json')
+        if path is not None:
+            return pd.DataFrame(json.loads(path.read_text(encoding='utf-8')))
+
+        rng = self._gerador('segmento', str(segmento_id), str(categoria_id))
+        letras = rng.choice(list('ABCDEFGHIJKLMNOPQRSTUVWXYZ'), size=(int(rng.integers(5, 15)), 4))
+        tickers = sorted({''.join(prefixo) + '11' for prefixo in letras})
+        return pd.DataFrame({
+            'companyId': range(1, len(tickers) + 1),
+            'companyName': [f'FUNDO SINTÉTICO {ticker}' for ticker in tickers],
+            'ticker': tickers,
+        })
+
+
+####################################################################################################################################
+# Provedor atual
+####################################################################################################################################
+
+PROVEDORES = {
+    ProvedorOnline.nome: ProvedorOnline,
+    ProvedorLocal.nome: ProvedorLocal,
+}
+
+_provedor_atual: ProvedorMercado | None = None
+
+
+def criar_provedor(nome: str) -> ProvedorMercado:
+    """Instancia um provedor pelo nome; o local usa DIR_FIXTURES_MERCADO (.env) como pasta de fixtures."""
+    if nome not in PROVEDORES:
+        raise ValueError(f'Provedor de mercado inválido: {nome}. Use um de {list(PROVEDORES)}')
+    if nome == ProvedorLocal.nome:
+        return ProvedorLocal(os.getenv('DIR_FIXTURES_MERCADO'))
+    return PROVEDORES[nome]()
+
+
+def obter_provedor() -> ProvedorMercado:
+    """Provedor em uso: o definido por definir_provedor ou, na primeira chamada, PROVEDOR_MERCADO do .env (padrão: online)."""
+    global _provedor_atual
+    if _provedor_atual is None:
+        _provedor_atual = criar_provedor(os.getenv('PROVEDOR_MERCADO', ProvedorOnline.nome))
+    return _provedor_atual
+
+
+def definir_provedor(provedor: ProvedorMercado | str) -> ProvedorMercado:
+    """Troca o provedor usado por todo o pacote mercado (instância ou nome registrado em PROVEDORES)."""
+    global _provedor_atual
+    _provedor_atual = criar_provedor(provedor) if isinstance(provedor, str) else provedor
+    return _provedor_atual
@@ -0,0 +1,80 @@
+import pandas as pd
+
+from .coleta import MAX_COLETORES, coletar_em_paralelo
+from .historico import atualizar_historicos, obter_historico_ticker
+from .pagina_fii import extrair_fundamentos_fii
+from .provedores import obter_provedor
+
+# Janela do histórico de preços e proventos coletado de cada FII
+ANOS_HISTORICO_FII = 3
+
+
+def _inicio_historico_fii() -> pd.Timestamp:
+    return pd.Timestamp.today().normalize() - pd.DateOffset(years=ANOS_HISTORICO_FII)
+
+
+def obter_dados_fii(ticker_fii: str) -> dict[str,any]:
+
+    dados_mercado = None
+    dados_fundamentos = {}
+
+    try:
+        # Coleta dados de mercado do provedor; o histórico vem do armazenamento local, baixando só o que falta
+        hist = obter_historico_ticker(ticker_fii, _inicio_historico_fii())
+
+        if hist.empty:
+            raise ValueError(f"Não há dados históricos para {ticker_fii}")
+
+        dados_mercado = {
+            'hist_precos': hist,
+            'dividendos': hist['Dividends'][hist['Dividends'] > 0],
+            'ultimo_preco': hist['Close'].iloc[-1],
+            'volume_medio': hist['Volume'].mean()
+        }
+    except Exception as e:
+        print(f"Erro ao coletar dados de mercado para {ticker_fii}: {str(e)}")
+
+
+    try:
+        info = obter_provedor().obter_info(ticker_fii)
+    except Exception as e:
+        print(f"Erro ao coletar informações de {ticker_fii}: {str(e)}")
+        info = {}
+
+    # Página lida em uma única passada (ver indexar_pagina_fii)
+    dados_fundamentos = {
+        "ticker": ticker_fii.upper(),
+        **extrair_fundamentos_fii(obter_provedor().obter_pagina_fii(ticker_fii))
+    }
+
+    return {
+        'mercado': dados_mercado,
+        'fundamentos': dados_fundamentos,
+        'info': info
+    }
+
+
+
+def obter_fiis_por_categoria_segmento(segmento_id: int, categoria_id: int = 2) -> pd.DataFrame:
+    return obter_provedor().listar_fiis_segmento(segmento_id, categoria_id)
+
+
+def preparar_historicos_fii(tickers: list[str]) -> None:
+    """
+    Atualiza o histórico em disco de todos os FIIs de uma vez (um download por lacuna, em lote), para
+    as coletas de cada FII em seguida só lerem do disco.
+    """
+    try:
+        atualizar_historicos(tickers, _inicio_historico_fii())
+    except Exception as e:
+        print(f"Erro ao atualizar o histórico dos FIIs: {str(e)}")
+
+
+def obter_dados_fiis(tickers: list[str], max_coletores: int = MAX_COLETORES, ao_concluir=None) -> list[dict[str,any] | None]:
+    """
+    obter_dados_fii de vários FIIs, na ordem de `tickers`: o histórico de todos é atualizado em lote
+    e as informações e páginas de indicadores são buscadas em paralelo (ver coletar_em_paralelo).
+    """
+    tickers = list(tickers)
+    preparar_historicos_fii(tickers)
+    return coletar_em_paralelo(tickers, obter_dados_fii, max_coletores=max_coletores, ao_concluir=ao_concluir)
@@ -1,2 +1,3 @@
 from .pagina_fii import pagina_fii
-from .pagina_acoes import pagina_acoes
\ No newline at end of file
+from .pagina_acoes import pagina_acoes
+from .upload_movimentacoes import carregar_movimentacoes_streamlit
\ No newline at end of file
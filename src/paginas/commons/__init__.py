@@ -1,2 +1,5 @@
-from .resumo_posicoes import calcular_resumo_investimentos, grafico_patrimonio_donut
-from .css import detectar_tema_streamlit, obter_tema_streamlit
\ No newline at end of file
+from .resumo_posicoes import calcular_resumo_investimentos, obter_resumo_investimentos, grafico_patrimonio_donut
+from .css import detectar_tema_streamlit, obter_tema_streamlit
+from .patrimonio import exibir_evolucao_patrimonio, exibir_rentabilidade, grafico_evolucao_patrimonio
+from .status_ativos import exibir_status_por_ativo, grafico_donuts_ativos
+from .proventos import exibir_proventos
\ No newline at end of file
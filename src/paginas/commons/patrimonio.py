@@ -0,0 +1,89 @@
+import pandas as pd
+import streamlit as st
+
+import plotly.graph_objects as go
+
+from carteira import calcular_patrimonio_diario, calcular_proventos_recebidos, calcular_rentabilidade
+from mercado import historico
+from utils import formatar_colunas_br, formatar_percentual
+
+
+@st.cache_data(show_spinner=False, ttl=60 * 60)
+def obter_historico_mercado(tickers: tuple[str, ...], inicio: pd.Timestamp) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # Fechamentos e proventos vêm do mesmo histórico em disco e ficam no mesmo cache
+    return historico.obter_historico_mercado(list(tickers), inicio)
+
+
+def grafico_evolucao_patrimonio(df_patrimonio: pd.DataFrame, key=None):
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=df_patrimonio.index, y=df_patrimonio['Patrimônio'],
+        name='Patrimônio',
+        line=dict(color='#0F9D58', width=2)
+    ))
+    fig.add_trace(go.Scatter(
+        x=df_patrimonio.index, y=df_patrimonio['Investido'],
+        name='Investido',
+        line=dict(color='#4285F4', width=2, dash='dot')
+    ))
+
+    fig.update_layout(
+        height=450,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        margin=dict(t=40, l=40, r=40, b=40),
+        hovermode="x unified",
+        yaxis_tickprefix='R$ ',
+        separators=',.'
+    )
+
+    return st.plotly_chart(fig, use_container_width=True, key=key)
+
+
+def exibir_rentabilidade(df: pd.DataFrame, precos: pd.DataFrame, dividendos: pd.DataFrame, key: str):
+    """XIRR e TWR (com proventos) da carteira em métricas e de cada ativo em uma tabela."""
+    rentabilidade = calcular_rentabilidade(df, precos, calcular_proventos_recebidos(df, dividendos))
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("XIRR (a.a.)", formatar_percentual(rentabilidade['xirr']), help="Rentabilidade ponderada pelo capital: considera quando e quanto foi aportado.")
+    col2.metric("TWR (acumulada)", formatar_percentual(rentabilidade['twr']), help="Rentabilidade ponderada pelo tempo: desconsidera o efeito dos aportes e resgates.")
+    col3.metric("TWR (a.a.)", formatar_percentual(rentabilidade['twr_anual']))
+
+    with st.expander("Rentabilidade por ativo", expanded=False):
+        st.dataframe(
+            formatar_colunas_br(rentabilidade['por_ativo'], percentual=['XIRR a.a.', 'TWR', 'TWR a.a.']),
+            use_container_width=True,
+            hide_index=True,
+            key=f"rentabilidade_{key}"
+        )
+
+
+def exibir_evolucao_patrimonio(df: pd.DataFrame, key: str = 'evolucao_patrimonio'):
+    """Gráfico diário de patrimônio e capital investido da carteira, desde a primeira operação, com a rentabilidade."""
+    if df.empty:
+        st.info("Nenhuma movimentação para montar a evolução do patrimônio.")
+        return
+
+    tickers = tuple(sorted(df['Ticker'].astype(str).unique()))
+    inicio = df['Data'].min().normalize()
+
+    with st.spinner("Buscando histórico de cotações..."):
+        precos, dividendos = obter_historico_mercado(tickers, inicio)
+
+    df_patrimonio = calcular_patrimonio_diario(df, precos)
+    if df_patrimonio.empty:
+        st.info("Nenhuma compra ou venda para montar a evolução do patrimônio.")
+        return
+
+    faltando = sorted(set(tickers) - set(precos.columns))
+    if faltando:
+        st.warning(f"Sem histórico de cotações para {', '.join(faltando)}: usado o preço da última operação.")
+
+    exibir_rentabilidade(df, precos, dividendos, key=key)
+    grafico_evolucao_patrimonio(df_patrimonio, key=key)
@@ -0,0 +1,48 @@
+import pandas as pd
+import streamlit as st
+
+from carteira import calcular_resumo_proventos
+from utils import formatar_colunas_br, formatar_moeda, formatar_percentual
+
+from .patrimonio import obter_historico_mercado
+
+
+def exibir_proventos(df: pd.DataFrame, key: str):
+    """Proventos recebidos pela carteira, por ativo: total, últimos 12 meses e yield on cost."""
+    if df.empty:
+        st.info("Nenhuma movimentação para calcular os proventos.")
+        return
+
+    tickers = tuple(sorted(df['Ticker'].astype(str).unique()))
+    inicio = df['Data'].min().normalize()
+
+    with st.spinner("Buscando histórico de proventos..."):
+        _, dividendos = obter_historico_mercado(tickers, inicio)
+
+    resumo = calcular_resumo_proventos(df, dividendos)
+    if resumo['por_ativo'].empty:
+        st.info("Nenhum provento encontrado para as posições da carteira.")
+        return
+
+    st.warning("""
+                ##### Atenção:
+
+                Os proventos são estimados a partir das datas ex e valores por cota do *Yahoo Finance*,
+                cruzados com a posição da carteira em cada data ex.
+                """)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Proventos Recebidos", formatar_moeda(resumo['total_recebido']))
+    col2.metric("Proventos 12M", formatar_moeda(resumo['total_12m']))
+    col3.metric("Yield on Cost 12M", formatar_percentual(resumo['yield_on_cost_12m']))
+
+    st.dataframe(
+        formatar_colunas_br(
+            resumo['por_ativo'],
+            moeda=['Proventos Recebidos', 'Proventos 12M', 'Custo da Posição'],
+            percentual=['Yield on Cost 12M']
+        ),
+        use_container_width=True,
+        hide_index=True,
+        key=f"proventos_{key}"
+    )
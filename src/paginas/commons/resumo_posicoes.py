@@ -2,14 +2,36 @@
 import pandas as pd
 import numpy as np
 
-import yfinance as yf
-import fundamentus as fd
-
 import streamlit as st
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, JsCode
 
 import plotly.graph_objects as go
 
+from carteira import calcular_resumo_investimentos, atualizar_livro_posicoes
+from mercado import obter_marca_cotacoes
+from preprocessamento import calcular_impressao_movimentacoes
+from utils import formatar_moeda
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _resumo_investimentos_em_cache(impressao: str, marca_cotacoes: int, nome_livro: str, _df: pd.DataFrame) -> dict[str,any]:
+    # _df não entra na chave do cache: a impressão das movimentações já o identifica
+    livro = atualizar_livro_posicoes(_df, nome_livro)
+    return calcular_resumo_investimentos(_df, livro=livro)
+
+
+def obter_resumo_investimentos(df: pd.DataFrame, nome_livro: str) -> dict[str,any]:
+    """
+    Resumo da carteira (posições + cotações) calculado uma única vez para cada base de movimentações
+    e janela de cotações; os reruns do Streamlit (sliders, seleções...) reaproveitam o resultado.
+    """
+    return _resumo_investimentos_em_cache(
+        calcular_impressao_movimentacoes(df),
+        obter_marca_cotacoes(),
+        nome_livro,
+        df
+    )
+
 
 def grafico_patrimonio_donut(total_investido, lucro_prejuizo, key=None, height_donut: int = 400):
     # Cores baseadas no tema atual
@@ -62,7 +84,7 @@ def grafico_patrimonio_donut(total_investido, lucro_prejuizo, key=None, height_d
 
     # Formatação do valor monetário
     valor_total = total_investido + lucro_prejuizo
-    valor_formatado = f'R$ {valor_total:,.2f}'.replace(",", "X").replace(".", ",").replace("X", ".")
+    valor_formatado = formatar_moeda(valor_total)
 
     # Layout final
     fig.update_layout(
@@ -83,71 +105,3 @@ def grafico_patrimonio_donut(total_investido, lucro_prejuizo, key=None, height_d
     )
 
     return st.plotly_chart(fig, use_container_width=True, key=key)
-
-
-def calcular_resumo_investimentos(df: pd.DataFrame):
-    df = df.copy()
-
-    total_investido_geral = 0
-    total_valor_mercado = 0
-
-    resumo = []
-
-    for ticker in df["Ticker"].unique():
-        df_ticker = df[df["Ticker"] == ticker]
-
-        compras = df_ticker[df_ticker["Entrada/Saída"] == "Credito"]
-        vendas = df_ticker[df_ticker["Entrada/Saída"] == "Debito"]
-
-        qtd_comprada = compras["Quantidade"].sum()
-        qtd_vendida = vendas["Quantidade"].sum()
-        qtd_liquida = qtd_comprada - qtd_vendida
-
-        if qtd_liquida <= 0:
-            continue
-
-        total_comprado = compras["Valor da Operação"].sum()
-        total_vendido = vendas["Valor da Operação"].sum()
-        total_investido = total_comprado - total_vendido
-
-        preco_medio = (
-            (compras["Quantidade"] * compras["Preço unitário"]).sum() / qtd_comprada
-            if qtd_comprada > 0 else 0
-        )
-
-        try:
-            preco_atual = yf.Ticker(ticker + ".SA").history(period="1d")["Close"].iloc[-1]
-        except Exception:
-            preco_atual = 0
-
-        valor_mercado = preco_atual * qtd_liquida
-        lucro_prejuizo = valor_mercado - total_investido
-
-        total_investido_geral += total_investido
-        total_valor_mercado += valor_mercado
-
-        resumo.append({
-            "Ticker": ticker,
-            "Quantidade Atual": qtd_liquida,
-            "Preço Médio": round(preco_medio, 2),
-            "Preço Atual": round(preco_atual, 2),
-            "Total Investido": round(total_investido, 2),
-            "Valor de Mercado": round(valor_mercado, 2),
-            "Lucro/Prejuízo": round(lucro_prejuizo, 2),
-        })
-
-    df_consolidacao = pd.DataFrame(resumo)
-    df_consolidacao = df_consolidacao.sort_values(by=['Ticker'], ascending=True) if not df_consolidacao.empty else df_consolidacao
-
-    lucro_total = total_valor_mercado - total_investido_geral
-    delta = lucro_total / total_investido_geral if total_investido_geral > 0 else 0
-
-    return {
-        "consolidacao": df_consolidacao,
-        "total_investido_geral": total_investido_geral,
-        "total_valor_mercado": total_valor_mercado,
-        "lucro_total": lucro_total,
-        "delta": delta
-    }
-
-
@@ -0,0 +1,116 @@
+import math
+
+import pandas as pd
+import streamlit as st
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from utils import formatar_colunas_br, formatar_percentual
+
+from .resumo_posicoes import grafico_patrimonio_donut
+
+# Opções de cartões por página na aba "Status por Ativo"
+TAMANHOS_PAGINA = [6, 12, 24]
+
+# Donuts por linha na visão geral (um único gráfico com todos os ativos)
+DONUTS_POR_LINHA = 6
+
+
+def _exibir_cartao(ativo: dict[str,any], valores: dict[str,any], key: str):
+    with st.container(border=True):
+        col_donut, col_info = st.columns([1, 2])
+        with col_donut:
+            grafico_patrimonio_donut(
+                valores['Total Investido'],
+                valores['Lucro/Prejuízo'],
+                key=f"donut_{key}_{ativo['Ticker']}",
+                height_donut=300
+            )
+
+        with col_info:
+            st.markdown(f"### {ativo['Ticker']}")
+            col_qtde, col_medio, col_atual, col_lucro = st.columns(4)
+            col_qtde.metric("Quantidade", ativo['Quantidade Atual'])
+            col_medio.metric("Preço Médio", ativo['Preço Médio'])
+            col_atual.metric("Preço Atual", ativo['Preço Atual'])
+            col_lucro.metric("Lucro/Prejuízo", ativo['Lucro/Prejuízo'], ativo['Rentabilidade'])
+
+
+def grafico_donuts_ativos(df_resumo: pd.DataFrame, key=None):
+    """Todos os ativos em uma única figura (small multiples), no lugar de um gráfico por cartão."""
+    n_linhas = math.ceil(len(df_resumo) / DONUTS_POR_LINHA)
+    fig = make_subplots(
+        rows=n_linhas,
+        cols=DONUTS_POR_LINHA,
+        specs=[[{'type': 'domain'}] * DONUTS_POR_LINHA] * n_linhas,
+        subplot_titles=df_resumo['Ticker'].tolist(),
+        vertical_spacing=0.3 / n_linhas
+    )
+
+    for i, ativo in enumerate(df_resumo[['Total Investido', 'Lucro/Prejuízo']].itertuples(index=False)):
+        investido, lucro = ativo
+        fig.add_trace(go.Pie(
+            labels=["Total Investido", "Lucro" if lucro >= 0 else "Prejuízo"],
+            values=[investido, abs(lucro)],
+            hole=0.6,
+            marker=dict(colors=['#4285F4', '#0F9D58' if lucro >= 0 else '#DB4437']),
+            textinfo='none',
+            sort=False,
+            direction='clockwise',
+            hoverinfo='label+value+percent'
+        ), row=i // DONUTS_POR_LINHA + 1, col=i % DONUTS_POR_LINHA + 1)
+
+    fig.update_layout(
+        height=180 * n_linhas,
+        showlegend=False,
+        margin=dict(t=40, l=10, r=10, b=10),
+        paper_bgcolor='rgba(0,0,0,0)',
+        separators=',.'
+    )
+
+    return st.plotly_chart(fig, use_container_width=True, key=key)
+
+
+def exibir_status_por_ativo(df_resumo: pd.DataFrame, key: str):
+    """
+    Cartões por ativo paginados: só os ativos da página atual são montados (donut + métricas),
+    então o tempo de render e o volume enviado ao navegador não crescem com o tamanho da carteira.
+    Opcionalmente, todos os ativos aparecem em um único gráfico de donuts.
+    """
+    if df_resumo.empty:
+        st.info("Nenhuma posição em aberto.")
+        return
+
+    visao = st.radio(
+        "Visualização",
+        ["Cartões", "Visão geral"],
+        horizontal=True,
+        key=f"visao_status_{key}",
+        label_visibility='collapsed'
+    )
+
+    if visao == "Visão geral":
+        grafico_donuts_ativos(df_resumo, key=f"donuts_{key}")
+        return
+
+    col_tamanho, col_pagina, col_total = st.columns([1, 1, 2])
+    tamanho_pagina = col_tamanho.selectbox("Ativos por página", TAMANHOS_PAGINA, key=f"tamanho_pagina_{key}")
+    n_paginas = max(1, math.ceil(len(df_resumo) / tamanho_pagina))
+    pagina = col_pagina.number_input("Página", min_value=1, max_value=n_paginas, value=1, step=1, key=f"pagina_{key}")
+    col_total.caption(f"{len(df_resumo)} ativos em {n_paginas} página(s)")
+
+    df_pagina = df_resumo.iloc[(pagina - 1) * tamanho_pagina: pagina * tamanho_pagina]
+
+    # Formata a página inteira de uma vez (coluna a coluna) antes de montar os cartões
+    investido = df_pagina['Total Investido']
+    rentabilidade = (df_pagina['Lucro/Prejuízo'] / investido.where(investido > 0)).fillna(0)
+    df_formatado = formatar_colunas_br(
+        df_pagina.assign(Rentabilidade=rentabilidade),
+        moeda=['Preço Médio', 'Preço Atual', 'Lucro/Prejuízo'],
+        percentual=['Rentabilidade'],
+        numero=['Quantidade Atual']
+    )
+
+    for ativo, valores in zip(df_formatado.to_dict('records'), df_pagina.to_dict('records')):
+        _exibir_cartao(ativo, valores, key)
@@ -1,7 +1,5 @@
 
 
-import yfinance as yf
-import fundamentus as fd
 import pandas as pd
 import numpy as np
 
@@ -17,8 +15,6 @@ from st_aggrid import AgGrid, DataReturnMode, GridOptionsBuilder, GridUpdateMode
 from utils import parse_from_string_to_numeric
 
 from datetime import datetime, timedelta
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 import re
 import time
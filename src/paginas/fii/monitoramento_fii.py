@@ -1,3 +1,5 @@
+import threading
+
 import streamlit as st
 import pandas as pd
 
@@ -5,8 +7,12 @@ import pandas as pd
 
 import plotly.graph_objects as go
 
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from avaliacao import avaliar_fii
+from mercado import coletar_em_paralelo, preparar_historicos_fii
+
 from .coletar_dados_status_invest import obter_dados_fii
-from .analise_fundamentalista import analise_fundamentalista_avancada
 from .analise_tecnica import exibir_analise_tecnica
 
 from ..commons import (
@@ -30,73 +36,59 @@ def modelo_decisao_fii(ticker: str, pesos_indicadores: dict[str,float]):
         return
 
     try:
-        analise_fund = analise_fundamentalista_avancada(ticker, dados['fundamentos'], pesos_indicadores)
-        if analise_fund is None or analise_fund.empty:
-            return None
-            
-        # Cálculo simplificado da pontuação se a análise completa falhar
-        try:
-            dy = analise_fund.loc['DY (%)', 'Valor']
-            p_vp = analise_fund.loc['P/VP', 'Valor']
-            score = analise_fund.loc['Score Qualidade', 'Valor']
-            
-            # Pontuação baseada em critérios simples
-            pontuacao = (dy * pesos_indicadores['dy']) + \
-                ((1/p_vp) * pesos_indicadores['p_vp'] if p_vp > 0 else 0) + \
-                (score)
-            pontuacao = min(100, max(0, pontuacao))  # Garante entre 0 e 100
-            
-            recomendacao = (
-                'COMPRA FORTE' if pontuacao > 80 else
-                'COMPRA' if pontuacao > 60 else
-                'NEUTRO' if pontuacao > 40 else
-                'VENDA' if pontuacao > 20 else
-                'VENDA FORTE'
-            )
-            
-            return {
-                'Pontuação': f"{pontuacao:.1f}%",
-                'Recomendação': recomendacao,
-                'Análise Fundamentalista': analise_fund
-            }
-        except:
-            # Fallback básico se o cálculo falhar
-            return {
-                'Pontuação': "0%",
-                'Recomendação': "N/A",
-                'Análise Fundamentalista': analise_fund
-            }
+        return avaliar_fii(ticker, dados['fundamentos'], pesos_indicadores)
     except Exception as e:
         print(f"Erro no modelo de decisão para {ticker}: {str(e)}")
         return None
     
+def _linha_painel(ticker: str, resultado: dict[str,any]) -> dict[str,any]:
+    row = {
+        'Ticker': ticker,
+        'Preço': resultado['Análise Fundamentalista'].loc['Preço Atual (R$)', 'Valor'],
+        'DY (%)': resultado['Análise Fundamentalista'].loc['DY (%)', 'Valor'],
+        'P/VP': resultado['Análise Fundamentalista'].loc['P/VP', 'Valor'],
+        'Score': resultado['Análise Fundamentalista'].loc['Score Qualidade', 'Valor'],
+        'Recomendação': resultado['Recomendação']
+    }
+
+    if 'Pontuação' in resultado:
+        row['Pontuação'] = float(resultado['Pontuação'].replace('%', ''))
+
+    return row
+
 def painel_monitoramento(carteira: list[str], pesos_indicadores: dict[str,float]):
-    """Cria painel com barra de progresso"""
+    """Cria painel com barra de progresso, coletando os FIIs em paralelo"""
     dados = []
     total = len(carteira)
     progresso = st.progress(0, text="Analisando ativos...")
 
-    for i, ticker in enumerate(carteira, 1):
+    # Histórico de todos os FIIs em lote; depois cada coleta só busca informações e indicadores
+    preparar_historicos_fii(carteira)
+
+    # As threads do pool usam o contexto desta sessão, para o cache e os avisos do Streamlit funcionarem nelas
+    contexto = get_script_run_ctx()
+
+    def inicializar_thread():
+        add_script_run_ctx(threading.current_thread(), contexto)
+
+    def ao_concluir(concluidos, ticker, resultado, erro):
+        if erro is not None:
+            st.warning(f"Erro ao processar {ticker} durante a construção do painel de monitoramento de FIIs: {str(erro)}")
+        progresso.progress(concluidos / total, text=f"Analisando {ticker} ({concluidos}/{total})")
+
+    resultados = coletar_em_paralelo(
+        carteira,
+        lambda ticker: modelo_decisao_fii(ticker, pesos_indicadores),
+        ao_concluir=ao_concluir,
+        inicializar_thread=inicializar_thread
+    )
+
+    for ticker, resultado in zip(carteira, resultados):
         try:
-            resultado = modelo_decisao_fii(ticker, pesos_indicadores)
             if resultado and not resultado['Análise Fundamentalista'].empty:
-                row = {
-                    'Ticker': ticker,
-                    'Preço': resultado['Análise Fundamentalista'].loc['Preço Atual (R$)', 'Valor'],
-                    'DY (%)': resultado['Análise Fundamentalista'].loc['DY (%)', 'Valor'],
-                    'P/VP': resultado['Análise Fundamentalista'].loc['P/VP', 'Valor'],
-                    'Score': resultado['Análise Fundamentalista'].loc['Score Qualidade', 'Valor'],
-                    'Recomendação': resultado['Recomendação']
-                }
-
-                if 'Pontuação' in resultado:
-                    row['Pontuação'] = float(resultado['Pontuação'].replace('%', ''))
-
-                dados.append(row)
+                dados.append(_linha_painel(ticker, resultado))
         except Exception as e:
             st.warning(f"Erro ao processar {ticker} durante a construção do painel de monitoramento de FIIs: {str(e)}")
-        
-        progresso.progress(i / total, text=f"Analisando {ticker} ({i}/{total})")
 
     progresso.empty()  # Remove barra ao final
 
@@ -5,7 +5,9 @@ import plotly.graph_objects as go
 
 import pandas as pd
 
-from ..commons import calcular_resumo_investimentos, grafico_patrimonio_donut
+from utils import formatar_colunas_br, formatar_moeda, formatar_percentual
+
+from ..commons import calcular_resumo_investimentos, grafico_patrimonio_donut, exibir_status_por_ativo
 
 
 def grafico_historico_precos_fii(dados):
@@ -76,10 +78,7 @@ def exibir_resumo_investimentos_fii(dict_consolidado: dict[str,any]):
     cols_moeda = ["Preço Médio", "Preço Atual", "Total Investido", "Valor de Mercado", "Lucro/Prejuízo"]
 
     if not df_resumo_formatted.empty:
-        for col in cols_moeda:
-            df_resumo_formatted[col] = df_resumo_formatted[col].apply(
-                lambda x: f"R$ {x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-            )
+        df_resumo_formatted = formatar_colunas_br(df_resumo_formatted, moeda=cols_moeda)
 
     abas_resumo = st.tabs([
         "Minha Carteira", 
@@ -97,8 +96,8 @@ def exibir_resumo_investimentos_fii(dict_consolidado: dict[str,any]):
                 """)
 
         col1, col2 = st.columns(2)
-        col1.metric("Total Investido", f"R$ {total_investido_geral:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."))
-        col2.metric("Lucro/Prejuízo Total", f"R$ {lucro_total:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."), f"{delta:.2%}")
+        col1.metric("Total Investido", formatar_moeda(total_investido_geral))
+        col2.metric("Lucro/Prejuízo Total", formatar_moeda(lucro_total), formatar_percentual(delta))
 
         grafico_patrimonio_donut(total_investido_geral, lucro_total, 'patrimonio_geral')
     
@@ -106,26 +105,7 @@ def exibir_resumo_investimentos_fii(dict_consolidado: dict[str,any]):
         with st.expander('#### Investimentos', expanded=False):
             st.dataframe(df_resumo_formatted, use_container_width=True)    
 
-        for _, row in df_resumo.iterrows():
-            with st.container(border=True):
-                col_donut, col_info = st.columns([1, 2])
-                with col_donut:
-                    grafico_patrimonio_donut(
-                        row['Total Investido'], 
-                        row['Lucro/Prejuízo'], 
-                        key=f"donut_{row['Ticker']}",
-                        height_donut=300
-                    )
-
-                with col_info:
-                    st.markdown(f"### {row['Ticker']}")            
-                    col_qtde, col_medio, col_atual, col_lucro = st.columns(4)
-                    col_qtde.metric("Quantidade", f"{row['Quantidade Atual']:,.0f}")
-                    col_medio.metric("Preço Médio", f"R$ {row['Preço Médio']:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."))
-                    col_atual.metric("Preço Atual", f"R$ {row['Preço Atual']:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."))                
-                    col_lucro.metric("Lucro/Prejuízo", 
-                            f"R$ {row['Lucro/Prejuízo']:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."),
-                            f"{row['Lucro/Prejuízo']/row['Total Investido']:.2%}" if row['Total Investido'] > 0 else "0%")
+        exibir_status_por_ativo(df_resumo, key='fii')
 
     # with abas_resumo[2]:
     #     tickers = ["Selecione"] + sorted(df_resumo_formatted["Ticker"].unique().tolist())
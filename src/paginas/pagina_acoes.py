@@ -4,7 +4,10 @@ import streamlit as st
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, JsCode
 
 # from cotacoes import fechamento_oficial_yahoo
-import yfinance as yf
+from mercado import obter_historico_ticker
+
+from utils import parse_br_numeric, formatar_colunas_br, formatar_moeda, formatar_percentual
+from .commons import obter_resumo_investimentos, exibir_evolucao_patrimonio, exibir_status_por_ativo, exibir_proventos
 import plotly.graph_objects as go
 
 # from analises import (
@@ -24,7 +27,7 @@ def _preparar_dados(df):
     # Converter colunas numéricas
     numeric_cols = ['Quantidade', 'Preço unitário', 'Valor da Operação']
     for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
+        df[col] = parse_br_numeric(df[col])
     
     return df
 
@@ -193,7 +196,7 @@ def grafico_patrimonio_donut(total_investido, lucro_prejuizo, key=None, height_d
 
     # Formatação do valor monetário
     valor_total = total_investido + lucro_prejuizo
-    valor_formatado = f'R$ {valor_total:,.2f}'.replace(",", "X").replace(".", ",").replace("X", ".")
+    valor_formatado = formatar_moeda(valor_total)
 
     # Layout final
     fig.update_layout(
@@ -217,81 +220,23 @@ def grafico_patrimonio_donut(total_investido, lucro_prejuizo, key=None, height_d
 
 
 def mostrar_resumo_investimentos(df: pd.DataFrame):
-    df = df.copy()
-
-    total_investido_geral = 0
-    total_valor_mercado = 0
-
-    resumo = []
-
-    for ticker in df["Ticker"].unique():
-        df_ticker = df[df["Ticker"] == ticker]
+    # Mesmo resumo (em cache) usado pela página de FIIs
+    dados_consolidados = obter_resumo_investimentos(df, 'acoes')
 
-        # Filtra compras e vendas pelo campo "Entrada/Saída"
-        compras = df_ticker[df_ticker["Entrada/Saída"] == "Credito"]
-        vendas = df_ticker[df_ticker["Entrada/Saída"] == "Debito"]
+    df_resumo = dados_consolidados['consolidacao']
+    total_investido_geral = dados_consolidados['total_investido_geral']
+    lucro_total = dados_consolidados['lucro_total']
+    delta = dados_consolidados['delta']
 
-        # Quantidade total comprada e vendida
-        qtd_comprada = compras["Quantidade"].sum()
-        qtd_vendida = vendas["Quantidade"].sum()
-        qtd_liquida = qtd_comprada - qtd_vendida  # posição atual em aberto
-
-        if qtd_liquida <= 0:
-            continue  # Sem posição em aberto, não contabiliza
-
-        # Valor total investido: soma do Valor da Operação de compras menos vendas
-        total_comprado = compras["Valor da Operação"].sum()
-        total_vendido = vendas["Valor da Operação"].sum()
-        total_investido = total_comprado - total_vendido
-
-        # Preço médio ponderado pela quantidade comprada
-        preco_medio = (
-            (compras["Quantidade"] * compras["Preço unitário"]).sum() / qtd_comprada
-            if qtd_comprada > 0 else 0
-        )
-
-        # Preço atual do ticker (com sufixo '.SA' para B3)
-        try:
-            preco_atual = yf.Ticker(ticker + ".SA").history(period="1d")["Close"].iloc[-1]
-            #preco_atual = fechamento_oficial_yahoo(ticker)
-        except Exception:
-            preco_atual = 0
-
-        valor_mercado = preco_atual * qtd_liquida
-        lucro_prejuizo = valor_mercado - total_investido
-
-        total_investido_geral += total_investido
-        total_valor_mercado += valor_mercado
-
-        resumo.append({
-            "Ticker": ticker,
-            "Quantidade Atual": qtd_liquida,
-            "Preço Médio": round(preco_medio, 2),
-            "Preço Atual": round(preco_atual, 2),
-            "Total Investido": round(total_investido, 2),
-            "Valor de Mercado": round(valor_mercado, 2),
-            "Lucro/Prejuízo": round(lucro_prejuizo, 2),
-        })
-
-    df_resumo = pd.DataFrame(resumo)
     df_resumo_formatted = df_resumo.copy()
-    
-    df_resumo_formatted = df_resumo_formatted.sort_values(by=['Ticker'], ascending=True) if not df_resumo_formatted.empty else df_resumo_formatted
 
     # Formatar colunas numéricas para string em pt-BR com 2 casas decimais
     cols_moeda = ["Preço Médio", "Preço Atual", "Total Investido", "Valor de Mercado", "Lucro/Prejuízo"]
 
     if not df_resumo_formatted.empty:
-        for col in cols_moeda:
-            df_resumo_formatted[col] = df_resumo_formatted[col].apply(
-                lambda x: f"R$ {x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-            )
-
-    # KPIs gerais
-    lucro_total = total_valor_mercado - total_investido_geral
-    delta = lucro_total / total_investido_geral if total_investido_geral > 0 else 0
+        df_resumo_formatted = formatar_colunas_br(df_resumo_formatted, moeda=cols_moeda)
 
-    abas_resumo = st.tabs(["Minha Carteira", "Status por Ativo", "Histórico de Preços"])
+    abas_resumo = st.tabs(["Minha Carteira", "Status por Ativo", "Histórico de Preços", "Evolução do Patrimônio", "Proventos"])
 
     with abas_resumo[0]:
         st.subheader("Minha Carteira")
@@ -306,8 +251,8 @@ def mostrar_resumo_investimentos(df: pd.DataFrame):
         
 
         col1, col2 = st.columns(2)
-        col1.metric("Total Investido", f"R$ {total_investido_geral:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."))
-        col2.metric("Lucro/Prejuízo Total", f"R$ {lucro_total:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."), f"{delta:.2%}")
+        col1.metric("Total Investido", formatar_moeda(total_investido_geral))
+        col2.metric("Lucro/Prejuízo Total", formatar_moeda(lucro_total), formatar_percentual(delta))
 
         # Donut chart com plotly
         fig_patrimonio_geral = grafico_patrimonio_donut(total_investido_geral, lucro_total, 'patrimonio_geral')
@@ -316,27 +261,13 @@ def mostrar_resumo_investimentos(df: pd.DataFrame):
         with st.expander('#### Investimentos', expanded=False):
             st.dataframe(df_resumo_formatted, use_container_width=True)    
 
-        # Exibir cada ativo com seu gráfico donut
-        for _, row in df_resumo.iterrows():
-            with st.container(border=True):
-                col_donut, col_info = st.columns([1, 2])
-                with col_donut:
-                    grafico_patrimonio_donut(
-                        row['Total Investido'], 
-                        row['Lucro/Prejuízo'], 
-                        key=f"donut_{row['Ticker']}",
-                        height_donut=300
-                    )
-
-                with col_info:
-                    st.markdown(f"### {row['Ticker']}")            
-                    col_qtde, col_medio, col_atual, col_lucro = st.columns(4)
-                    col_qtde.metric("Quantidade", f"{row['Quantidade Atual']:,.0f}")
-                    col_medio.metric("Preço Médio", f"R$ {row['Preço Médio']:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."))
-                    col_atual.metric("Preço Atual", f"R$ {row['Preço Atual']:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."))                
-                    col_lucro.metric("Lucro/Prejuízo", 
-                            f"R$ {row['Lucro/Prejuízo']:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."),
-                            f"{row['Lucro/Prejuízo']/row['Total Investido']:.2%}" if row['Total Investido'] > 0 else "0%")
+        exibir_status_por_ativo(df_resumo, key='acoes')
+
+    with abas_resumo[3]:
+        exibir_evolucao_patrimonio(df, key='evolucao_patrimonio_acoes')
+
+    with abas_resumo[4]:
+        exibir_proventos(df, key='acoes')
 
     with abas_resumo[2]:
         tickers = ["Selecione"] + sorted(df["Ticker"].unique().tolist())
@@ -344,22 +275,10 @@ def mostrar_resumo_investimentos(df: pd.DataFrame):
 
 
         if ticker != "Selecione":
-            ticker_yf = ticker + ".SA"
-            dados = yf.download(ticker_yf, period="6mo", interval="1d", group_by="ticker", threads=False)
-
-            # Garantir que os dados estão em colunas simples
-            if isinstance(dados.columns, pd.MultiIndex):
-                # Extrai a coluna corretamente se MultiIndex
-                dados.columns = dados.columns.get_level_values(1)
-
-            # Tentativa alternativa sem o .SA, se vazio
-            if dados.empty:
-                dados = yf.download(ticker, period="6mo", interval="1d", group_by="ticker", threads=False)
-                if isinstance(dados.columns, pd.MultiIndex):
-                    dados.columns = dados.columns.get_level_values(1)
+            dados = obter_historico_ticker(ticker, pd.Timestamp.today() - pd.DateOffset(months=6))
 
             if dados.empty or "Close" not in dados.columns:
-                st.warning(f"Nenhum dado encontrado para {ticker_yf} ou {ticker}.")
+                st.warning(f"Nenhum dado encontrado para {ticker}.")
                 return
             
             dados.index = pd.to_datetime(dados.index)
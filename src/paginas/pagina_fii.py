@@ -4,6 +4,8 @@ import os
 
 
 
+from avaliacao import PESOS_PADRAO
+
 from .fii.analise_fundamentalista import analise_fundamentalista_avancada
 from .fii.analise_setorial import analise_setorial
 from .fii.monitoramento_fii import painel_monitoramento, exibir_painel_monitoramento
@@ -14,7 +16,7 @@ df_segmentos_fii = pd.read_csv(os.getenv('PATH_SEGMENTOS_FII_STATUS_INVEST'))
 df_categorias_fii = pd.read_csv(os.getenv('PATH_CATEGORIAS_FII_STATUS_INVEST'))
 
 from .commons import detectar_tema_streamlit, obter_tema_streamlit
-from .commons import calcular_resumo_investimentos
+from .commons import obter_resumo_investimentos, exibir_evolucao_patrimonio, exibir_proventos
 
 
 ####################################################################################################################################
@@ -113,24 +115,20 @@ def sliders_pesos_dinamicos(pesos_iniciais):
 def pagina_fii(df_fii: pd.DataFrame):
     meus_fiis = df_fii['Ticker'].unique() if not df_fii.empty else []
 
-    # Uso exemplo com pesos padrão:
-    pesos_padrao = {
-        'dy': 0.3,               # Forte peso
-        'dy_cagr_3a': 0.2,       # Crescimento real importa
-        'p_vp': 0.15,            # Valuation
-        'vacancia': 0.15,        # Qualidade operacional
-        'liquidez': 0.1,         # Importante para entrar/sair
-        'volatilidade': 0.05,    # Menos importante
-        #'preco_cota': 0.05       # Marginal, se quiser manter
-    }
-
-    pesos_ajustados = sliders_pesos_dinamicos(pesos_padrao)
+    pesos_ajustados = sliders_pesos_dinamicos(PESOS_PADRAO)
     segmento_nome = None
 
-    dados_consolidados = calcular_resumo_investimentos(df_fii)
+    # Calculado uma vez por base de movimentações/janela de cotações; mexer nos sliders não recalcula
+    dados_consolidados = obter_resumo_investimentos(df_fii, 'fii')
 
     with st.expander('Minha Carteira'):
         exibir_resumo_investimentos_fii(dados_consolidados)
+
+    with st.expander('Evolução do Patrimônio'):
+        exibir_evolucao_patrimonio(df_fii, key='evolucao_patrimonio_fii')
+
+    with st.expander('Proventos Recebidos'):
+        exibir_proventos(df_fii, key='fii')
     
     # Gerar painel de monitoramento
     with st.expander('Painel de Monitoramento'):        
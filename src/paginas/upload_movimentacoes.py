@@ -0,0 +1,49 @@
+import pandas as pd
+import streamlit as st
+
+from preprocessamento import preparar_movimentacoes, ErroValidacaoExtrato
+
+
+@st.dialog('Faça o Upload do Extrato da B3')
+def carregar_movimentacoes_streamlit(path_fusoes_desdobramentos: str):
+    """
+    Componente Streamlit para upload de um ou mais extratos. Os extratos são mesclados em uma única
+    base de movimentações, sem duplicar as movimentações presentes em mais de um arquivo.
+    """
+    st.markdown("### 📤 Upload do Arquivo de Movimentações")
+    
+    uploaded_files = st.file_uploader(
+        "Selecione os arquivos Excel com suas movimentações",
+        type=["xlsx", "xls"],
+        accept_multiple_files=True,
+        key="movimentacoes_upload"
+    )
+    
+    if uploaded_files:
+        try:
+            conteudos = [uploaded_file.getvalue() for uploaded_file in uploaded_files]
+            # Os buffers do upload vão direto para o leitor de Excel, sem passar pelo disco
+            df_movimentacoes, df_fusoes_desdobramentos = preparar_movimentacoes(
+                conteudos,
+                path_fusoes_desdobramentos,
+                nomes=[uploaded_file.name for uploaded_file in uploaded_files]
+            )
+
+            # Verifica se o processamento foi bem sucedido
+            if isinstance(df_movimentacoes, pd.DataFrame) and not df_movimentacoes.empty \
+                and isinstance(df_fusoes_desdobramentos, pd.DataFrame) and not df_fusoes_desdobramentos.empty:
+                st.success("Arquivo carregado e processado com sucesso!")                                
+                st.session_state['dados-movimentacoes'] = df_movimentacoes
+                st.session_state['dados-fusoes'] = df_fusoes_desdobramentos
+                st.session_state['upload_concluido'] = True
+                st.rerun()
+                
+            else:
+                st.error("O arquivo foi carregado mas não pôde ser processado.")                
+                
+        except ErroValidacaoExtrato as e:
+            st.error(f"{str(e)}. Corrija as linhas abaixo e envie o arquivo novamente.")
+            st.dataframe(e.erros, use_container_width=True, hide_index=True)
+
+        except Exception as e:
+            st.error(f"Erro ao processar arquivo: {str(e)}")
@@ -1,8 +1,14 @@
 from .carga_b3 import (
     carregar_movimentacoes, 
-    carregar_movimentacoes_streamlit,
+    preparar_movimentacoes,
+    carregar_varias_movimentacoes,
+    mesclar_movimentacoes,
+    calcular_impressao_movimentacoes,
+    compactar_movimentacoes,
+    relatorio_memoria,
     carregar_fusoes_desdobramentos,
     ajustar_movimentacoes_por_eventos,
     filtrar_fii,
     filtrar_acoes
-)
\ No newline at end of file
+)
+from .validacao import ErroValidacaoExtrato, validar_movimentacoes
\ No newline at end of file
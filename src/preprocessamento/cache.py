@@ -0,0 +1,70 @@
+import hashlib
+import os
+import pathlib
+
+import pandas as pd
+
+####################################################################################################################################
+# Cache em Parquet dos extratos já processados, endereçado pelo conteúdo do arquivo
+####################################################################################################################################
+
+# Incrementar sempre que a lógica de carga/ajuste mudar, para invalidar os caches antigos
+VERSAO_PARSER = '5'
+
+
+def obter_dir_cache() -> pathlib.Path:
+    """
+    Pasta onde ficam os Parquet processados: DIR_CACHE, se definido no .env,
+    ou uma subpasta 'cache' dentro de DIR_DADOS.
+    """
+    dir_cache = os.getenv('DIR_CACHE') or os.path.join(os.getenv('DIR_DADOS', 'dados'), 'cache')
+    return pathlib.Path(dir_cache)
+
+
+def calcular_chave_cache(conteudos: bytes | list[bytes], *dependencias: str | None) -> str:
+    """
+    Gera a chave do cache a partir do SHA-256 dos bytes do(s) extrato(s), da versão do parser e do
+    conteúdo dos arquivos auxiliares (ex.: CSV de fusões/desdobramentos) que afetam o resultado.
+    A ordem em que vários extratos são enviados não altera a chave.
+    """
+    if isinstance(conteudos, (bytes, bytearray, memoryview)):
+        conteudos = [conteudos]
+
+    sha = hashlib.sha256()
+    sha.update(VERSAO_PARSER.encode())
+    for digest in sorted(hashlib.sha256(conteudo).digest() for conteudo in conteudos):
+        sha.update(digest)
+
+    for path in dependencias:
+        if path and os.path.exists(path):
+            with open(path, 'rb') as arquivo:
+                sha.update(arquivo.read())
+
+    return sha.hexdigest()
+
+
+def ler_cache(chave: str) -> pd.DataFrame | None:
+    path = obter_dir_cache() / f'{chave}.parquet'
+    if not path.exists():
+        return None
+
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        print(f"Cache inválido em {path}, será recriado: {str(e)}")
+        return None
+
+
+def salvar_cache(chave: str, df: pd.DataFrame) -> None:
+    dir_cache = obter_dir_cache()
+    path = dir_cache / f'{chave}.parquet'
+
+    try:
+        dir_cache.mkdir(parents=True, exist_ok=True)
+
+        # Grava em arquivo temporário e renomeia, para nunca deixar um Parquet pela metade no cache
+        path_tmp = path.with_suffix('.parquet.tmp')
+        df.to_parquet(path_tmp, index=False)
+        os.replace(path_tmp, path)
+    except Exception as e:
+        print(f"Não foi possível salvar o cache {path}: {str(e)}")
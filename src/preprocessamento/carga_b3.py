@@ -1,11 +1,17 @@
 import pandas as pd
+import numpy as np
+import hashlib
+import importlib.util
+import io
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO
 
-import streamlit as st
-import tempfile
+from utils import parse_br_numeric, parse_br_date
 
-from utils import parse_from_string_to_numeric
+from .cache import calcular_chave_cache, ler_cache, salvar_cache
+from .validacao import ErroValidacaoExtrato, validar_movimentacoes
 
 ####################################################################################################################################
 # Funções auxiliares
@@ -67,85 +73,334 @@ def identificar_tipo(row) -> str:
         return 'CDB'
     else:
         return 'Outros'
+
+
+# Versões vetorizadas das regras acima: aplicam exatamente a mesma ordem de prioridade,
+# mas operando sobre colunas inteiras (np.select) em vez de uma chamada Python por linha.
+
+def _contem_algum(serie: pd.Series, termos: list[str]) -> pd.Series:
+    padrao = '|'.join(re.escape(t) for t in termos)
+    return serie.str.contains(padrao, regex=True)
+
+def classificar_ativos_b3(df: pd.DataFrame) -> pd.Series:
+    ticker = df['Ticker'].fillna('').astype(str).str.upper()
+    descricao = df['Descrição'].fillna('').astype(str).str.upper()
+
+    termina_11 = ticker.str.endswith('11')
+    opcao = (
+        (ticker.str.len() >= 5)
+        & ticker.str[-1].str.isdigit().fillna(False).astype(bool)
+        & ticker.str[-2].str.isalpha().fillna(False).astype(bool)
+    )
+
+    condicoes = [
+        termina_11 & _contem_algum(descricao, ['FII', 'FDO INV IMOB', 'FUNDO DE INVESTIMENTO IMOB', 'IMOBILIÁRIO']),
+        termina_11 & _contem_algum(descricao, ['ETF', 'ÍNDICE']),
+        ticker.str.contains(r'(?:34|35|32|39)$', regex=True) | descricao.str.contains('BDR', regex=False),
+        ticker.str.endswith('3'),
+        ticker.str.endswith('4'),
+        termina_11 & _contem_algum(descricao, ['UNIT', 'UNITS']),
+        opcao,
+        _contem_algum(descricao, ['TESOURO', 'LTN', 'NTN', 'LFT']),
+        _contem_algum(descricao, ['DEBENTURE', 'CRI', 'CRA', 'CDB']),
+    ]
+    escolhas = ['FII', 'ETF', 'BDR', 'Ação ON', 'Ação PN', 'Unit', 'Opção', 'Tesouro Direto', 'Renda Fixa Privada']
+
+    condicoes = [c.to_numpy(dtype=bool) for c in condicoes]
+    return pd.Series(np.select(condicoes, escolhas, default='Outro'), index=df.index)
+
+def identificar_tipos(df: pd.DataFrame) -> pd.Series:
+    ticker = df['Ticker'].fillna('').astype(str).str.upper()
+    produto = df['Produto'].fillna('').astype(str).str.upper()
+
+    condicoes = [
+        ticker.str.endswith('11'),
+        ticker.str.contains(r'[3456]$', regex=True),
+        produto.str.contains('CDB', regex=False),
+    ]
+
+    condicoes = [c.to_numpy(dtype=bool) for c in condicoes]
+    return pd.Series(np.select(condicoes, ['FII', 'Ações', 'CDB'], default='Outros'), index=df.index)
     
 ####################################################################################################################################
-# Funções principais
+# Leitura da planilha
 ####################################################################################################################################
 
-@st.dialog('Faça o Upload do Extrato da B3')
-def carregar_movimentacoes_streamlit(path_fusoes_desdobramentos: str):
+# Quantidade de linhas por bloco na leitura em streaming
+TAMANHO_BLOCO_STREAMING = 50_000
+
+# Colunas que identificam uma movimentação ao mesclar extratos sobrepostos
+COLUNAS_IDENTIFICACAO_MOVIMENTACAO = [
+    'Data',
+    'Entrada/Saída',
+    'Movimentação',
+    'Produto',
+    'Quantidade',
+    'Preço unitário',
+    'Instituição',
+]
+
+# Colunas textuais de baixa cardinalidade, guardadas como category na sessão
+COLUNAS_CATEGORICAS = [
+    'Entrada/Saída',
+    'Movimentação',
+    'Produto',
+    'Ticker',
+    'Descrição',
+    'Instituição',
+    'Tipo de Ativo',
+    'Tipo de Investimento',
+]
+
+# Extratos acima desse tamanho são lidos em streaming pelo componente de upload
+LIMIAR_STREAMING_BYTES = 5 * 1024 * 1024
+
+
+def _calamine_disponivel() -> bool:
+    return importlib.util.find_spec('python_calamine') is not None
+
+
+def ler_planilha(planilha: str | os.PathLike | IO[bytes]) -> pd.DataFrame:
     """
-    Componente Streamlit para upload de arquivo que retorna o DataFrame processado
-    ou None se nenhum arquivo for carregado.
+    Lê a planilha inteira como texto. Usa o motor calamine (Rust) quando o pacote
+    python-calamine estiver instalado, e o openpyxl caso contrário.
     """
-    st.markdown("### 📤 Upload do Arquivo de Movimentações")
-    
-    uploaded_file = st.file_uploader(
-        "Selecione o arquivo Excel com suas movimentações",
-        type=["xlsx", "xls"],
-        accept_multiple_files=False,
-        key="movimentacoes_upload"
-    )
-    
-    if uploaded_file is not None:
-        try:
-            # Cria um arquivo temporário
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp:
-                tmp.write(uploaded_file.getbuffer())
-                tmp_path = tmp.name
-            
-            # Usa sua função existente para processar
-            df_movimentacoes = carregar_movimentacoes(tmp_path)
-            df_fusoes_desdobramentos = carregar_fusoes_desdobramentos(path_fusoes_desdobramentos)
-
-            df_movimentacoes = ajustar_movimentacoes_por_eventos(df_mov=df_movimentacoes, df_eventos=df_fusoes_desdobramentos)
-            
-            # Remove o arquivo temporário
-            try:
-                os.unlink(tmp_path)
-            except:
-                pass
-            
-            # Verifica se o processamento foi bem sucedido
-            if isinstance(df_movimentacoes, pd.DataFrame) and not df_movimentacoes.empty \
-                and isinstance(df_fusoes_desdobramentos, pd.DataFrame) and not df_fusoes_desdobramentos.empty:
-                st.success("Arquivo carregado e processado com sucesso!")                                
-                st.session_state['dados-movimentacoes'] = df_movimentacoes
-                st.session_state['dados-fusoes'] = df_fusoes_desdobramentos
-                st.session_state['upload_concluido'] = True
-                st.rerun()
-                
-            else:
-                st.error("O arquivo foi carregado mas não pôde ser processado.")                
-                
-        except Exception as e:
-            st.error(f"Erro ao processar arquivo: {str(e)}")
-
-
-
-def carregar_movimentacoes(path_planilha: str) -> pd.DataFrame:
     import warnings
-    from openpyxl.styles.stylesheet import Stylesheet
 
     # Suprimir o aviso específico
     warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl.styles.stylesheet')
 
-    df = pd.read_excel(path_planilha, dtype=str)
+    engine = 'calamine' if _calamine_disponivel() else 'openpyxl'
+    return pd.read_excel(planilha, dtype=str, engine=engine)
 
-    # Converte a coluna Data para datetime
-    df['Data'] = pd.to_datetime(
-        df['Data'], 
-        format='%d/%m/%Y',  # Formato brasileiro
-        errors='coerce'     # Converte datas inválidas para NaT
-    )
+
+def _celula_para_texto(valor) -> str | None:
+    # Mesma conversão feita por pd.read_excel(dtype=str): floats inteiros viram '100', não '100.0'
+    if valor is None:
+        return None
+    if isinstance(valor, float) and valor.is_integer():
+        return str(int(valor))
+    return str(valor)
+
+
+def ler_planilha_em_blocos(planilha: str | os.PathLike | IO[bytes], tamanho_bloco: int = TAMANHO_BLOCO_STREAMING):
+    """
+    Gera DataFrames (dtype=str) com até `tamanho_bloco` linhas cada, iterando a primeira aba
+    com o openpyxl em modo read_only, sem carregar o modelo completo da planilha na memória.
+    """
+    import warnings
+    from openpyxl import load_workbook
+
+    warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl.styles.stylesheet')
+
+    workbook = load_workbook(planilha, read_only=True, data_only=True)
+    try:
+        aba = workbook.worksheets[0]
+
+        # Os extratos exportados pela B3 trazem a dimensão da aba errada (A1:A1),
+        # o que faria o modo read_only ler só a primeira célula
+        aba.reset_dimensions()
+        linhas = aba.iter_rows(values_only=True)
+
+        cabecalho = next(linhas, None)
+        if cabecalho is None:
+            return
+        colunas = [str(c) if c is not None else f'Unnamed: {i}' for i, c in enumerate(cabecalho)]
+
+        bloco = []
+        for linha in linhas:
+            if all(valor is None for valor in linha):
+                continue
+
+            bloco.append([_celula_para_texto(valor) for valor in linha])
+            if len(bloco) >= tamanho_bloco:
+                yield pd.DataFrame(bloco, columns=colunas, dtype=str)
+                bloco = []
+
+        if bloco:
+            yield pd.DataFrame(bloco, columns=colunas, dtype=str)
+    finally:
+        workbook.close()
+
+####################################################################################################################################
+# Funções principais
+####################################################################################################################################
+
+def preparar_movimentacoes(
+        planilhas: list[str | os.PathLike | bytes | IO[bytes]],
+        path_fusoes_desdobramentos: str,
+        nomes: list[str] | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Pipeline completo de carga: lê e mescla os extratos, aplica os eventos corporativos e compacta a base.
+    O resultado é reaproveitado do cache em Parquet quando os mesmos extratos já foram processados.
+    Retorna (movimentações, fusões/desdobramentos).
+    """
+    if nomes is None:
+        nomes = [str(p) if isinstance(p, (str, os.PathLike)) else f'Arquivo {i}' for i, p in enumerate(planilhas, 1)]
+
+    conteudos = [_ler_bytes(planilha) for planilha in planilhas]
+    df_fusoes_desdobramentos = carregar_fusoes_desdobramentos(path_fusoes_desdobramentos)
+
+    # Reaproveita o resultado já processado se os mesmos arquivos foram enviados antes
+    chave_cache = calcular_chave_cache(conteudos, path_fusoes_desdobramentos)
+    df_movimentacoes = ler_cache(chave_cache)
+
+    if df_movimentacoes is None:
+        df_movimentacoes = carregar_varias_movimentacoes(conteudos, nomes)
+        df_movimentacoes = ajustar_movimentacoes_por_eventos(df_mov=df_movimentacoes, df_eventos=df_fusoes_desdobramentos)
+        df_movimentacoes = compactar_movimentacoes(df_movimentacoes)
+
+        salvar_cache(chave_cache, df_movimentacoes)
+
+    return df_movimentacoes, df_fusoes_desdobramentos
+
+
+def _ler_bytes(planilha: str | os.PathLike | bytes | IO[bytes]) -> bytes:
+    if isinstance(planilha, (bytes, bytearray, memoryview)):
+        return bytes(planilha)
+    if hasattr(planilha, 'read'):
+        return planilha.read()
+    with open(planilha, 'rb') as arquivo:
+        return arquivo.read()
+
+
+def carregar_movimentacoes(
+        planilha: str | os.PathLike | bytes | IO[bytes],
+        streaming: bool = False,
+        tamanho_bloco: int = TAMANHO_BLOCO_STREAMING,
+        validar: bool = True) -> pd.DataFrame:
+    """
+    Lê o extrato de movimentações da B3. Aceita o caminho do arquivo, o conteúdo em bytes
+    ou qualquer objeto file-like (ex.: BytesIO, UploadedFile do Streamlit).
+
+    Com streaming=True a planilha é lida em blocos de `tamanho_bloco` linhas (openpyxl read_only),
+    e cada bloco já é convertido para os tipos finais antes do próximo ser lido, mantendo o pico
+    de memória limitado em extratos muito grandes.
+
+    Com validar=True o extrato é conferido logo após a leitura (validar_movimentacoes) e, se houver
+    problemas, ErroValidacaoExtrato é lançado com a tabela de erros de todas as linhas.
+    """
+    if isinstance(planilha, (bytes, bytearray, memoryview)):
+        planilha = io.BytesIO(planilha)
+
+    if not streaming:
+        df = ler_planilha(planilha)
+        if validar:
+            erros = validar_movimentacoes(df)
+            if not erros.empty:
+                raise ErroValidacaoExtrato(erros)
+        return processar_movimentacoes(df)
+
+    blocos, erros, offset = [], [], 0
+    for bloco in ler_planilha_em_blocos(planilha, tamanho_bloco):
+        if validar:
+            erros_bloco = validar_movimentacoes(bloco, offset_linha=offset)
+            if not erros_bloco.empty:
+                erros.append(erros_bloco)
+        offset += len(bloco)
+
+        # Depois do primeiro erro, os blocos seguintes só são validados, para reportar tudo de uma vez
+        if not erros:
+            blocos.append(processar_movimentacoes(bloco))
+
+    if erros:
+        raise ErroValidacaoExtrato(pd.concat(erros, ignore_index=True))
+
+    return pd.concat(blocos, ignore_index=True) if blocos else pd.DataFrame()
+
+
+def carregar_varias_movimentacoes(
+        planilhas: list[str | os.PathLike | bytes | IO[bytes]],
+        nomes: list[str] | None = None) -> pd.DataFrame:
+    """
+    Lê vários extratos (possivelmente sobrepostos) em paralelo e os mescla com mesclar_movimentacoes.
+    Se algum extrato for inválido, ErroValidacaoExtrato é lançado com os erros de todos eles,
+    identificados na coluna 'Arquivo' pelo nome informado em `nomes` (ou pela posição na lista).
+    """
+    nomes = nomes or [str(p) if isinstance(p, (str, os.PathLike)) else f'Arquivo {i}' for i, p in enumerate(planilhas, 1)]
+
+    def carregar(planilha):
+        tamanho = len(planilha) if isinstance(planilha, (bytes, bytearray, memoryview)) else 0
+        try:
+            return carregar_movimentacoes(planilha, streaming=tamanho > LIMIAR_STREAMING_BYTES), None
+        except ErroValidacaoExtrato as e:
+            return None, e.erros
+
+    with ThreadPoolExecutor(max_workers=min(len(planilhas), os.cpu_count() or 1) or 1) as executor:
+        resultados = list(executor.map(carregar, planilhas))
+
+    erros = [erros.assign(Arquivo=nome) for nome, (_, erros) in zip(nomes, resultados) if erros is not None]
+    if erros:
+        erros = pd.concat(erros, ignore_index=True)
+        raise ErroValidacaoExtrato(erros[['Arquivo'] + [col for col in erros.columns if col != 'Arquivo']])
+
+    return mesclar_movimentacoes([df for df, _ in resultados])
+
+
+def calcular_hash_movimentacoes(df: pd.DataFrame, colunas: list[str] | None = None) -> pd.Series:
+    """
+    Hash estável (uint64) de cada movimentação, calculado sobre `colunas` (padrão:
+    COLUNAS_IDENTIFICACAO_MOVIMENTACAO). O mesmo lançamento exportado em extratos diferentes gera
+    sempre o mesmo hash.
+    """
+    colunas = [col for col in (colunas or COLUNAS_IDENTIFICACAO_MOVIMENTACAO) if col in df.columns]
+    return pd.util.hash_pandas_object(df[colunas], index=False)
+
+
+def calcular_impressao_movimentacoes(df: pd.DataFrame) -> str:
+    """
+    Impressão digital (SHA-256) da base inteira, a partir dos hashes de cada movimentação.
+    Serve de chave de cache para cálculos derivados: muda sempre que alguma movimentação muda.
+    """
+    sha = hashlib.sha256()
+    sha.update(calcular_hash_movimentacoes(df).to_numpy(dtype='uint64').tobytes())
+    return sha.hexdigest()
+
+
+def mesclar_movimentacoes(dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Junta vários extratos em uma única base, removendo as movimentações repetidas entre eles.
+
+    Lançamentos idênticos dentro de um mesmo extrato (ex.: duas compras iguais no mesmo dia) são
+    legítimos, então a deduplicação é feita por (hash, n-ésima ocorrência no extrato): cada
+    movimentação aparece na base final tantas vezes quanto no extrato em que mais aparece.
+    """
+    dfs = [df for df in dfs if df is not None and not df.empty]
+    if not dfs:
+        return pd.DataFrame()
+
+    marcados = []
+    for df in dfs:
+        df = df.copy()
+        df['_hash'] = calcular_hash_movimentacoes(df)
+        df['_ocorrencia'] = df.groupby('_hash').cumcount()
+        marcados.append(df)
+
+    df = pd.concat(marcados, ignore_index=True)
+    df = df.drop_duplicates(subset=['_hash', '_ocorrencia'], keep='first')
+    df = df.drop(columns=['_hash', '_ocorrencia'])
+
+    if 'Data' in df.columns:
+        df = df.sort_values('Data', ascending=False, kind='stable')
+
+    return df.reset_index(drop=True)
+
+
+def processar_movimentacoes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converte o extrato lido como texto (dtype=str) para os tipos usados pela aplicação
+    e acrescenta as colunas de classificação.
+    """
+    # Converte a coluna Data para datetime (formato brasileiro; datas inválidas viram NaT)
+    df['Data'] = parse_br_date(df['Data'])
 
 
     
     # Se existir a coluna 'Produto', divide em 'Ticker' e 'Descrição'
     if 'Produto' in df.columns:
-        df[['Ticker', 'Descrição']] = df['Produto'].str.split(' - ', n=1, expand=True)
-        df['Ticker'] = df['Ticker'].str.strip()
-        df['Descrição'] = df['Descrição'].str.strip()
+        partes = df['Produto'].str.split(' - ', n=1)
+        df['Ticker'] = partes.str[0].str.strip()
+        df['Descrição'] = partes.str[1].str.strip()
         posicao_produto = df.columns.get_loc('Produto')
         #df.drop('Produto', axis=1, inplace=True)
         df.insert(posicao_produto + 1, 'Ticker', df.pop('Ticker'))
@@ -153,7 +408,7 @@ def carregar_movimentacoes(path_planilha: str) -> pd.DataFrame:
 
     colunas_necessarias = ['Ticker', 'Descrição']
     if all(col in df.columns for col in colunas_necessarias):
-        df['Tipo de Ativo'] = df.apply(classificar_ativo_b3, axis=1)
+        df['Tipo de Ativo'] = classificar_ativos_b3(df)
 
     # Padroniza 'Entrada/Saída' para capitalizar e tirar espaços
     df['Entrada/Saída'] = df['Entrada/Saída'].str.strip().str.capitalize()
@@ -174,16 +429,53 @@ def carregar_movimentacoes(path_planilha: str) -> pd.DataFrame:
     colunas_monetarias = ['Valor da Operação', 'Preço unitário','Quantidade']
     if all(col in df.columns for col in colunas_monetarias):
         for col in colunas_monetarias:
-            df[col] = df[col].apply(parse_from_string_to_numeric)
+            df[col] = parse_br_numeric(df[col], padrao=0.0)
             
     
     # classificando por Tipo de Investimento
-    df['Tipo de Investimento'] = df.apply(identificar_tipo, axis=1)
-    # df['Tipo de Investimento'] = df['Produto'].apply(identificar_tipo)
+    df['Tipo de Investimento'] = identificar_tipos(df)
+
+    return df
+
+
+
+def compactar_movimentacoes(df: pd.DataFrame, arrow_strings: bool = True) -> pd.DataFrame:
+    """
+    Converte a base de movimentações para uma representação compacta, para guardar na sessão:
+    colunas textuais de baixa cardinalidade como category, flags como bool e valores como float64.
+    As demais colunas textuais viram strings Arrow (string[pyarrow]) quando o pyarrow está disponível.
+    """
+    df = df.copy()
+
+    for col in COLUNAS_CATEGORICAS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+
+    for col in ['Quantidade', 'Preço unitário', 'Valor da Operação']:
+        if col in df.columns:
+            df[col] = df[col].astype('float64')
+
+    if 'Compra/Venda' in df.columns:
+        df['Compra/Venda'] = df['Compra/Venda'].fillna(False).astype(bool)
+
+    if arrow_strings and importlib.util.find_spec('pyarrow') is not None:
+        for col in df.columns:
+            dtype = df[col].dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                continue
+            if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+                df[col] = df[col].astype('string[pyarrow]')
 
     return df
 
 
+def relatorio_memoria(df: pd.DataFrame) -> str:
+    """Resumo do uso de memória (deep) por coluna, para o log de depuração."""
+    uso = df.memory_usage(deep=True, index=False)
+    linhas = [f'{col:<25} {str(df[col].dtype):<20} {bytes_col / 1024:>10,.1f} KiB' for col, bytes_col in uso.items()]
+    linhas.append(f'{"Total":<25} {"":<20} {uso.sum() / 1024:>10,.1f} KiB')
+    return '\n'.join(linhas)
+
 
 def carregar_fusoes_desdobramentos(path_csv: str) -> pd.DataFrame:
     df = pd.read_csv(path_csv)
@@ -197,37 +489,120 @@ def carregar_fusoes_desdobramentos(path_csv: str) -> pd.DataFrame:
     return df
 
 
-def ajustar_movimentacoes_por_eventos(df_mov: pd.DataFrame, df_eventos: pd.DataFrame) -> pd.DataFrame:
-    df_mov = df_mov.copy()
-    df_eventos = df_eventos.copy()
+def _parse_fatores(fatores: pd.Series) -> pd.Series:
+    # 'a:b' → b/a (quantidade nova por unidade antiga); valores inválidos viram 1.0
+    partes = fatores.astype(str).str.split(':', n=1, expand=True).reindex(columns=[0, 1])
+    a = pd.to_numeric(partes[0], errors='coerce')
+    b = pd.to_numeric(partes[1], errors='coerce')
+    return (b / a).replace([np.inf, -np.inf], np.nan).fillna(1.0)
 
-    df_eventos['data_vigencia'] = pd.to_datetime(df_eventos['data_vigencia'], errors='coerce')
 
-    def parse_fator(fator_str):
-        try:
-            a, b = map(float, fator_str.split(':'))
-            return b / a
-        except:
-            return 1.0
+def calcular_fatores_eventos(df_eventos: pd.DataFrame) -> pd.DataFrame:
+    """
+    Resolve a tabela de eventos corporativos (fusões, desdobramentos, cisões...) em uma tabela de fatores:
+    para cada evento, o ticker final e o fator acumulado que uma movimentação do ativo antigo, feita antes
+    da data de vigência, deve receber após percorrer toda a cadeia de eventos (A→B→C) em ordem cronológica.
 
-    df_eventos['fator_float'] = df_eventos['fator_conversao'].apply(parse_fator)
+    Retorna as colunas: Ticker, data_vigencia, ticker_final, fator.
+    """
+    colunas = ['Ticker', 'data_vigencia', 'ticker_final', 'fator']
+    if df_eventos is None or df_eventos.empty:
+        return pd.DataFrame(columns=colunas)
+
+    eventos = pd.DataFrame({
+        'antigo': df_eventos['ativo_antigo'].astype(str).str.strip(),
+        'novo': df_eventos['ativo_novo'].astype(str).str.strip(),
+        # Eventos sem data válida valem para todas as movimentações do ativo
+        'data': pd.to_datetime(df_eventos['data_vigencia'], errors='coerce').fillna(pd.Timestamp.max),
+        'fator': _parse_fatores(df_eventos['fator_conversao']),
+    }).sort_values('data', kind='stable').reset_index(drop=True)
+
+    eventos_por_ticker = {ticker: grupo.index.tolist() for ticker, grupo in eventos.groupby('antigo', sort=False)}
+
+    def proximo_evento(i: int, cadeia: set[int]) -> int | None:
+        # Primeiro evento sobre o ativo novo que entra em vigor a partir deste evento
+        for j in eventos_por_ticker.get(eventos.at[i, 'novo'], []):
+            if j not in cadeia and eventos.at[j, 'data'] >= eventos.at[i, 'data']:
+                return j
+        return None
+
+    resolvidos: dict[int, tuple[str, float]] = {}
+
+    def resolver(i: int, cadeia: set[int]) -> tuple[str, float]:
+        if i in resolvidos:
+            return resolvidos[i]
+
+        cadeia = cadeia | {i}
+        j = proximo_evento(i, cadeia)
+        if j is None:
+            resultado = (eventos.at[i, 'novo'], eventos.at[i, 'fator'])
+        else:
+            ticker_final, fator = resolver(j, cadeia)
+            resultado = (ticker_final, eventos.at[i, 'fator'] * fator)
+
+        resolvidos[i] = resultado
+        return resultado
+
+    # Resolve dos eventos mais recentes para os mais antigos, de modo que cada cadeia é percorrida uma única vez
+    for i in reversed(eventos.index):
+        resolver(i, set())
+
+    return pd.DataFrame({
+        'Ticker': eventos['antigo'],
+        'data_vigencia': eventos['data'],
+        'ticker_final': [resolvidos[i][0] for i in eventos.index],
+        'fator': [resolvidos[i][1] for i in eventos.index],
+    }, columns=colunas)
 
-    # Aplicar todos os eventos
-    for _, evento in df_eventos.iterrows():
-        antigo = evento['ativo_antigo']
-        novo = evento['ativo_novo']
-        data = evento['data_vigencia']
-        fator = evento['fator_float']
 
-        # Identifica movimentações com o ativo antigo após a data do evento
-        mask = (df_mov['Ticker'] == antigo)
+def ajustar_movimentacoes_por_eventos(df_mov: pd.DataFrame, df_eventos: pd.DataFrame) -> pd.DataFrame:
+    """
+    Ajusta ticker, quantidade e preço unitário das movimentações feitas antes de cada evento corporativo.
+    Movimentações feitas a partir da data de vigência não são alteradas. O valor da operação é preservado.
 
-        # Aplica transformação: altera ticker e ajusta quantidade
-        df_mov.loc[mask, 'Ticker'] = novo
-        df_mov.loc[mask, 'Quantidade'] = df_mov.loc[mask, 'Quantidade'] * fator
+    Cada movimentação é associada (merge_asof) ao primeiro evento do seu ticker com vigência posterior à sua
+    data, cujo fator acumulado já considera os eventos seguintes da cadeia, então o custo é uma única
+    passada pelas movimentações, independente da quantidade de eventos.
+    """
+    df_mov = df_mov.copy().reset_index(drop=True)
+    fatores = calcular_fatores_eventos(df_eventos)
+
+    if df_mov.empty or fatores.empty or not {'Ticker', 'Data'}.issubset(df_mov.columns):
+        return df_mov
+
+    chaves = pd.DataFrame({
+        '_posicao': np.arange(len(df_mov)),
+        'Ticker': df_mov['Ticker'].astype(object).astype(str),
+        # Movimentações sem data são tratadas como anteriores a todos os eventos
+        'Data': pd.to_datetime(df_mov['Data'], errors='coerce').fillna(pd.Timestamp.min).astype('datetime64[ns]'),
+    }).sort_values('Data', kind='stable')
+
+    fatores['Ticker'] = fatores['Ticker'].astype(object).astype(str)
+    fatores['data_vigencia'] = fatores['data_vigencia'].astype('datetime64[ns]')
+
+    ajustes = pd.merge_asof(
+        chaves,
+        fatores.sort_values('data_vigencia', kind='stable'),
+        left_on='Data',
+        right_on='data_vigencia',
+        by='Ticker',
+        direction='forward',
+        allow_exact_matches=False
+    ).sort_values('_posicao')
+
+    mask = ajustes['fator'].notna().to_numpy()
+    if not mask.any():
+        return df_mov
+
+    fator = ajustes['fator'].to_numpy()[mask]
+    linhas = df_mov.index[mask]
+
+    df_mov.loc[linhas, 'Ticker'] = ajustes['ticker_final'].to_numpy()[mask]
+    if 'Quantidade' in df_mov.columns:
+        df_mov.loc[linhas, 'Quantidade'] = df_mov.loc[linhas, 'Quantidade'].to_numpy() * fator
+    if 'Preço unitário' in df_mov.columns:
+        df_mov.loc[linhas, 'Preço unitário'] = df_mov.loc[linhas, 'Preço unitário'].to_numpy() / fator
 
-    # Opcional: agrupar por ticker, data e tipo de movimentação, somando quantidades e valores
-    df_mov.reset_index(drop=True, inplace=True)
     return df_mov
 
 
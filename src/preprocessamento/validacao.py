@@ -0,0 +1,92 @@
+import pandas as pd
+
+from utils import parse_br_numeric, parse_br_date
+
+####################################################################################################################################
+# Validação do extrato logo após a leitura, antes de qualquer processamento
+####################################################################################################################################
+
+COLUNAS_OBRIGATORIAS = [
+    'Entrada/Saída',
+    'Data',
+    'Movimentação',
+    'Produto',
+    'Quantidade',
+    'Preço unitário',
+    'Valor da Operação',
+]
+
+VALORES_ENTRADA_SAIDA = ['Credito', 'Debito']
+
+# Valores que a B3 usa para "sem valor" nas colunas numéricas (ex.: preço de eventos sem financeiro)
+VALORES_VAZIOS = ['', '-']
+
+COLUNAS_ERROS = ['Linha', 'Coluna', 'Valor', 'Erro']
+
+
+class ErroValidacaoExtrato(ValueError):
+    """
+    Extrato rejeitado na validação. O atributo `erros` traz uma linha por problema encontrado,
+    com a linha da planilha, a coluna, o valor original e a descrição do erro.
+    """
+    def __init__(self, erros: pd.DataFrame):
+        self.erros = erros
+        super().__init__(f'Extrato inválido: {len(erros)} problema(s) encontrado(s)')
+
+
+def _erros(df: pd.DataFrame, mask: pd.Series, coluna: str, erro: str, offset_linha: int) -> pd.DataFrame:
+    if not mask.any():
+        return pd.DataFrame(columns=COLUNAS_ERROS)
+
+    # Linha como aparece no Excel: +1 do cabeçalho e +1 porque a planilha começa em 1
+    posicoes = mask.to_numpy().nonzero()[0]
+    return pd.DataFrame({
+        'Linha': posicoes + offset_linha + 2,
+        'Coluna': coluna,
+        'Valor': df[coluna].to_numpy()[posicoes],
+        'Erro': erro,
+    })
+
+
+def validar_movimentacoes(df: pd.DataFrame, offset_linha: int = 0) -> pd.DataFrame:
+    """
+    Valida o extrato lido como texto (dtype=str), com operações vetorizadas sobre as colunas inteiras.
+    Retorna a tabela de erros (vazia se o extrato for válido). `offset_linha` é a posição da primeira
+    linha de `df` na planilha, usada na leitura em blocos.
+    """
+    faltando = [col for col in COLUNAS_OBRIGATORIAS if col not in df.columns]
+    if faltando:
+        return pd.DataFrame({
+            'Linha': pd.NA,
+            'Coluna': faltando,
+            'Valor': pd.NA,
+            'Erro': 'Coluna obrigatória ausente',
+        }, columns=COLUNAS_ERROS)
+
+    erros = []
+
+    datas = parse_br_date(df['Data'])
+    erros.append(_erros(df, datas.isna(), 'Data', 'Data inválida ou ausente', offset_linha))
+
+    entrada_saida = df['Entrada/Saída'].astype(str).str.strip().str.capitalize()
+    erros.append(_erros(
+        df, ~entrada_saida.isin(VALORES_ENTRADA_SAIDA), 'Entrada/Saída',
+        f'Valor diferente de {VALORES_ENTRADA_SAIDA}', offset_linha
+    ))
+
+    erros.append(_erros(df, df['Produto'].isna(), 'Produto', 'Produto ausente', offset_linha))
+
+    for col in ['Quantidade', 'Preço unitário', 'Valor da Operação']:
+        texto = df[col].astype(object).where(df[col].notna(), '').astype(str).str.strip()
+        numeros = parse_br_numeric(df[col])
+
+        erros.append(_erros(
+            df, numeros.isna() & ~texto.isin(VALORES_VAZIOS), col, 'Valor numérico inválido', offset_linha
+        ))
+        erros.append(_erros(df, numeros < 0, col, 'Valor negativo', offset_linha))
+
+    erros = [e for e in erros if not e.empty]
+    if not erros:
+        return pd.DataFrame(columns=COLUNAS_ERROS)
+
+    return pd.concat(erros, ignore_index=True).sort_values(['Linha', 'Coluna'], kind='stable').reset_index(drop=True)
@@ -0,0 +1,6 @@
+# executar_pipeline é importado só quando usado, para o --help do CLI responder sem carregar pandas/yfinance
+def __getattr__(nome: str):
+    if nome == 'executar_pipeline':
+        from .pipeline import executar_pipeline
+        return executar_pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
\ No newline at end of file
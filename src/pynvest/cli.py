@@ -0,0 +1,71 @@
+import argparse
+import os
+import time
+
+from dotenv import load_dotenv
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m pynvest',
+        description='Processa extratos da B3 sem a interface Streamlit e grava os resultados em Parquet/CSV.'
+    )
+    parser.add_argument(
+        'extratos', nargs='*',
+        help='Planilhas de movimentações da B3 (padrão: PATH_PLANILHA_B3 do .env)'
+    )
+    parser.add_argument(
+        '--fusoes', default=None,
+        help='CSV de fusões/desdobramentos (padrão: PATH_FUSOES_DESDOBRAMENTOS do .env)'
+    )
+    parser.add_argument(
+        '--saida', default=None,
+        help='Pasta onde os artefatos serão gravados (padrão: DIR_ARTEFATOS do .env ou <DIR_DADOS>/artefatos)'
+    )
+    parser.add_argument('--formato', choices=['parquet', 'csv'], default='parquet')
+    parser.add_argument(
+        '--sem-mercado', action='store_true',
+        help='Apenas processa as movimentações, sem cotações nem coleta de dados dos FIIs'
+    )
+    parser.add_argument(
+        '--provedor', choices=['online', 'local'], default=None,
+        help='Fonte dos dados de mercado: online (Yahoo/StatusInvest) ou local, sem rede, com as fixtures '
+             'de DIR_FIXTURES_MERCADO ou dados sintéticos (padrão: PROVEDOR_MERCADO do .env ou online)'
+    )
+    parser.add_argument('--env', default='.env.desenvolvimento', help='Arquivo .env a carregar')
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = criar_parser().parse_args(argv)
+    load_dotenv(args.env)
+
+    extratos = args.extratos or [os.getenv('PATH_PLANILHA_B3')]
+    fusoes = args.fusoes or os.getenv('PATH_FUSOES_DESDOBRAMENTOS')
+    saida = args.saida or os.getenv('DIR_ARTEFATOS') or os.path.join(os.getenv('DIR_DADOS', 'dados'), 'artefatos')
+
+    if not all(extratos) or not fusoes:
+        raise SystemExit('Informe os extratos e o CSV de fusões/desdobramentos (argumentos ou .env)')
+
+    # Importado aqui para que --help responda sem carregar pandas/yfinance
+    from preprocessamento import ErroValidacaoExtrato
+    from mercado import definir_provedor
+    from .pipeline import executar_pipeline
+
+    if args.provedor:
+        definir_provedor(args.provedor)
+
+    inicio = time.perf_counter()
+    try:
+        executar_pipeline(
+            extratos=extratos,
+            path_fusoes_desdobramentos=fusoes,
+            dir_saida=saida,
+            formato=args.formato,
+            coletar_mercado=not args.sem_mercado
+        )
+    except ErroValidacaoExtrato as e:
+        print(e.erros.to_string(index=False))
+        raise SystemExit(str(e))
+
+    print(f'Concluído em {time.perf_counter() - inicio:,.1f}s')
@@ -0,0 +1,135 @@
+import os
+import pathlib
+
+import pandas as pd
+
+from preprocessamento import preparar_movimentacoes, filtrar_fii, filtrar_acoes
+from carteira import calcular_resumo_investimentos, atualizar_livro_posicoes, calcular_vendas_realizadas, calcular_apuracao_ir
+from mercado import obter_dados_fiis
+from avaliacao import PESOS_PADRAO, avaliar_fii
+
+####################################################################################################################################
+# Pipeline sem interface: extrato → posições → dados de mercado → pontuação dos FIIs → artefatos em disco
+####################################################################################################################################
+
+FORMATOS_SAIDA = ['parquet', 'csv']
+
+
+def _salvar(df: pd.DataFrame, dir_saida: pathlib.Path, nome: str, formato: str) -> pathlib.Path:
+    path = dir_saida / f'{nome}.{formato}'
+    if formato == 'parquet':
+        df.to_parquet(path)
+    else:
+        df.to_csv(path)
+    return path
+
+
+def _resumo_para_tabelas(nome: str, resumo: dict[str, any]) -> tuple[pd.DataFrame, dict[str, any]]:
+    totais = {chave: valor for chave, valor in resumo.items() if chave != 'consolidacao'}
+    return resumo['consolidacao'], {'carteira': nome, **totais}
+
+
+def coletar_dados_fiis(tickers: list[str], pesos: dict[str, float]) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Coleta fundamentos e histórico de preços dos FIIs (em paralelo) e calcula a pontuação de cada um.
+    Retorna (fundamentos, histórico de preços, pontuação).
+    """
+    fundamentos, precos, pontuacoes = [], [], []
+
+    def ao_concluir(concluidos, ticker, dados, erro):
+        if erro is not None:
+            print(f'  ({concluidos}/{len(tickers)}) Erro ao coletar dados de {ticker}: {str(erro)}')
+        else:
+            print(f'  ({concluidos}/{len(tickers)}) {ticker}')
+
+    # Coleta em paralelo; os resultados voltam na ordem de tickers
+    for ticker, dados in zip(tickers, obter_dados_fiis(tickers, ao_concluir=ao_concluir)):
+        if dados is None:
+            continue
+
+        if dados.get('fundamentos'):
+            fundamentos.append(dados['fundamentos'])
+
+            resultado = avaliar_fii(ticker, dados['fundamentos'], pesos)
+            if resultado is not None:
+                analise = resultado['Análise Fundamentalista']['Valor']
+                pontuacoes.append({
+                    'Ticker': ticker,
+                    'Preço': analise['Preço Atual (R$)'],
+                    'DY (%)': analise['DY (%)'],
+                    'P/VP': analise['P/VP'],
+                    'Score': analise['Score Qualidade'],
+                    'Pontuação': float(resultado['Pontuação'].replace('%', '')),
+                    'Recomendação': resultado['Recomendação'],
+                })
+
+        if dados.get('mercado') is not None:
+            hist = dados['mercado']['hist_precos'].copy()
+            hist['Ticker'] = ticker
+            precos.append(hist)
+
+    df_fundamentos = pd.DataFrame(fundamentos)
+    df_precos = pd.concat(precos) if precos else pd.DataFrame()
+    df_pontuacao = pd.DataFrame(pontuacoes)
+    if not df_pontuacao.empty:
+        df_pontuacao = df_pontuacao.sort_values('Pontuação', ascending=False)
+
+    return df_fundamentos, df_precos, df_pontuacao
+
+
+def executar_pipeline(
+        extratos: list[str | os.PathLike],
+        path_fusoes_desdobramentos: str,
+        dir_saida: str | os.PathLike,
+        formato: str = 'parquet',
+        coletar_mercado: bool = True,
+        pesos: dict[str, float] | None = None) -> dict[str, pd.DataFrame]:
+    """
+    Executa o mesmo processamento da aplicação Streamlit, sem interface, e grava cada tabela
+    resultante em `dir_saida` no formato escolhido. Retorna as tabelas geradas, por nome.
+    """
+    if formato not in FORMATOS_SAIDA:
+        raise ValueError(f'Formato de saída inválido: {formato}. Use um de {FORMATOS_SAIDA}')
+
+    dir_saida = pathlib.Path(dir_saida)
+    dir_saida.mkdir(parents=True, exist_ok=True)
+    tabelas = {}
+
+    print(f'[1/4] Carregando {len(extratos)} extrato(s)')
+    df_movimentacoes, _ = preparar_movimentacoes(extratos, path_fusoes_desdobramentos)
+    tabelas['movimentacoes'] = df_movimentacoes
+
+    # Lucro realizado e IR mensal só dependem do extrato, então saem mesmo sem coleta de mercado
+    tabelas['vendas_realizadas'] = calcular_vendas_realizadas(df_movimentacoes)
+    tabelas['apuracao_ir'] = calcular_apuracao_ir(tabelas['vendas_realizadas'])
+
+    df_fii = filtrar_fii(df_movimentacoes)
+    df_acoes = filtrar_acoes(df_movimentacoes)
+
+    if coletar_mercado:
+        print('[2/4] Calculando posições')
+        totais = []
+        for nome, df in [('fii', df_fii), ('acoes', df_acoes)]:
+            livro = atualizar_livro_posicoes(df, nome)
+            posicoes, totais_carteira = _resumo_para_tabelas(nome, calcular_resumo_investimentos(df, livro=livro))
+            tabelas[f'posicoes_{nome}'] = posicoes
+            totais.append(totais_carteira)
+        tabelas['totais'] = pd.DataFrame(totais)
+
+        tickers_fii = sorted(df_fii['Ticker'].astype(str).unique()) if not df_fii.empty else []
+        print(f'[3/4] Coletando dados de mercado de {len(tickers_fii)} FII(s)')
+        df_fundamentos, df_precos, df_pontuacao = coletar_dados_fiis(tickers_fii, pesos or PESOS_PADRAO)
+        tabelas['fundamentos_fii'] = df_fundamentos
+        tabelas['precos_fii'] = df_precos
+        tabelas['pontuacao_fii'] = df_pontuacao
+    else:
+        print('[2/4] Coleta de mercado desativada, posições e pontuações não serão geradas')
+
+    print(f'[4/4] Gravando artefatos em {dir_saida}')
+    for nome, df in tabelas.items():
+        if df is None or df.empty:
+            continue
+        path = _salvar(df, dir_saida, nome, formato)
+        print(f'  {path} ({len(df):,} linhas)')
+
+    return tabelas
@@ -1 +1,16 @@
-from .parsing import parse_from_string_to_numeric, parse_currency, parse_percent
\ No newline at end of file
+from .parsing import (
+    parse_from_string_to_numeric,
+    parse_currency,
+    parse_percent,
+    parse_br_numeric,
+    parse_br_date
+)
+from .formatacao import (
+    formatar_moeda_br,
+    formatar_percentual_br,
+    formatar_numero_br,
+    formatar_colunas_br,
+    formatar_moeda,
+    formatar_percentual,
+    formatar_numero
+)
\ No newline at end of file
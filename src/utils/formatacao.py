@@ -0,0 +1,159 @@
+import importlib.util
+
+import numpy as np
+import pandas as pd
+
+####################################################################################################################################
+# Formatação de números no padrão brasileiro ('R$ 1.234,56', '12,34%'), vetorizada sobre colunas inteiras
+####################################################################################################################################
+
+VALOR_AUSENTE = '-'
+
+
+def _formatar_com_format(valores: np.ndarray, casas: int, prefixo: str, sufixo: str) -> list[bytes]:
+    """Formatação valor a valor pelo format do Python (qualquer magnitude), com os separadores trocados."""
+    molde = f'{{:,.{casas}f}}'.format
+    return [
+        (prefixo + molde(valor).replace(',', '_').replace('.', ',').replace('_', '.') + sufixo).encode()
+        for valor in valores.tolist()
+    ]
+
+
+# Acima de 2^53 o float já não representa todo inteiro (e o int64 estoura logo depois): esses valores
+# escalados vão para _formatar_com_format
+LIMITE_INTEIRO = 2.0 ** 53
+
+
+def _tabela_bytes(textos: list[str], largura: int) -> np.ndarray:
+    """Matriz (len(textos) × largura) com os bytes de cada texto, alinhados à direita e completados com \\0."""
+    return np.frombuffer(
+        b''.join(texto.encode('ascii').rjust(largura, b'\0') for texto in textos),
+        dtype='uint8'
+    ).reshape(len(textos), largura)
+
+
+# Cada grupo de milhar ocupa 4 bytes, tratados como um único uint32: '.007' nos grupos do meio e
+# '   7' / '  -7' no grupo mais alto (sem zeros à esquerda, com o sinal colado ao número)
+_GRUPOS_MILHAR = _tabela_bytes([f'.{i:03d}' for i in range(1000)], 4).view('uint32').ravel()
+_GRUPO_TOPO = np.stack([
+    _tabela_bytes([f'{i}' for i in range(1000)], 4),
+    _tabela_bytes([f'-{i}' for i in range(1000)], 4),
+]).view('uint32')[..., 0]
+
+
+def _formatar_numeros_br(valores, casas: int = 2, prefixo: str = '', sufixo: str = '') -> np.ndarray:
+    """
+    Formata um array de números como b'prefixo-1.234,56sufixo' só com operações de array do NumPy:
+    cada grupo de milhar e as casas decimais são buscados em tabelas de bytes pré-montadas, e as
+    linhas são montadas lado a lado em uma matriz de bytes. O arredondamento é feito em inteiros
+    (np.rint); NaN/inf viram VALOR_AUSENTE. Só os valores grandes demais para a conta em inteiros
+    (LIMITE_INTEIRO) são formatados um a um, por _formatar_com_format. Devolve um array de bytes
+    (dtype S), que _como_series converte em texto de uma vez.
+    """
+    valores = np.asarray(valores, dtype='float64').ravel()
+    n = valores.size
+    ausentes = ~np.isfinite(valores)
+
+    escala = 10 ** casas
+    absolutos = np.abs(np.where(ausentes, 0.0, valores)) * escala
+    grandes = absolutos >= LIMITE_INTEIRO
+    escalados = np.rint(np.where(grandes, 0.0, absolutos)).astype('int64')
+    inteiros, fracoes = np.divmod(escalados, escala)
+    negativos = ((valores < 0) & (escalados > 0)).astype('int64')
+
+    # Índice do grupo de milhar mais alto de cada número (0 para < 1.000, 1 para < 1.000.000...)
+    topo = np.zeros(n, dtype='int64')
+    limite = 1000
+    while (inteiros >= limite).any():
+        topo += inteiros >= limite
+        limite *= 1000
+
+    n_grupos = int(topo.max()) + 1 if n else 1
+    grupos = np.zeros((n, n_grupos), dtype='uint32')
+    for j in range(n_grupos):
+        grupo = (inteiros // 1000 ** j) % 1000
+        grupos[:, n_grupos - 1 - j] = np.where(
+            j < topo, _GRUPOS_MILHAR[grupo], np.where(j == topo, _GRUPO_TOPO[negativos, grupo], 0)
+        )
+
+    def constante(texto: str) -> np.ndarray:
+        return np.broadcast_to(np.frombuffer(texto.encode(), dtype='uint8'), (n, len(texto.encode())))
+
+    # Colunas reservadas à esquerda para o prefixo, que é escrito logo antes do primeiro caractere
+    blocos = [np.zeros((n, len(prefixo.encode())), dtype='uint8'), grupos.view('uint8')]
+    if casas > 0:
+        blocos.append(_tabela_bytes([',' + str(i).zfill(casas) for i in range(escala)], casas + 1)[fracoes])
+    if sufixo:
+        blocos.append(constante(sufixo))
+    matriz = np.concatenate(blocos, axis=1)
+
+    # Os números ficam alinhados à direita; linhas com o mesmo comprimento são fatiadas juntas
+    largura = matriz.shape[1]
+    comprimentos = largura - (matriz == 0).argmin(axis=1) + len(prefixo.encode())
+    texto = np.zeros(n, dtype=f'S{largura}')
+    for comprimento in np.unique(comprimentos):
+        linhas = comprimentos == comprimento
+        trecho = matriz[linhas, largura - comprimento:]
+        if prefixo:
+            trecho[:, :len(prefixo.encode())] = constante(prefixo)[:len(trecho)]
+        texto[linhas] = np.ascontiguousarray(trecho).view(f'S{comprimento}').ravel()
+
+    texto[ausentes] = VALOR_AUSENTE.encode()
+    if grandes.any():
+        fora_do_limite = _formatar_com_format(valores[grandes], casas, prefixo, sufixo)
+        texto = texto.astype(f'S{max(largura, max(map(len, fora_do_limite)))}')
+        texto[grandes] = fora_do_limite
+    return texto
+
+
+def _como_series(texto: np.ndarray, serie) -> pd.Series:
+    """Series de texto a partir do array de bytes, convertida pelo Arrow sem passar célula a célula pelo Python."""
+    if importlib.util.find_spec('pyarrow') is not None:
+        import pyarrow as pa
+
+        texto = pd.array(pa.array(texto).cast(pa.string()), dtype=pd.StringDtype('pyarrow', na_value=np.nan))
+    else:
+        texto = texto.astype(str)
+
+    if isinstance(serie, pd.Series):
+        return pd.Series(texto, index=serie.index, name=serie.name)
+    return pd.Series(texto)
+
+
+def formatar_moeda_br(serie: pd.Series, casas: int = 2) -> pd.Series:
+    """Converte uma coluna numérica inteira em texto monetário: 1234.5 → 'R$ 1.234,50'."""
+    return _como_series(_formatar_numeros_br(serie, casas, prefixo='R$ '), serie)
+
+
+def formatar_percentual_br(serie: pd.Series, casas: int = 2) -> pd.Series:
+    """Converte uma coluna de frações em percentual: 0.1234 → '12,34%'."""
+    return _como_series(_formatar_numeros_br(np.asarray(serie, dtype='float64') * 100, casas, sufixo='%'), serie)
+
+
+def formatar_numero_br(serie: pd.Series, casas: int = 0) -> pd.Series:
+    """Converte uma coluna numérica em texto com separador de milhar: 12345 → '12.345'."""
+    return _como_series(_formatar_numeros_br(serie, casas), serie)
+
+
+def formatar_colunas_br(df: pd.DataFrame, moeda: list[str] = (), percentual: list[str] = (), numero: list[str] = ()) -> pd.DataFrame:
+    """Cópia de `df` com as colunas indicadas convertidas para texto no padrão brasileiro."""
+    df = df.copy()
+    for formatar, colunas in [(formatar_moeda_br, moeda), (formatar_percentual_br, percentual), (formatar_numero_br, numero)]:
+        for col in colunas:
+            if col in df.columns:
+                df[col] = formatar(df[col])
+    return df
+
+
+# Versões para um único valor (st.metric, anotações de gráficos), com a mesma regra das colunas
+
+def formatar_moeda(valor: float, casas: int = 2) -> str:
+    return _formatar_numeros_br([valor], casas, prefixo='R$ ')[0].decode()
+
+
+def formatar_percentual(valor: float, casas: int = 2) -> str:
+    return _formatar_numeros_br([valor * 100], casas, sufixo='%')[0].decode()
+
+
+def formatar_numero(valor: float, casas: int = 0) -> str:
+    return _formatar_numeros_br([valor], casas)[0].decode()
@@ -1,4 +1,5 @@
 import re
+import numpy as np
 import pandas as pd
 
 def parse_from_string_to_numeric(valor_str):
@@ -48,3 +49,62 @@ def parse_currency(value):
         except:
             return 0.0
     return float(value)
+
+
+####################################################################################################################################
+# Versões vetorizadas (operam sobre uma coluna inteira de uma vez)
+####################################################################################################################################
+
+def parse_br_numeric(serie: pd.Series, padrao: float = np.nan) -> pd.Series:
+    """
+    Versão vetorizada de parse_from_string_to_numeric para uma coluna inteira.
+    Remove 'R$', '%', espaços (inclusive NBSP) e separadores de milhar usando operações Series.str,
+    retornando uma Series float64. Células vazias, '-' ou não numéricas viram `padrao` (NaN por padrão).
+    """
+    if not isinstance(serie, pd.Series):
+        serie = pd.Series(serie)
+
+    if pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie):
+        numeros = serie.astype('float64')
+    else:
+        texto = serie.astype(object).where(serie.notna(), 'nan')
+
+        # Caminho rápido: coluna inteira já no formato '1234.56' (caso comum das planilhas da B3),
+        # convertida de uma vez pelo NumPy
+        try:
+            numeros = pd.Series(texto.to_numpy(dtype=object).astype('float64'), index=serie.index)
+            pendentes = pd.Series(False, index=serie.index)
+        except (ValueError, TypeError):
+            texto = texto.astype(str)
+            numeros = pd.to_numeric(texto, errors='coerce').astype('float64')
+            pendentes = numeros.isna() & (texto != 'nan')
+
+        if pendentes.any():
+            restantes = texto[pendentes].str.replace(r'R\$|%|\s|\xa0', '', regex=True)
+
+            # Se tiver vírgula, ela é o separador decimal → remove os pontos de milhar
+            tem_virgula = restantes.str.contains(',', regex=False)
+            restantes = restantes.mask(
+                tem_virgula,
+                restantes.str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+            )
+            numeros[pendentes] = pd.to_numeric(restantes, errors='coerce').astype('float64')
+
+    if not pd.isna(padrao):
+        numeros = numeros.fillna(padrao)
+
+    return numeros
+
+def parse_br_date(serie: pd.Series) -> pd.Series:
+    """
+    Converte uma coluna de datas no formato brasileiro ('31/12/2024') para datetime64.
+    Células que o Excel guardou como data (lidas como '2024-12-31 00:00:00') também são aceitas;
+    valores inválidos viram NaT.
+    """
+    datas = pd.to_datetime(serie, format='%d/%m/%Y', errors='coerce')
+
+    pendentes = datas.isna() & serie.notna()
+    if pendentes.any():
+        datas[pendentes] = pd.to_datetime(serie[pendentes], format='ISO8601', errors='coerce')
+
+    return datas